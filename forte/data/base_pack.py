@@ -15,14 +15,16 @@
 import copy
 from abc import abstractmethod
 from typing import List, Optional, Set, Type, TypeVar, Union, Iterator, Dict, \
-    Tuple, Any
+    Tuple, Any, AbstractSet, Iterable
 
 import jsonpickle
 
 from forte.common import ProcessExecutionException, EntryNotFoundError
-from forte.data.container import EntryContainer
+from forte.data.binary_format import serialize_binary, LazyEntries
+from forte.data.container import EntryContainer, EntryIdManager
 from forte.data.index import BaseIndex
-from forte.data.ontology.core import (Entry, EntryType, GroupType, LinkType)
+from forte.data.ontology.core import (
+    Entry, EntryType, GroupType, LinkType, BaseLink, BaseGroup)
 
 __all__ = [
     "BasePack",
@@ -99,13 +101,20 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         self._pack_manager.set_pack_id(self)
         self.__control_component: Optional[str] = None
         self._pending_entries: Dict[int, Tuple[Entry, Optional[str]]] = {}
+        # The entries that are not decoded yet, when the pack is deserialized
+        # lazily.
+        self._lazy_entries: Optional[LazyEntries] = None
 
     def __getstate__(self):
+        # All the entries need to be loaded before serialization.
+        self._load_lazy_entries()
+
         state = super().__getstate__()
         state.pop('index')
         state.pop('_pending_entries')
         state.pop('_BasePack__control_component')
         state.pop('_pack_manager')
+        state.pop('_lazy_entries', None)
 
         return state
 
@@ -113,6 +122,27 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         super().__setstate__(state)
         self.__dict__['_pending_entries'] = {}
         self.__control_component: Optional[str] = None
+        self._lazy_entries = None
+
+    def _load_lazy_entries(self, entry_type: Optional[Type[Entry]] = None):
+        r"""Decode and index the entries of ``entry_type`` (or all the entries
+        if it is `None`) that are not loaded yet, if this pack is deserialized
+        lazily.
+        """
+        if not self._lazy_entries:
+            return
+
+        for list_name, entries in self._lazy_entries.pop(entry_type):
+            getattr(self, list_name).update(entries)
+            self.index.update_basic_index(entries)
+            for entry in entries:
+                entry.set_pack(self)
+            # The entries in the `links` and `groups` lists are the links and
+            # groups of the pack.
+            if self.index.link_index_on and list_name == 'links':
+                self.index.update_link_index(entries)  # type: ignore
+            if self.index.group_index_on and list_name == 'groups':
+                self.index.update_group_index(entries)  # type: ignore
 
     @abstractmethod
     def _init_meta(self, pack_name: Optional[str] = None) -> BaseMeta:
@@ -221,15 +251,76 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         self._pending_entries.clear()
 
     def serialize(self, drop_record: Optional[bool] = False) -> str:
-        r"""Serializes a pack to a string."""
+        r"""Serializes a pack to a JSON string with ``jsonpickle``.
+
+        Args:
+            drop_record (bool): Whether to drop the creation and field
+                records in the serialization.
+
+        Returns:
+            The serialized string, which can be recovered by
+            :func:`~forte.data.data_utils.deserialize`.
+        """
+        self._drop_records(drop_record)
+        return jsonpickle.encode(self, unpicklable=True)
+
+    def serialize_binary(self, drop_record: Optional[bool] = False) -> bytes:
+        r"""Serializes a pack to the compact columnar bytes defined in
+        :mod:`forte.data.binary_format`, which is smaller and faster to
+        encode and decode than :meth:`serialize`.
+
+        Args:
+            drop_record (bool): Whether to drop the creation and field
+                records in the serialization.
+
+        Returns:
+            The serialized bytes, which can be recovered by
+            :func:`~forte.data.data_utils.deserialize`.
+        """
+        self._drop_records(drop_record)
+        return serialize_binary(self)
+
+    def _drop_records(self, drop_record: Optional[bool]):
         if drop_record:
             self.creation_records.clear()
             self.field_records.clear()
 
-        return jsonpickle.encode(self, unpicklable=True)
-
     def view(self):
-        return copy.deepcopy(self)
+        r"""Return a copy of this pack. The changes made to the copy do not
+        affect this pack and vice versa, the same as a deep copy, but the
+        text and the immutable field values of the entries (such as strings,
+        numbers and spans) are shared instead of copied, and the copy shares
+        the pack manager of this pack.
+
+        Returns:
+            A copy of this pack.
+        """
+        # All the entries need to be loaded before copying.
+        self._load_lazy_entries()
+
+        pack = self.__class__.__new__(self.__class__)
+        pack.__dict__.update(self.__dict__)
+        self._init_view(pack)
+        return pack
+
+    def _init_view(self, pack: "BasePack"):
+        r"""Initialize ``pack``, which is a shallow copy of this pack, so that
+        it does not share any mutable states with this pack. The subclasses
+        should copy their entries and indexes here.
+        """
+        # pylint: disable=protected-access
+        pack.creation_records = {
+            c: set(ids) for c, ids in self.creation_records.items()}
+        pack.field_records = {
+            c: set(fields) for c, fields in self.field_records.items()}
+        pack._id_manager = EntryIdManager(
+            self._id_manager.current_id_counter())
+        pack.meta = copy.deepcopy(self.meta)
+
+        # The same as deserialization, these are not kept in the copy.
+        pack._pending_entries = {}
+        pack.__control_component = None
+        pack._lazy_entries = None
 
     def set_control_component(self, component: str):
         """
@@ -276,6 +367,23 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             except KeyError:
                 self.field_records[c] = {(entry_id, field_name)}
 
+    def _record_entries(self, tids: Iterable[int], field_names: List[str],
+                        component_name: Optional[str] = None):
+        r"""Record the creation of the entries of ``tids``, and the
+        modification of their fields in ``field_names``, the same as calling
+        :meth:`record_entry` and :meth:`record_field` for each of them.
+        """
+        c = component_name
+        if c is None:
+            c = self.__control_component
+        if c is not None:
+            self.creation_records.setdefault(c, set()).update(tids)
+
+        c = self.__control_component
+        if c is not None and field_names:
+            self.field_records.setdefault(c, set()).update(
+                (tid, name) for tid in tids for name in field_names)
+
     def on_entry_creation(self, entry: Entry,
                           component_name: Optional[str] = None):
         """
@@ -299,6 +407,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
 
         # Record that this entry hasn't been added to the index yet.
         self._pending_entries[entry.tid] = entry, c
+        self._pack_manager.on_entry_creation()
 
     def regret_creation(self, entry: EntryType):
         """
@@ -315,6 +424,11 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
     def get_entry(self, tid: int) -> EntryType:
         r"""Look up the entry_index with key ``ptr``. Specific implementation
         depends on the actual class."""
+        if self._lazy_entries:
+            # Load the entry type of this tid if it is not loaded yet.
+            entry_type = self._lazy_entries.type_of(tid)
+            if entry_type is not None:
+                self._load_lazy_entries(entry_type)
         entry: EntryType = self.index.get_entry(tid)
         if entry is None:
             raise KeyError(
@@ -375,21 +489,20 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             valid_component_id |= self.get_ids_by_component(component)
         return valid_component_id
 
-    def get_ids_by_type(self, entry_type: Type[EntryType]) -> Set[int]:
+    def get_ids_by_type(self, entry_type: Type[EntryType]) -> AbstractSet[int]:
         r"""Look up the type_index with key ``entry_type``.
 
         Args:
             entry_type: The type of the entry you are looking for.
 
         Returns:
-             A set of entry tids. The entries are instances of entry_type (
-             and also includes instances of the subclasses of entry_type).
+             A read-only set of entry tids. The entries are instances of
+             entry_type (and also includes instances of the subclasses of
+             entry_type). The set is a view of the index, so it will change
+             when entries are added or removed.
         """
-        subclass_index: Set[int] = set()
-        for index_key, index_val in self.index.iter_type_index():
-            if issubclass(index_key, entry_type):
-                subclass_index.update(index_val)
-        return subclass_index
+        self._load_lazy_entries(entry_type)
+        return self.index.query_by_type_subtype(entry_type)
 
     def get_entries_by_type(
             self, entry_type: Type[EntryType]) -> List[EntryType]:
@@ -438,6 +551,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             raise TypeError("Can only get group via entry id (int) or the "
                             "group object itself (Entry).")
 
+        self._load_lazy_entries(BaseLink)
         if not self.index.link_index_on:
             self.index.build_link_index(self.links)
 
@@ -469,6 +583,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             raise TypeError("Can only get group via entry id (int) or the "
                             "group object itself (Entry).")
 
+        self._load_lazy_entries(BaseGroup)
         if not self.index.group_index_on:
             self.index.build_group_index(self.groups)
 
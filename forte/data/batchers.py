@@ -14,6 +14,7 @@
 
 # pylint: disable=attribute-defined-outside-init
 
+import time
 from abc import abstractmethod
 from typing import (
     Dict, List, Iterable, Union, Optional, Tuple, Type, Generic, Iterator, Any)
@@ -23,14 +24,16 @@ from forte.data.base_pack import PackType
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.types import DataRequest
-from forte.data.data_utils_io import merge_batches, batch_instances
+from forte.data.data_utils_io import BatchBuilder, batch_instances
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.core import Entry
 
 __all__ = [
     "ProcessingBatcher",
     "FixedSizeDataPackBatcher",
+    "TokenBudgetDataPackBatcher",
     "FixedSizeMultiPackProcessingBatcher",
+    "WholePackBatcher",
 ]
 
 
@@ -50,6 +53,7 @@ class ProcessingBatcher(Generic[PackType]):
         self.current_batch: Dict = {}
         self.data_pack_pool: List[PackType] = []
         self.current_batch_sources: List[int] = []
+        self._builder: BatchBuilder = BatchBuilder()
 
         self.cross_pack: bool = cross_pack
 
@@ -61,7 +65,8 @@ class ProcessingBatcher(Generic[PackType]):
         Returns:
 
         """
-        self.current_batch.clear()
+        self._builder.build()
+        self.current_batch = {}
         self.data_pack_pool.clear()
         self.current_batch_sources.clear()
 
@@ -84,7 +89,7 @@ class ProcessingBatcher(Generic[PackType]):
 
         """
         if self.current_batch:
-            yield self.current_batch
+            yield self._builder.build()
             self.current_batch = {}
             self.current_batch_sources = []
 
@@ -97,8 +102,10 @@ class ProcessingBatcher(Generic[PackType]):
 
         for (data_batch, instance_num) in self._get_data_batch(
                 input_pack, context_type, requests):
-            self.current_batch = merge_batches(
-                [self.current_batch, data_batch])
+            # Append to the current batch in place, the number of instances
+            # from each pack is kept in ``current_batch_sources``.
+            self._builder.add_batch(data_batch, instance_num)
+            self.current_batch = self._builder.batch
             self.current_batch_sources.append(instance_num)
 
             # Yield a batch on two conditions.
@@ -107,7 +114,7 @@ class ProcessingBatcher(Generic[PackType]):
             # 2. We should also yield when the batcher condition is met:
             # i.e. ``_should_yield()`` is True.
             if not self.cross_pack or self._should_yield():
-                yield self.current_batch
+                yield self._builder.build()
                 self.current_batch = {}
                 self.current_batch_sources = []
 
@@ -156,11 +163,12 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
             the number of instances in the batch.
         """
         instances: List[Dict] = []
-        current_size = sum(self.current_batch_sources)
 
         for data in data_pack.get_data(context_type, requests, offset):
             instances.append(data)
-            if len(instances) == self.batch_size - current_size:
+            # The current batch is emptied after it is yielded, so its size
+            # is checked for every instance.
+            if len(instances) == self.batch_size - len(self._builder):
                 batch = batch_instances(instances)
                 self.batch_is_full = True
                 yield (batch, len(instances))
@@ -179,6 +187,173 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
         }
 
 
+class TokenBudgetDataPackBatcher(ProcessingBatcher[DataPack]):
+    r"""A batcher that limits the total size of the instances in each batch,
+    instead of the number of instances, so that a few long instances do not
+    make the whole batch padded to their length.
+
+    The size of an instance is the number of its entries of ``length_type``
+    (e.g., `"Token"`), or the number of characters in the context if
+    ``length_type`` is `None`. The cost of a batch is the padded area (the
+    number of instances times the longest size) if ``padded`` is `True`, or
+    the total size otherwise. A batch is closed before its cost exceeds
+    ``budget``, or when it has ``max_batch_size`` instances. An instance
+    exceeding the budget by itself forms a batch alone.
+
+    If ``lookahead`` is larger than 1, the instances of up to ``lookahead``
+    packs are collected and sorted by their sizes before batching, so that
+    instances of similar sizes are batched together. The packs wait until all
+    the instances in the window are processed, and the instances of each pack
+    in a batch are kept in their original order.
+    """
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.budget: int = config.budget
+        self.length_type: Optional[str] = config.length_type
+        self.padded: bool = config.padded
+        self.max_batch_size: Optional[int] = config.max_batch_size
+        self.lookahead: int = config.lookahead
+
+        # The packs that are not finished yet, and their instances that are
+        # not batched yet, as tuples of (pack index, instance, size).
+        self._packs: List[DataPack] = []
+        self._instances: List[Tuple[int, Dict, int]] = []
+
+    def _should_yield(self) -> bool:
+        r"""Whether the instances that are not batched yet can fill a batch,
+        otherwise there is no need to split them."""
+        return self._cost(
+            [size for _, _, size in self._instances]) >= self.budget or (
+                self.max_batch_size is not None
+                and len(self._instances) >= self.max_batch_size)
+
+    def _size(self, instance: Dict) -> int:
+        if self.length_type is None:
+            return len(instance["context"])
+        return len(instance[self.length_type]["tid"])
+
+    def _cost(self, sizes: List[int]) -> int:
+        if not sizes:
+            return 0
+        if self.padded:
+            return max(sizes) * len(sizes)
+        return sum(sizes)
+
+    def _split(self, instances: List[Tuple[int, int, Dict, int]]
+               ) -> List[List[Tuple[int, int, Dict, int]]]:
+        r"""Greedily split ``instances`` into batches within the budget, the
+        instances are tuples of (pack index, original index, instance,
+        size)."""
+        batches: List[List[Tuple[int, int, Dict, int]]] = []
+        batch: List[Tuple[int, int, Dict, int]] = []
+        max_size = total_size = 0
+        for instance in instances:
+            size = instance[3]
+            new_max, new_total = max(max_size, size), total_size + size
+            cost = new_max * (len(batch) + 1) if self.padded else new_total
+            if batch and (cost > self.budget or (
+                    self.max_batch_size is not None
+                    and len(batch) >= self.max_batch_size)):
+                batches.append(batch)
+                batch, new_max, new_total = [], size, size
+            batch.append(instance)
+            max_size, total_size = new_max, new_total
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _sync_pool(self):
+        r"""Set :attr:`data_pack_pool` to the unfinished packs, and
+        :attr:`current_batch_sources` to the number of their instances that
+        are not batched yet, which is what the batch processor expects when
+        the batcher is not yielding."""
+        self.data_pack_pool = list(self._packs)
+        self.current_batch_sources = [0] * len(self._packs)
+        for pack_index, _, _ in self._instances:
+            self.current_batch_sources[pack_index] += 1
+        self.current_batch = {}
+
+    def _yield_batches(self, finish: bool) -> Iterator[Dict]:
+        r"""Yield the batches of the collected instances. If ``finish`` is
+        `False`, the last batch is kept if it is not full, so it can be
+        filled by the next pack."""
+        # Keep the original index of each instance, so the instances in a
+        # batch can be put back in their original order.
+        instances = [(pack_index, index, instance, size) for
+                     index, (pack_index, instance, size) in
+                     enumerate(self._instances)]
+        if self.lookahead > 1:
+            instances.sort(key=lambda x: x[3])
+
+        batches = (self._split(instances) if finish or self._should_yield()
+                   else [instances])
+        if not finish and batches and self._cost(
+                [size for _, _, _, size in batches[-1]]) < self.budget and (
+                self.max_batch_size is None
+                or len(batches[-1]) < self.max_batch_size):
+            self._instances = [(pack_index, instance, size) for
+                               pack_index, _, instance, size in batches.pop()]
+        else:
+            self._instances = []
+
+        for batch in batches:
+            # Group the instances by their packs, so the results can be
+            # sliced back to the packs in :meth:`pack_all`.
+            batch.sort(key=lambda x: (x[0], x[1]))
+            packs = sorted({pack_index for pack_index, _, _, _ in batch})
+            self.data_pack_pool = [self._packs[i] for i in packs]
+            self.current_batch_sources = [
+                sum(1 for pack_index, _, _, _ in batch if pack_index == i)
+                for i in packs]
+            self.current_batch = batch_instances(
+                [instance for _, _, instance, _ in batch])
+            yield self.current_batch
+
+        # The packs before the first pack with remaining instances are
+        # finished.
+        if self._instances:
+            first = min(pack_index for pack_index, _, _ in self._instances)
+            self._packs = self._packs[first:]
+            self._instances = [(pack_index - first, instance, size) for
+                               pack_index, instance, size in self._instances]
+        else:
+            self._packs = []
+        self._sync_pool()
+
+    def get_batch(
+            self, input_pack: DataPack, context_type: Type[Annotation],
+            requests: DataRequest) -> Iterator[Dict]:
+        self._packs.append(input_pack)
+        pack_index = len(self._packs) - 1
+        for instance in input_pack.get_data(context_type, requests):
+            self._instances.append(
+                (pack_index, instance, self._size(instance)))
+
+        if not self.cross_pack:
+            yield from self._yield_batches(finish=True)
+        elif self.lookahead > 1:
+            if len(self._packs) >= self.lookahead:
+                yield from self._yield_batches(finish=True)
+            else:
+                self._sync_pool()
+        else:
+            yield from self._yield_batches(finish=False)
+
+    def flush(self) -> Iterator[Dict]:
+        yield from self._yield_batches(finish=True)
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'budget': 1000,
+            'length_type': None,
+            'padded': True,
+            'max_batch_size': None,
+            'lookahead': 1,
+        }
+
+
 class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
     r"""A Batcher used in ``MultiPackBatchProcessors``.
 
@@ -224,10 +399,11 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
         input_pack = multi_pack.get_pack(self.input_pack_name)
 
         instances: List[Dict] = []
-        current_size = sum(self.current_batch_sources)
         for data in input_pack.get_data(context_type, requests, offset):
             instances.append(data)
-            if len(instances) == self.batch_size - current_size:
+            # The current batch is emptied after it is yielded, so its size
+            # is checked for every instance.
+            if len(instances) == self.batch_size - len(self._builder):
                 batch = batch_instances(instances)
                 self.batch_is_full = True
                 yield (batch, len(instances))
@@ -244,3 +420,44 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
             'batch_size': 10,
             'input_pack_name': 'source'
         }
+
+
+class WholePackBatcher(ProcessingBatcher[PackType]):
+    r"""A batcher that takes each pack as one instance ``{"pack": pack}``,
+    for the processors that compute one result for each pack, such as
+    encoding the query of a :class:`MultiPack`. The processor reads its
+    inputs from the packs in :meth:`predict`.
+
+    A batch is yielded when it has ``batch_size`` packs, or when a pack
+    arrives and the first pack of the batch has waited for ``max_wait``
+    seconds. Since the batcher only runs when a pack arrives, a pack can wait
+    longer than ``max_wait`` if no more packs come, until the pipeline
+    flushes the processor at the end of the data.
+    """
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.batch_size: int = config.batch_size
+        self.max_wait: Optional[float] = config.max_wait
+        self._batch_start: float = 0.0
+
+    def _should_yield(self) -> bool:
+        if len(self._builder) >= self.batch_size:
+            return True
+        return self.max_wait is not None and \
+            time.monotonic() - self._batch_start >= self.max_wait
+
+    def _get_data_batch(
+            self, data_pack: PackType, context_type: Type[Annotation],
+            requests: Optional[DataRequest] = None,
+            offset: int = 0) -> Iterable[Tuple[Dict, int]]:
+        if len(self._builder) == 0:
+            self._batch_start = time.monotonic()
+        yield ({"pack": [data_pack]}, 1)
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'batch_size': 1,
+            'max_wait': None,
+        }
@@ -0,0 +1,510 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A compact binary serialization format for packs.
+
+Instead of writing each entry as a nested JSON object, the entries of a pack
+are grouped by their types, and the attributes of each type are stored as
+columns. Integer, float and string columns (such as the tids, and the parent
+and child of links) and the spans of the annotations are packed into flat
+arrays, columns of unset (`None`) attributes only keep their sizes, and other
+attributes are encoded value by value. The layout of the
+serialized bytes is::
+
+    MAGIC | VERSION (unsigned short) | value
+
+where each value is a one byte tag followed by its content, in a
+msgpack-like layout:
+
+    - ``N``, ``T``, ``F``: `None`, `True` and `False`.
+    - ``i``: a signed 64-bit integer. ``I``: a larger integer, in decimal.
+    - ``d``: a 64-bit float.
+    - ``s``, ``b``: a string (in UTF-8) or bytes, prefixed by their length.
+    - ``l``, ``t``, ``e``, ``f``: a list, tuple, set or frozenset, prefixed
+      by the number of items.
+    - ``m``: a dict, prefixed by the number of items, with the keys and
+      values interleaved.
+    - ``p``: a :class:`~forte.data.span.Span`, as two 64-bit integers.
+    - ``a``, ``g``: a numpy array or scalar, as the dtype, the shape and the
+      raw data.
+    - ``c``: a class, as its full name.
+    - ``o``: an object, as its class and its state.
+
+All the lengths and counts are unsigned 32-bit integers, and all the numbers
+are little endian. Since the entries are grouped by types, a pack can be
+deserialized with only some of the entry types, or lazily, where each group
+of entries is decoded the first time it is requested, see
+:func:`deserialize_binary`.
+
+Unlike `pickle`, decoding does not call arbitrary functions, objects are
+recovered by their classes and states only. The modules of the classes are
+imported during decoding though, so same as ``jsonpickle``, only deserialize
+data from trusted sources.
+"""
+import struct
+from array import array
+from functools import lru_cache
+from pydoc import locate
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, \
+    Type, Union
+
+import numpy as np
+
+from forte.common.exception import PackDataException
+from forte.data.container import EntryContainer
+from forte.data.ontology.core import Entry
+from forte.data.span import Span
+
+__all__ = [
+    "serialize_binary",
+    "deserialize_binary",
+    "is_binary_pack",
+    "LazyEntries",
+]
+
+MAGIC = b'FTPK'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sH')
+_SIZE = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_SPAN = struct.Struct('<qq')
+
+# The attributes of the packs that store the entries.
+_ENTRY_LISTS = ('annotations', 'links', 'groups', 'generics')
+
+# Column encodings.
+_INT_COLUMN = 'i'
+_FLOAT_COLUMN = 'd'
+_STR_COLUMN = 's'
+_SPAN_COLUMN = 'p'
+_NONE_COLUMN = 'n'
+_OBJECT_COLUMN = 'o'
+_SPARSE_COLUMN = 'x'
+
+# Value tags.
+_CONSTANTS: Dict[bytes, Any] = {b'N': None, b'T': True, b'F': False}
+_SEQUENCE_TAGS: Dict[type, bytes] = {
+    list: b'l', tuple: b't', set: b'e', frozenset: b'f'}
+_SEQUENCE_TYPES: Dict[bytes, Callable[[List[Any]], Any]] = {
+    v: k for k, v in _SEQUENCE_TAGS.items()}
+
+
+def is_binary_pack(data: Any) -> bool:
+    r"""Check whether ``data`` is a pack serialized by
+    :func:`serialize_binary`.
+    """
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(
+        data[:len(MAGIC)]) == MAGIC
+
+
+def serialize_binary(pack) -> bytes:
+    r"""Serialize a :class:`~forte.data.data_pack.DataPack` or a
+    :class:`~forte.data.multi_pack.MultiPack` into bytes.
+
+    Args:
+        pack: The pack to be serialized.
+
+    Returns:
+        The serialized bytes, which can be recovered by
+        :func:`deserialize_binary`.
+    """
+    state: Dict[str, Any] = pack.__getstate__()
+    entries: Dict[str, List[Dict[str, Any]]] = {}
+    for name in _ENTRY_LISTS:
+        if name in state:
+            entries[name] = _encode_entries(state.pop(name))
+
+    return _HEADER.pack(MAGIC, VERSION) + _dumps({
+        'class': type(pack),
+        'state': state,
+        'entries': entries,
+    })
+
+
+def deserialize_binary(data: bytes,
+                       entry_types: Optional[Iterable[Type[Entry]]] = None,
+                       lazy: bool = False):
+    r"""Recover a pack from the bytes created by :func:`serialize_binary`.
+    Similar to deserializing with ``jsonpickle``, the pack manager is not set
+    on the returned pack.
+
+    Args:
+        data: The serialized bytes.
+        entry_types: If provided, only the entries of these types (and their
+            sub-types) are recovered, the other entries are dropped.
+        lazy: If True, only the text and the meta data of the pack are
+            recovered here, the entries of each type are decoded and indexed
+            the first time they are requested from the pack.
+
+    Returns:
+        The deserialized pack.
+    """
+    if not is_binary_pack(data):
+        raise PackDataException("The data is not a binary serialized pack.")
+
+    _, version = _HEADER.unpack_from(data)
+    if version != VERSION:
+        raise PackDataException(
+            f"Unsupported binary pack version {version}, the supported "
+            f"version is {VERSION}.")
+
+    payload = _loads(memoryview(data)[_HEADER.size:])
+    pack_class = payload['class']
+    if not (isinstance(pack_class, type)
+            and issubclass(pack_class, EntryContainer)):
+        raise PackDataException(f"{pack_class} is not a pack class.")
+    state: Dict[str, Any] = payload['state']
+    entries: Dict[str, List[Dict[str, Any]]] = payload['entries']
+
+    if entry_types is not None:
+        types = tuple(entry_types)
+        entries = {
+            name: [b for b in blocks if issubclass(b['class'], types)]
+            for name, blocks in entries.items()
+        }
+
+    for name, blocks in entries.items():
+        state[name] = [] if lazy else _decode_entries(blocks)
+
+    pack: Any = pack_class.__new__(pack_class)
+    pack.__setstate__(state)
+    if lazy:
+        # pylint: disable=protected-access
+        pack._lazy_entries = LazyEntries(entries)
+    return pack
+
+
+class LazyEntries:
+    r"""The entries of a pack that are not decoded yet, grouped by the entry
+    lists of the pack (such as `annotations` and `links`) and entry types.
+    This is created by :func:`deserialize_binary` with `lazy=True`.
+
+    Args:
+        entries: A dict from the name of the entry list to the encoded blocks
+            of each entry type.
+    """
+
+    def __init__(self, entries: Dict[str, List[Dict[str, Any]]]):
+        self._blocks: List[Tuple[str, Dict[str, Any]]] = [
+            (name, block) for name, blocks in entries.items()
+            for block in blocks
+        ]
+        self._tid_types: Optional[Dict[int, type]] = None
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def pop(self, entry_type: Optional[Type[Entry]] = None
+            ) -> List[Tuple[str, List[Entry]]]:
+        r"""Decode and remove the entries of ``entry_type`` (and its
+        sub-types), or all the remaining entries if ``entry_type`` is `None`.
+
+        Returns:
+            A list of the entry list names and the decoded entries.
+        """
+        decoded: List[Tuple[str, List[Entry]]] = []
+        remaining: List[Tuple[str, Dict[str, Any]]] = []
+        for name, block in self._blocks:
+            if entry_type is None or issubclass(block['class'], entry_type):
+                decoded.append((name, _decode_entries([block])))
+            else:
+                remaining.append((name, block))
+        self._blocks = remaining
+        return decoded
+
+    def type_of(self, tid: int) -> Optional[type]:
+        r"""Find the type of the entry with ``tid`` that is not decoded yet,
+        only the tid columns are decoded to find it.
+        """
+        if self._tid_types is None:
+            self._tid_types = {}
+            for _, block in self._blocks:
+                tids = block['columns'].get('_tid')
+                if tids is not None:
+                    for t in _decode_column(tids):
+                        self._tid_types[t] = block['class']
+        return self._tid_types.get(tid)
+
+
+def _encode_entries(entries: List[Entry]) -> List[Dict[str, Any]]:
+    # Group the entry states by type, keeping the order within each type.
+    states_by_type: Dict[type, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        try:
+            states_by_type[type(entry)].append(entry.__getstate__())
+        except KeyError:
+            states_by_type[type(entry)] = [entry.__getstate__()]
+
+    blocks: List[Dict[str, Any]] = []
+    for entry_type, states in states_by_type.items():
+        keys: Dict[str, None] = {}
+        for state in states:
+            keys.update(dict.fromkeys(state))
+
+        columns: Dict[str, Tuple] = {}
+        for key in keys:
+            present = [i for i, s in enumerate(states) if key in s]
+            values = [states[i][key] for i in present]
+            column = _encode_column(values)
+            if len(present) < len(states):
+                column = (_SPARSE_COLUMN,
+                          array('q', present).tobytes(), column)
+            columns[key] = column
+
+        blocks.append({
+            'class': entry_type,
+            'count': len(states),
+            'columns': columns,
+        })
+    return blocks
+
+
+def _encode_column(values: List[Any]) -> Tuple:
+    # `bool` is a subclass of `int`, so check the exact types here.
+    # pylint: disable=unidiomatic-typecheck
+    if all(type(v) is int for v in values):
+        try:
+            return _INT_COLUMN, array('q', values).tobytes()
+        except OverflowError:
+            pass
+    elif all(type(v) is float for v in values):
+        return _FLOAT_COLUMN, array('d', values).tobytes()
+    elif all(type(v) is str for v in values):
+        # The strings are joined, and split by their lengths in decoding.
+        return (_STR_COLUMN, array('q', map(len, values)).tobytes(),
+                ''.join(values))
+    elif all(v is None for v in values):
+        # The fields that are not set, which are common in the ontologies.
+        return _NONE_COLUMN, len(values)
+    elif all(type(v) is Span for v in values):
+        spans = array('q')
+        for v in values:
+            spans.append(v.begin)
+            spans.append(v.end)
+        return _SPAN_COLUMN, spans.tobytes()
+    # The other values are only decoded when the column is decoded.
+    return _OBJECT_COLUMN, _dumps(values)
+
+
+def _decode_column(column: Tuple) -> List[Any]:
+    if column[0] == _INT_COLUMN:
+        return array('q', column[1]).tolist()
+    if column[0] == _FLOAT_COLUMN:
+        return array('d', column[1]).tolist()
+    if column[0] == _STR_COLUMN:
+        text: str = column[2]
+        values: List[str] = []
+        begin = 0
+        for length in array('q', column[1]):
+            values.append(text[begin:begin + length])
+            begin += length
+        return values
+    if column[0] == _SPAN_COLUMN:
+        spans = array('q', column[1])
+        return [Span(spans[i], spans[i + 1]) for i in range(0, len(spans), 2)]
+    if column[0] == _NONE_COLUMN:
+        return [None] * column[1]
+    if column[0] == _OBJECT_COLUMN:
+        return _loads(column[1])
+    raise PackDataException(f"Unknown column encoding {column[0]}.")
+
+
+def _decode_entries(blocks: List[Dict[str, Any]]) -> List[Entry]:
+    entries: List[Entry] = []
+    for block in blocks:
+        states: List[Dict[str, Any]] = [{} for _ in range(block['count'])]
+        for key, column in block['columns'].items():
+            if column[0] == _SPARSE_COLUMN:
+                rows = array('q', column[1]).tolist()
+                values = _decode_column(column[2])
+            else:
+                rows = range(len(states))
+                values = _decode_column(column)
+            for row, value in zip(rows, values):
+                states[row][key] = value
+
+        entry_class = block['class']
+        if not (isinstance(entry_class, type)
+                and issubclass(entry_class, Entry)):
+            raise PackDataException(f"{entry_class} is not an entry class.")
+        for state in states:
+            # Recover the entry without calling `__init__`, which would
+            # assign a new tid and register the entry to a pack.
+            entry = entry_class.__new__(entry_class)
+            entry.__setstate__(state)
+            entries.append(entry)
+    return entries
+
+
+def _class_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@lru_cache(maxsize=None)
+def _locate_class(name: str) -> type:
+    cls = locate(name)
+    if not isinstance(cls, type):
+        raise PackDataException(f"Cannot find the class {name}.")
+    return cls
+
+
+def _dumps(value: Any) -> bytes:
+    out: List[bytes] = []
+    _write(value, out)
+    return b''.join(out)
+
+
+def _write_sized(tag: bytes, data: bytes, out: List[bytes]):
+    out.append(tag)
+    out.append(_SIZE.pack(len(data)))
+    out.append(data)
+
+
+def _write(value: Any, out: List[bytes]):
+    # The exact types are checked, so the objects of the sub-classes of the
+    # built-in types are encoded with their classes.
+    # pylint: disable=unidiomatic-typecheck
+    value_type = type(value)
+    if value is None:
+        out.append(b'N')
+    elif value_type is bool:
+        out.append(b'T' if value else b'F')
+    elif value_type is int:
+        if -2 ** 63 <= value < 2 ** 63:
+            out.append(b'i')
+            out.append(_INT.pack(value))
+        else:
+            _write_sized(b'I', str(value).encode('ascii'), out)
+    elif value_type is float:
+        out.append(b'd')
+        out.append(_FLOAT.pack(value))
+    elif value_type is str:
+        _write_sized(b's', value.encode('utf-8', 'surrogatepass'), out)
+    elif value_type is bytes:
+        _write_sized(b'b', value, out)
+    elif value_type in _SEQUENCE_TAGS:
+        out.append(_SEQUENCE_TAGS[value_type])
+        out.append(_SIZE.pack(len(value)))
+        for item in value:
+            _write(item, out)
+    elif value_type is dict:
+        out.append(b'm')
+        out.append(_SIZE.pack(len(value)))
+        for k, v in value.items():
+            _write(k, out)
+            _write(v, out)
+    elif value_type is Span:
+        out.append(b'p')
+        out.append(_SPAN.pack(value.begin, value.end))
+    elif isinstance(value, (np.ndarray, np.generic)):
+        if value.dtype.hasobject:
+            raise PackDataException(
+                "Cannot serialize numpy arrays of objects.")
+        out.append(b'a' if isinstance(value, np.ndarray) else b'g')
+        _write(value.dtype.str, out)
+        _write(value.shape, out)
+        _write(np.ascontiguousarray(value).tobytes(), out)
+    elif isinstance(value, type):
+        out.append(b'c')
+        _write(_class_name(value), out)
+    else:
+        get_state = getattr(value, '__getstate__', None)
+        state = value.__dict__ if get_state is None else get_state()
+        out.append(b'o')
+        _write(_class_name(value_type), out)
+        _write(state, out)
+
+
+def _loads(data: Union[bytes, memoryview]) -> Any:
+    view = memoryview(data)
+    value, end = _read(view, 0)
+    if end != len(view):
+        raise PackDataException("Unexpected data after the serialized value.")
+    return value
+
+
+def _read_size(data: memoryview, pos: int) -> Tuple[int, int]:
+    return _SIZE.unpack_from(data, pos)[0], pos + _SIZE.size
+
+
+def _read_items(data: memoryview, pos: int) -> Tuple[List[Any], int]:
+    size, pos = _read_size(data, pos)
+    items: List[Any] = []
+    for _ in range(size):
+        item, pos = _read(data, pos)
+        items.append(item)
+    return items, pos
+
+
+def _read_array(data: memoryview, pos: int) -> Tuple[np.ndarray, int]:
+    dtype, pos = _read(data, pos)
+    shape, pos = _read(data, pos)
+    raw, pos = _read(data, pos)
+    return np.frombuffer(raw, dtype=dtype).reshape(shape).copy(), pos
+
+
+def _read(data: memoryview, pos: int) -> Tuple[Any, int]:
+    # pylint: disable=too-many-return-statements
+    tag = data[pos:pos + 1].tobytes()
+    pos += 1
+    if tag in _CONSTANTS:
+        return _CONSTANTS[tag], pos
+    if tag == b'i':
+        return _INT.unpack_from(data, pos)[0], pos + _INT.size
+    if tag == b'd':
+        return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+    if tag in (b's', b'b', b'I'):
+        size, pos = _read_size(data, pos)
+        raw = data[pos:pos + size].tobytes()
+        pos += size
+        if tag == b'b':
+            return raw, pos
+        if tag == b'I':
+            return int(raw.decode('ascii')), pos
+        return raw.decode('utf-8', 'surrogatepass'), pos
+    if tag in _SEQUENCE_TYPES:
+        items, pos = _read_items(data, pos)
+        return _SEQUENCE_TYPES[tag](items), pos
+    if tag == b'm':
+        size, pos = _read_size(data, pos)
+        mapping: Dict[Any, Any] = {}
+        for _ in range(size):
+            key, pos = _read(data, pos)
+            mapping[key], pos = _read(data, pos)
+        return mapping, pos
+    if tag == b'p':
+        begin, end = _SPAN.unpack_from(data, pos)
+        return Span(begin, end), pos + _SPAN.size
+    if tag == b'a':
+        return _read_array(data, pos)
+    if tag == b'g':
+        scalar, pos = _read_array(data, pos)
+        return scalar[()], pos
+    if tag == b'c':
+        name, pos = _read(data, pos)
+        return _locate_class(name), pos
+    if tag == b'o':
+        name, pos = _read(data, pos)
+        state, pos = _read(data, pos)
+        cls: Any = _locate_class(name)
+        # Recover the object without calling `__init__`, same as `pickle`.
+        obj = cls.__new__(cls)
+        if hasattr(obj, '__setstate__'):
+            obj.__setstate__(state)
+        elif state:
+            obj.__dict__.update(state)
+        return obj, pos
+    raise PackDataException(f"Unknown value tag {tag!r} at {pos - 1}.")
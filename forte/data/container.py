@@ -59,6 +59,12 @@ class EntryIdManager:
         self.__id_counter += 1
         return i
 
+    def get_ids(self, num: int) -> range:
+        r"""Allocate a block of ``num`` consecutive ids."""
+        ids = range(self.__id_counter, self.__id_counter + num)
+        self.__id_counter += num
+        return ids
+
     def current_id_counter(self) -> int:
         return self.__id_counter
 
@@ -130,5 +136,8 @@ class EntryContainer(Generic[E, L, G]):
     def get_next_id(self):
         return self._id_manager.get_id()
 
+    def get_next_ids(self, num: int) -> range:
+        return self._id_manager.get_ids(num)
+
 
 ContainerType = TypeVar("ContainerType", bound=EntryContainer)
@@ -12,18 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import heapq
 import logging
 from typing import (Dict, Iterable, Iterator, List, Optional, Type, Union, Any,
-                    Set, Callable, Tuple)
+                    Set, Callable, Tuple, AbstractSet, Sequence)
 
 import numpy as np
-from sortedcontainers import SortedList
+from sortedcontainers import SortedList, SortedKeyList
 
 from forte.common.exception import ProcessExecutionException
 from forte.data import data_utils_io
 from forte.data.base_pack import BaseMeta, BasePack
 from forte.data.index import BaseIndex
-from forte.data.ontology.core import Entry
+from forte.data.ontology.core import Entry, default_entry_fields
 from forte.data.ontology.core import EntryType
 from forte.data.ontology.top import (
     Annotation, Link, Group, SinglePackEntries, Generics)
@@ -133,6 +135,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             a.set_pack(self)
 
     def __iter__(self):
+        self._load_lazy_entries()
         yield from self.annotations
         yield from self.links
         yield from self.groups
@@ -141,6 +144,24 @@ class DataPack(BasePack[Entry, Link, Group]):
     def _init_meta(self, pack_name: Optional[str] = None) -> Meta:
         return Meta(pack_name)
 
+    def _init_view(self, pack: "DataPack"):  # type: ignore
+        # pylint: disable=protected-access
+        super()._init_view(pack)
+        pack.annotations = SortedList(
+            [a._copy(pack) for a in self.annotations])
+        pack.links = SortedList([a._copy(pack) for a in self.links])
+        pack.groups = SortedList([a._copy(pack) for a in self.groups])
+        pack.generics = SortedList([a._copy(pack) for a in self.generics])
+
+        pack.replace_back_operations = list(self.replace_back_operations)
+        pack.processed_original_spans = list(self.processed_original_spans)
+
+        pack.index = DataIndex()
+        pack.index.update_basic_index(list(pack.annotations))
+        pack.index.update_basic_index(list(pack.links))
+        pack.index.update_basic_index(list(pack.groups))
+        pack.index.update_basic_index(list(pack.generics))
+
     def validate(self, entry: EntryType) -> bool:
         return isinstance(entry, SinglePackEntries)
 
@@ -324,6 +345,116 @@ class DataPack(BasePack[Entry, Link, Group]):
         """
         return self.__add_entry_with_check(entry, True)
 
+    def add_annotations(self, entry_type: Type[EntryType],
+                        begins: Union[List[int], np.ndarray],
+                        ends: Union[List[int], np.ndarray],
+                        component_name: Optional[str] = None,
+                        **fields: Union[List[Any], np.ndarray]
+                        ) -> List[EntryType]:
+        r"""Create and add a batch of annotations of ``entry_type`` to the
+        pack. This is the same as creating the annotations one by one, setting
+        their fields, and adding them to the pack, but the ids are allocated
+        in a block and the annotations are merged into the pack and the index
+        at once, which is much faster for a large number of annotations.
+
+        The text of the pack need to be set before calling this.
+
+        Example:
+
+            .. code-block:: python
+
+                tokens = pack.add_annotations(
+                    Token, begins=[0, 4], ends=[3, 8], pos=["DT", "NN"])
+
+        Args:
+            entry_type (type): The type of the annotations, which is
+                constructed with the pack, the begin and the end.
+            begins: The begin offsets of the annotations.
+            ends: The end offsets of the annotations.
+            component_name (str, optional): A name to record that the
+                annotations are created by this component.
+            **fields: The values of the fields of the annotations, each of
+                them has the same length as ``begins``.
+
+        Returns:
+            The list of the created annotations, in the same order as the
+            inputs.
+        """
+        if not issubclass(entry_type, Annotation):
+            raise ValueError(
+                f"The entry type {entry_type} is not an annotation type.")
+
+        begins = np.asarray(begins, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        num = len(begins)
+        if len(ends) != num:
+            raise ValueError(
+                f"The number of begins ({num}) and ends ({len(ends)}) are "
+                f"different.")
+
+        field_values: Dict[str, List[Any]] = {}
+        for name, values in fields.items():
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            if len(values) != num:
+                raise ValueError(
+                    f"The number of the values of the field [{name}] "
+                    f"({len(values)}) is different from the number of "
+                    f"annotations ({num}).")
+            field_values[name] = values
+
+        if num == 0:
+            return []
+
+        if begins.min() < 0:
+            raise ValueError(
+                f"The begin {begins.min()} is smaller than 0, this is not a "
+                f"valid begin.")
+        if ends.max() > len(self.text):
+            raise ValueError(
+                f"The end {ends.max()} of span is greater than the text "
+                f"length {len(self.text)}, which is invalid. The problematic "
+                f"entries are of type {entry_type}.")
+
+        begins, ends = begins.tolist(), ends.tolist()
+
+        # Construct the first annotation normally, the others are copied from
+        # it, so the fields set in the constructor are copied as well.
+        first: EntryType = entry_type(self, begins[0], ends[0])  # type: ignore
+        self._pending_entries.pop(first.tid)
+        default_fields = [
+            name for name in first.__dict__ if name not in default_entry_fields]
+
+        tids = [first.tid, *self.get_next_ids(num - 1)]
+        annotations: List[EntryType] = [first]
+        for tid, begin, end in zip(tids[1:], begins[1:], ends[1:]):
+            # pylint: disable=protected-access
+            annotation: EntryType = first._copy(self)  # type: ignore
+            entry_dict = object.__getattribute__(annotation, '__dict__')
+            entry_dict['_tid'] = tid
+            entry_dict['_span'] = Span(begin, end)
+            annotations.append(annotation)
+        self._pack_manager.on_entry_creation(num - 1)
+
+        for name, values in field_values.items():
+            for annotation, value in zip(annotations, values):
+                if isinstance(value, Entry):
+                    # Use the normal path to store the entry as a pointer.
+                    setattr(annotation, name, value)
+                else:
+                    # pylint: disable=protected-access
+                    annotation._check_attr_type(name, value)
+                    object.__getattribute__(
+                        annotation, '__dict__')[name] = value
+
+        self.annotations.update(annotations)
+        self.index.update_basic_index(annotations)
+        self._record_entries(
+            tids,
+            list(set(default_fields).union(field_values)), component_name)
+
+        return annotations
+
     def __add_entry_with_check(self, entry: EntryType,
                                allow_duplicate: bool = True) -> EntryType:
         r"""Internal method to add an :class:`Entry` object to the
@@ -386,7 +517,6 @@ class DataPack(BasePack[Entry, Link, Group]):
                 self.index.update_link_index([entry])
             if self.index.group_index_on and isinstance(entry, Group):
                 self.index.update_group_index([entry])
-            self.index.deactivate_coverage_index()
 
             self._pending_entries.pop(entry.tid)
 
@@ -438,13 +568,12 @@ class DataPack(BasePack[Entry, Link, Group]):
         else:
             target.pop(index_to_remove)
 
-        # update basic index
+        # update basic index and coverage index
         self.index.remove_entry(entry)
 
         # set other index invalid
         self.index.turn_link_index_switch(on=False)
         self.index.turn_group_index_switch(on=False)
-        self.index.deactivate_coverage_index()
 
     @classmethod
     def validate_link(cls, entry: EntryType) -> bool:
@@ -529,7 +658,8 @@ class DataPack(BasePack[Entry, Link, Group]):
         context_components, _, context_fields = self._parse_request_args(
             context_type, context_args)
 
-        valid_context_ids: Set[int] = self.get_ids_by_type(context_type)
+        valid_context_ids: AbstractSet[int] = self.get_ids_by_type(
+            context_type)
         if context_components:
             valid_component_id: Set[int] = set()
             for component in context_components:
@@ -584,6 +714,236 @@ class DataPack(BasePack[Entry, Link, Group]):
 
             yield data
 
+    def get_columnar_data(self, context_type: Type[Annotation],
+                          request: Optional[DataRequest] = None,
+                          skip_k: int = 0) -> Dict[str, Any]:
+        r"""Fetch the same data as :meth:`get_data`, but for all the contexts
+        of the pack at once, stored in a columnar layout. Each requested entry
+        type is stored as flat NumPy arrays that concatenate the entries of
+        all contexts, and an ``"offsets"`` array of length
+        ``num_contexts + 1``, where the entries of the ``i``-th context are
+        the rows ``offsets[i]:offsets[i + 1]``.
+
+        Example:
+
+            .. code-block:: python
+
+                columns = pack.get_columnar_data(Sentence, {Token: ["pos"]})
+                offsets = columns["Token"]["offsets"]
+                # The POS tags of the second sentence.
+                pos = columns["Token"]["pos"][offsets[1]: offsets[2]]
+
+        The extraction runs a single range query per context and entry type,
+        and resolves the parents and children of the links with a tid to row
+        mapping, so the cost is linear to the number of entries extracted.
+        Use :func:`~forte.data.data_utils_io.split_columns` to convert the
+        result into the batch format of :meth:`get_data`.
+
+        Args:
+            context_type (str): The granularity of the data context, which
+                could be any ``Annotation`` type.
+            request (dict): The entry types and fields required, in the same
+                format as :meth:`get_data`.
+            skip_k (int): Will skip the first `skip_k` contexts.
+
+        Returns:
+            A dict containing the context level data (``"context"``,
+            ``"offset"`` and the requested context fields, one row per
+            context), and a dict of columns for each requested entry type,
+            keyed by the type name. The ``"unit_span"``, ``"parent"`` and
+            ``"child"`` columns are indices relative to the context, the same
+            as :meth:`get_data`.
+        """
+        annotation_types, link_types = self._split_request(request)
+
+        context_components, _, context_fields = self._parse_request_args(
+            context_type, annotation_types.get(context_type))
+
+        contexts: List[Annotation] = list(
+            self.get(context_type, None, context_components))[skip_k:]
+
+        columns: Dict[str, Any] = dict()
+        columns["context"] = np.array(
+            [self.text[c.span.begin: c.span.end] for c in contexts])
+        columns["offset"] = np.array([c.span.begin for c in contexts],
+                                     dtype=np.int64)
+        for field in context_fields:
+            columns[field] = np.array([getattr(c, field) for c in contexts])
+
+        # The context level entries of each type, used to resolve the row of
+        # the units and the link ends.
+        entries_by_type: Dict[str, List[List[Annotation]]] = dict()
+
+        for a_type, a_args in annotation_types.items():
+            if issubclass(a_type, context_type):
+                continue
+            if a_type.__name__ in columns.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {a_type.__name__} at the "
+                    f"same time is not allowed")
+            components, unit, fields = self._parse_request_args(a_type, a_args)
+            if unit is not None and unit not in entries_by_type:
+                raise KeyError(f"{unit} is missing in data. You need to "
+                               f"request {unit} before {a_type}.")
+
+            per_context = [list(self.get(a_type, c, components))
+                           for c in contexts]
+            entries_by_type[a_type.__name__] = per_context
+            columns[a_type.__name__] = self._annotation_columns(
+                per_context, contexts, fields,
+                None if unit is None else entries_by_type[unit])
+
+        for l_type, l_args in link_types.items():
+            if l_type.__name__ in columns.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {l_type.__name__} at the "
+                    f"same time is not allowed")
+            components, unit, fields = self._parse_request_args(l_type, l_args)
+            if unit is not None:
+                raise ValueError(f"Link entries cannot be indexed by {unit}.")
+
+            for end_type in (l_type.ParentType, l_type.ChildType):
+                if end_type.__name__ not in entries_by_type:
+                    raise KeyError(
+                        f"The {end_type.__name__} entries linked by "
+                        f"{l_type} are not requested. You should also "
+                        f"request {end_type.__name__} with {l_type}")
+
+            columns[l_type.__name__] = self._link_columns(
+                self._links_by_context(l_type, components, contexts),
+                fields,
+                entries_by_type[l_type.ParentType.__name__],
+                entries_by_type[l_type.ChildType.__name__])
+
+        return columns
+
+    @staticmethod
+    def _column_offsets(
+            per_context: Sequence[Sequence[Entry]]) -> np.ndarray:
+        offsets = np.zeros(len(per_context) + 1, dtype=np.int64)
+        np.cumsum([len(entries) for entries in per_context], out=offsets[1:])
+        return offsets
+
+    def _annotation_columns(
+            self, per_context: List[List[Annotation]],
+            contexts: List[Annotation], fields: Set[str],
+            units: Optional[List[List[Annotation]]]) -> Dict[str, Any]:
+        offsets = self._column_offsets(per_context)
+        total = int(offsets[-1])
+
+        a_columns: Dict[str, Any] = {"offsets": offsets}
+        spans = np.empty((total, 2), dtype=np.int64)
+        tids = np.empty(total, dtype=np.int64)
+        context_spans = np.empty((total, 2), dtype=np.int64)
+        unit_spans = np.empty((total, 2), dtype=np.int64)
+        texts: List[str] = []
+        values: Dict[str, List[Any]] = {
+            f: [] for f in fields if f not in
+            ("span", "text", "tid", "context_span")}
+
+        for i, entries in enumerate(per_context):
+            begin, end = offsets[i], offsets[i + 1]
+            if begin == end:
+                continue
+            spans[begin:end] = [(a.span.begin, a.span.end) for a in entries]
+            tids[begin:end] = [a.tid for a in entries]
+            context_spans[begin:end] = spans[begin:end] - contexts[i].span.begin
+            texts.extend(self.text[a.span.begin: a.span.end] for a in entries)
+            for field, field_values in values.items():
+                field_values.extend(getattr(a, field) for a in entries)
+            if units is not None:
+                unit_spans[begin:end] = _align_units(
+                    units[i], spans[begin:end])
+
+        a_columns["span"] = spans
+        a_columns["text"] = np.array(texts)
+        a_columns["tid"] = tids
+        if "context_span" in fields:
+            a_columns["context_span"] = context_spans
+        for field, field_values in values.items():
+            a_columns[field] = np.array(field_values)
+        if units is not None:
+            a_columns["unit_span"] = unit_spans
+        return a_columns
+
+    def _links_by_context(
+            self, l_type: Type[Link], components: Optional[List[str]],
+            contexts: List[Annotation]) -> List[List[Link]]:
+        per_context: List[List[Link]] = [[] for _ in contexts]
+        begins = [c.span.begin for c in contexts]
+        non_overlapping = all(
+            contexts[i].span.end <= begins[i + 1]
+            for i in range(len(contexts) - 1))
+
+        if not non_overlapping:
+            for i, c in enumerate(contexts):
+                per_context[i].extend(self.get(l_type, c, components))
+            return per_context
+
+        # Each link falls in at most one context, find it by bisection.
+        link: Link
+        for link in self.get(l_type, None, components):
+            parent, child = link.get_parent(), link.get_child()
+            if (not isinstance(parent, Annotation)
+                    or not isinstance(child, Annotation)):
+                continue
+            link_begin = min(parent.span.begin, child.span.begin)
+            link_end = max(parent.span.end, child.span.end)
+            i = bisect.bisect_right(begins, link_begin) - 1
+            if i >= 0 and contexts[i].span.end >= link_end:
+                per_context[i].append(link)
+        return per_context
+
+    def _link_columns(
+            self, per_context: List[List[Link]], fields: Set[str],
+            parents: List[List[Annotation]],
+            children: List[List[Annotation]]) -> Dict[str, Any]:
+        offsets = self._column_offsets(per_context)
+        total = int(offsets[-1])
+
+        l_columns: Dict[str, Any] = {"offsets": offsets}
+        parent_rows = np.empty(total, dtype=np.int64)
+        child_rows = np.empty(total, dtype=np.int64)
+        tids = np.empty(total, dtype=np.int64)
+        values: Dict[str, List[Any]] = {
+            f: [] for f in fields if f not in ("parent", "child", "tid")}
+
+        for i, links in enumerate(per_context):
+            begin, end = offsets[i], offsets[i + 1]
+            if begin == end:
+                continue
+            # The tid to row mappings of the entries in this context.
+            parent_row = {e.tid: r for r, e in enumerate(parents[i])}
+            child_row = {e.tid: r for r, e in enumerate(children[i])}
+            parent_rows[begin:end] = [parent_row[l.parent] for l in links]
+            child_rows[begin:end] = [child_row[l.child] for l in links]
+            tids[begin:end] = [l.tid for l in links]
+            for field, field_values in values.items():
+                field_values.extend(getattr(l, field) for l in links)
+
+        l_columns["parent"] = parent_rows
+        l_columns["child"] = child_rows
+        l_columns["tid"] = tids
+        for field, field_values in values.items():
+            l_columns[field] = np.array(field_values)
+        return l_columns
+
+    def _split_request(self, request: Optional[DataRequest]) -> Tuple[
+            Dict[Type[Annotation], Union[Dict, List]],
+            Dict[Type[Link], Union[Dict, List]]]:
+        annotation_types: Dict[Type[Annotation], Union[Dict, List]] = dict()
+        link_types: Dict[Type[Link], Union[Dict, List]] = dict()
+
+        if request is not None:
+            for key, value in request.items():
+                if issubclass(key, Annotation):
+                    annotation_types[key] = value
+                elif issubclass(key, Link):
+                    link_types[key] = value
+        return annotation_types, link_types
+
     def _parse_request_args(self, a_type, a_args):
         # request which fields generated by which component
         components = None
@@ -635,7 +995,6 @@ class DataPack(BasePack[Entry, Link, Group]):
         for field in fields:
             a_dict[field] = []
 
-        unit_begin = 0
         if unit is not None:
             if unit not in data.keys():
                 raise KeyError(f"{unit} is missing in data. You need to "
@@ -661,19 +1020,11 @@ class DataPack(BasePack[Entry, Link, Group]):
 
                 a_dict[field].append(getattr(annotation, field))
 
-            if unit is not None:
-                while not self.index.in_span(data[unit]["tid"][unit_begin],
-                                             annotation.span):
-                    unit_begin += 1
-
-                unit_span_begin = unit_begin
-                unit_span_end = unit_span_begin + 1
-
-                while self.index.in_span(data[unit]["tid"][unit_span_end],
-                                         annotation.span):
-                    unit_span_end += 1
-
-                a_dict["unit_span"].append((unit_span_begin, unit_span_end))
+        if unit is not None and a_dict["span"]:
+            # Align all the annotations to the units at once, by searching
+            # the sorted unit spans.
+            a_dict["unit_span"] = _align_unit_spans(
+                data[unit]["span"], np.array(a_dict["span"], dtype=np.int64))
 
         for key, value in a_dict.items():
             a_dict[key] = np.array(value)
@@ -698,6 +1049,19 @@ class DataPack(BasePack[Entry, Link, Group]):
         a_dict["parent"] = []
         a_dict["child"] = []
 
+        # The mapping from the tids of the requested entries of each type to
+        # their positions, built when first needed.
+        positions: Dict[str, Dict[int, int]] = {}
+
+        def get_position(entry_type: str, tid: int) -> int:
+            try:
+                type_positions = positions[entry_type]
+            except KeyError:
+                type_positions = {t: i for i, t in enumerate(
+                    data[entry_type]["tid"].tolist())}
+                positions[entry_type] = type_positions
+            return type_positions[tid]
+
         link: Link
         for link in self.get(a_type, cont, components):
             parent_type = link.ParentType.__name__
@@ -712,10 +1076,8 @@ class DataPack(BasePack[Entry, Link, Group]):
                                f" You should also request {child_type} with "
                                f"{a_type}")
 
-            a_dict["parent"].append(
-                np.where(data[parent_type]["tid"] == link.parent)[0][0])
-            a_dict["child"].append(
-                np.where(data[child_type]["tid"] == link.child)[0][0])
+            a_dict["parent"].append(get_position(parent_type, link.parent))
+            a_dict["child"].append(get_position(child_type, link.child))
 
             for field in fields:
                 if field in ("parent", "child"):
@@ -755,18 +1117,48 @@ class DataPack(BasePack[Entry, Link, Group]):
                 entries requested. If `None`, will return valid entries
                 generated by any component.
         """
+        self._load_lazy_entries(entry_type)
+
         # If we don't have any annotations, then we yield an empty list.
-        # Note that generics do not work with annotations.
-        if len(self.annotations) == 0 and not issubclass(entry_type, Generics):
+        # Note that generics do not work with annotations. The annotations may
+        # not be loaded yet if the pack is deserialized lazily.
+        if (len(self.annotations) == 0 and not self._lazy_entries
+                and not issubclass(entry_type, Generics)):
             yield from []
             return
 
-        # valid type
-        valid_id = self.get_ids_by_type(entry_type)
+        if isinstance(components, str):
+            components = [components]
+
+        if issubclass(entry_type, Annotation):
+            # The span index already restricts the results by type and range,
+            # so an id filter is only needed for components and coverage.
+            valid_ids: Optional[Set[int]] = None
+            if components is not None:
+                valid_ids = self.get_ids_by_components(components)
+
+            if range_annotation is not None:
+                coverage_index = self.index.coverage_index(
+                    type(range_annotation), entry_type)
+                # The range annotation is not in the coverage index if it
+                # is not added to the pack.
+                covered = None if coverage_index is None else \
+                    coverage_index.get(range_annotation.tid)
+                if covered is not None:
+                    valid_ids = covered if valid_ids is None else (
+                            valid_ids & covered)
+
+            range_span = range_annotation.span if range_annotation else None
+            for annotation in self.index.span_index(entry_type, range_span):
+                if valid_ids is None or annotation.tid in valid_ids:
+                    yield annotation  # type: ignore
+            return
+
+        # valid type, copied since the type index may change while the
+        # entries are being consumed.
+        valid_id = self.index.query_by_type_subtype(entry_type).copy()
         # valid component
         if components is not None:
-            if isinstance(components, str):
-                components = [components]
             valid_id &= self.get_ids_by_components(components)
 
         # Generics do not work with range_annotation.
@@ -780,33 +1172,11 @@ class DataPack(BasePack[Entry, Link, Group]):
         if range_annotation is not None:
             coverage_index = self.index.coverage_index(type(range_annotation),
                                                        entry_type)
-            if coverage_index is not None:
+            if (coverage_index is not None
+                    and range_annotation.tid in coverage_index):
                 valid_id &= coverage_index[range_annotation.tid]
 
-        range_begin = range_annotation.span.begin if range_annotation else 0
-        range_end = (range_annotation.span.end if range_annotation else
-                     self.annotations[-1].span.end)
-
-        if issubclass(entry_type, Annotation):
-            temp_begin = Annotation(self, range_begin, range_begin)
-            begin_index = self.annotations.bisect(temp_begin)
-
-            temp_end = Annotation(self, range_end, range_end)
-            end_index = self.annotations.bisect(temp_end)
-
-            # Make sure these temporary annotations are not part of the
-            # actual data.
-            temp_begin.regret_creation()
-            temp_end.regret_creation()
-
-            for annotation in self.annotations[begin_index: end_index]:
-                if annotation.tid not in valid_id:
-                    continue
-                if (range_annotation is None or
-                        self.index.in_span(annotation, range_annotation.span)):
-                    yield annotation
-
-        elif issubclass(entry_type, (Link, Group)):
+        if issubclass(entry_type, (Link, Group)):
             for entry_id in valid_id:
                 entry: EntryType = self.get_entry(entry_id)  # type: ignore
                 if (range_annotation is None or
@@ -814,6 +1184,68 @@ class DataPack(BasePack[Entry, Link, Group]):
                     yield entry
 
 
+def _align_units(units: List[Annotation], spans: np.ndarray) -> np.ndarray:
+    r"""Find the range of ``units`` covered by each of the ``spans``. The
+    units are assumed to be sorted and not nested in each other, such as
+    tokens. Returns an array of ``(begin, end)`` unit indices, ``end`` is
+    exclusive.
+    """
+    unit_spans = np.array([(u.span.begin, u.span.end) for u in units],
+                          dtype=np.int64).reshape(-1, 2)
+    return _align_unit_spans(unit_spans, spans)
+
+
+def _align_unit_spans(unit_spans: np.ndarray,
+                      spans: np.ndarray) -> np.ndarray:
+    r"""The same as :func:`_align_units`, but the units are given by their
+    ``(begin, end)`` spans."""
+    unit_spans = np.asarray(unit_spans, dtype=np.int64).reshape(-1, 2)
+    aligned = np.empty((len(spans), 2), dtype=np.int64)
+    aligned[:, 0] = np.searchsorted(unit_spans[:, 0], spans[:, 0], side='left')
+    aligned[:, 1] = np.searchsorted(unit_spans[:, 1], spans[:, 1],
+                                    side='right')
+    return aligned
+
+
+def _span_key(annotation: Annotation) -> Tuple[int, int, int]:
+    span = annotation.span
+    return span.begin, span.end, annotation.tid
+
+
+def _annotation_order_key(annotation: Annotation) -> Tuple[int, int, str, int]:
+    # Consistent with the ordering defined by `Annotation.__lt__`.
+    return (annotation.span.begin, annotation.span.end,
+            str(type(annotation)), annotation.tid)
+
+
+def _sweep_coverage(outer_spans: List[Tuple[int, int, int]],
+                    inner_spans: List[Tuple[int, int, int]]
+                    ) -> Dict[int, Set[int]]:
+    r"""Find the inner entries covered by each of the outer entries, with a
+    single sweep over the ``(begin, end, tid)`` of the entries, which are
+    sorted by the begins.
+    """
+    coverage: Dict[int, Set[int]] = {tid: set() for _, _, tid in outer_spans}
+    # The (end, tid) of the outer entries that begin before the current inner
+    # entry, kept as a heap so the ones ended can be dropped.
+    active: List[Tuple[int, int]] = []
+    next_outer = 0
+    for begin, end, tid in inner_spans:
+        while (next_outer < len(outer_spans)
+               and outer_spans[next_outer][0] <= begin):
+            heapq.heappush(active, (outer_spans[next_outer][1],
+                                    outer_spans[next_outer][2]))
+            next_outer += 1
+        # The outer entries ended before this inner entry cannot cover the
+        # following inner entries either.
+        while active and active[0][0] < begin:
+            heapq.heappop(active)
+        for outer_end, outer_tid in active:
+            if outer_end >= end:
+                coverage[outer_tid].add(tid)
+    return coverage
+
+
 class DataIndex(BaseIndex):
     r"""A set of indexes used in :class:`DataPack`:
 
@@ -831,7 +1263,12 @@ class DataIndex(BaseIndex):
        the key is a tuple of the outer entry type and the inner entry type.
        The outer entry type should be an annotation type. The value is a dict,
        where the key is the tid of the outer entry, and the value is a set of
-       tids that are covered by the outer entry.
+       tids that are covered by the outer entry. The built coverage indexes
+       are updated when entries are added to or removed from the index.
+    #. :attr:`_span_index`, the index from each concrete annotation type to
+       the annotations of that type, sorted by their spans. This index is
+       maintained together with the basic indexes and is used to answer
+       range queries without scanning annotations of other types.
 
     """
 
@@ -841,6 +1278,157 @@ class DataIndex(BaseIndex):
                                    Dict[int, Set[int]]] = dict()
         self._coverage_index_valid = True
 
+        # Mapping from each concrete annotation type to its annotations,
+        # sorted by (begin, end, tid).
+        self._span_index: Dict[Type[Annotation], SortedKeyList] = dict()
+        # The longest span seen for each annotation type, this bounds the
+        # search window of the overlap queries.
+        self._max_span_length: Dict[Type[Annotation], int] = dict()
+
+    def update_basic_index(self, entries: List[EntryType]):
+        r"""Build or update the basic indexes, the annotations in
+        ``entries`` are also added to the span index.
+
+        Args:
+            entries (list): a list of entries to be added into the basic index.
+        """
+        super().update_basic_index(entries)
+
+        annotations_by_type: Dict[Type[Annotation], List[Annotation]] = dict()
+        for entry in entries:
+            if isinstance(entry, Annotation):
+                try:
+                    annotations_by_type[type(entry)].append(entry)
+                except KeyError:
+                    annotations_by_type[type(entry)] = [entry]
+
+        for a_type, annotations in annotations_by_type.items():
+            try:
+                self._span_index[a_type].update(annotations)
+            except KeyError:
+                self._span_index[a_type] = SortedKeyList(
+                    annotations, key=_span_key)
+
+            max_length = max(a.span.end - a.span.begin for a in annotations)
+            if max_length > self._max_span_length.get(a_type, -1):
+                self._max_span_length[a_type] = max_length
+
+        if self._coverage_index_valid:
+            self.__update_coverage_index(entries)
+
+    def remove_entry(self, entry: EntryType):
+        super().remove_entry(entry)
+        if isinstance(entry, Annotation) and type(entry) in self._span_index:
+            self._span_index[type(entry)].discard(entry)
+
+        if not self._coverage_index_valid:
+            return
+
+        for key, coverage in list(self._coverage_index.items()):
+            outer_type, inner_type = key
+            coverage.pop(entry.tid, None)
+            if not isinstance(entry, inner_type):
+                continue
+            if isinstance(entry, Annotation):
+                for outer in self.__covering_annotations(
+                        outer_type, entry.span.begin, entry.span.end):
+                    coverage[outer.tid].discard(entry.tid)
+            else:
+                # The links and groups are indexed by the spans of their
+                # members, which may have changed, so rebuild them when
+                # needed.
+                del self._coverage_index[key]
+
+    def __update_coverage_index(self, entries: List[EntryType]):
+        r"""Add the new ``entries`` to the built coverage indexes, either as
+        outer entries or as inner entries."""
+        for key, coverage in list(self._coverage_index.items()):
+            outer_type, inner_type = key
+            if not issubclass(inner_type, Annotation):
+                # The coverage of the links and groups is rebuilt when needed,
+                # since their members may not be indexed yet.
+                if any(isinstance(entry, (outer_type, inner_type))
+                       for entry in entries):
+                    del self._coverage_index[key]
+                continue
+
+            for entry in entries:
+                if isinstance(entry, outer_type):
+                    coverage[entry.tid] = {
+                        a.tid for a in self.span_index(inner_type, entry.span)}
+
+            for entry in entries:
+                if isinstance(entry, inner_type):
+                    for outer in self.__covering_annotations(
+                            outer_type, entry.span.begin, entry.span.end):
+                        coverage[outer.tid].add(entry.tid)
+
+    def __covering_annotations(self, outer_type: Type[Annotation],
+                               begin: int, end: int) -> Iterator[Annotation]:
+        r"""Find the annotations of ``outer_type`` that cover the range from
+        ``begin`` to ``end``."""
+        for a_type in self.indexed_subtypes(outer_type):
+            annotations = self._span_index.get(a_type)
+            if not annotations:
+                continue
+            # The covering annotations begin within this window.
+            start = annotations.bisect_key_left(
+                (end - self._max_span_length[a_type],))
+            stop = annotations.bisect_key_left((begin + 1,))
+            for annotation in annotations.islice(start, stop):
+                if annotation.span.end >= end:
+                    yield annotation
+
+    def span_index(self, entry_type: Type[Annotation],
+                   span: Optional[Span] = None,
+                   overlap: bool = False) -> Iterator[Annotation]:
+        r"""Look up the span index for the annotations of ``entry_type``
+        (including its subclasses) that are within the given ``span``. The
+        annotations are returned in the same order as they are stored in the
+        data pack. Each look up costs O(log(n)) plus the number of
+        annotations of the type that begin inside the searched window.
+
+        Args:
+            entry_type (type): The annotation type to look up.
+            span (Span, optional): The range to look up. If `None`, all
+                annotations of ``entry_type`` will be returned.
+            overlap (bool): If `True`, will return the annotations that
+                overlap with ``span`` instead of the ones within ``span``.
+        """
+        iters: List[Iterator[Annotation]] = []
+        for a_type in self.indexed_subtypes(entry_type):
+            annotations = self._span_index.get(a_type)
+            if annotations:
+                iters.append(self.__iter_span(a_type, annotations, span,
+                                              overlap))
+
+        if len(iters) == 1:
+            yield from iters[0]
+        else:
+            yield from heapq.merge(*iters, key=_annotation_order_key)
+
+    def __iter_span(self, a_type: Type[Annotation], annotations: SortedKeyList,
+                    span: Optional[Span], overlap: bool
+                    ) -> Iterator[Annotation]:
+        if span is None:
+            yield from annotations
+            return
+
+        if overlap:
+            search_begin = span.begin - self._max_span_length[a_type]
+            start = annotations.bisect_key_left((search_begin,))
+            stop = annotations.bisect_key_left((span.end,))
+            for annotation in annotations.islice(start, stop):
+                if (annotation.span.end > span.begin
+                        and annotation.span.begin < span.end):
+                    yield annotation
+        else:
+            start = annotations.bisect_key_left((span.begin,))
+            stop = annotations.bisect_key_left((span.end + 1,))
+            for annotation in annotations.islice(start, stop):
+                if annotation.span.end <= span.end:
+                    yield annotation
+
     @property
     def coverage_index_is_valid(self):
         return self._coverage_index_valid
@@ -874,29 +1462,40 @@ class DataIndex(BaseIndex):
             data_pack: DataPack,
             outer_type: Type[Annotation],
             inner_type: Type[EntryType]):
-        r"""Build the coverage index from ``outer_type`` to ``inner_type``.
+        r"""Build the coverage index from ``outer_type`` to ``inner_type``,
+        with a single sweep over the entries sorted by their spans.
 
         Args:
             data_pack (DataPack): The data pack to build coverage for.
             outer_type (type): an annotation type.
             inner_type (type): an entry type, can be Annotation, Link, Group.
         """
-        if not isinstance(inner_type, (Annotation, Link, Group)):
+        if not issubclass(outer_type, Annotation):
+            raise ValueError(
+                f"Do not support coverage index from {outer_type}.")
+        if not issubclass(inner_type, (Annotation, Link, Group)):
             raise ValueError(f"Do not support coverage index for {inner_type}.")
 
+        # Getting the entries from the pack loads them if the pack is
+        # deserialized lazily.
+        outer_spans = [(a.span.begin, a.span.end, a.tid)
+                       for a in data_pack.get(outer_type)]
+        inner_spans: List[Tuple[int, int, int]] = []
+        for entry in data_pack.get(inner_type):
+            span = self._entry_span(entry)
+            if span is not None:
+                inner_spans.append((span[0], span[1], entry.tid))
+        if not issubclass(inner_type, Annotation):
+            inner_spans.sort()
+
         if not self.coverage_index_is_valid:
             self._coverage_index = dict()
 
         # prevent the index from being used during construction
         self.deactivate_coverage_index()
 
-        self._coverage_index[(outer_type, inner_type)] = dict()
-        for range_annotation in data_pack.get_entries_by_type(outer_type):
-            if isinstance(range_annotation, Annotation):
-                entries = data_pack.get(inner_type, range_annotation)
-                entry_ids = {e.tid for e in entries}
-                self._coverage_index[
-                    (outer_type, inner_type)][range_annotation.tid] = entry_ids
+        self._coverage_index[(outer_type, inner_type)] = _sweep_coverage(
+            outer_spans, inner_spans)
 
         self.activate_coverage_index()
 
@@ -946,39 +1545,41 @@ class DataIndex(BaseIndex):
         if isinstance(inner_entry, (int, np.integer)):
             inner_entry = self._entry_index[inner_entry]
 
-        if isinstance(inner_entry, Annotation):
-            inner_begin = inner_entry.span.begin
-            inner_end = inner_entry.span.end
-        elif isinstance(inner_entry, Link):
-            child = inner_entry.get_child()
-            parent = inner_entry.get_parent()
+        inner_span = self._entry_span(inner_entry)
+        if inner_span is None:
+            # Cannot check in_span for non-annotations.
+            return False
+        return inner_span[0] >= span.begin and inner_span[1] <= span.end
+
+    @staticmethod
+    def _entry_span(entry: Entry) -> Optional[Tuple[int, int]]:
+        r"""Get the range of the text covered by ``entry``. The range of a
+        link covers its parent and child, and the range of a group covers
+        all its members. Returns `None` if the link or group contain
+        non-annotations.
+        """
+        if isinstance(entry, Annotation):
+            return entry.span.begin, entry.span.end
+        elif isinstance(entry, Link):
+            child = entry.get_child()
+            parent = entry.get_parent()
 
             if (not isinstance(child, Annotation)
                     or not isinstance(parent, Annotation)):
-                # Cannot check in_span for non-annotations.
-                return False
-
-            child_: Annotation = child
-            parent_: Annotation = parent
-
-            inner_begin = min(child_.span.begin, parent_.span.begin)
-            inner_end = max(child_.span.end, parent_.span.end)
-        elif isinstance(inner_entry, Group):
-            inner_begin = -1
-            inner_end = -1
-            for mem in inner_entry.get_members():
-                if not isinstance(mem, Annotation):
-                    # Cannot check in_span for non-annotations.
-                    return False
-
-                mem_: Annotation = mem
-                if inner_begin == -1:
-                    inner_begin = mem_.span.begin
-                inner_begin = min(inner_begin, mem_.span.begin)
-                inner_end = max(inner_end, mem_.span.end)
+                return None
+
+            return (min(child.span.begin, parent.span.begin),
+                    max(child.span.end, parent.span.end))
+        elif isinstance(entry, Group):
+            members = list(entry.get_members())
+            if not members or not all(
+                    isinstance(mem, Annotation) for mem in members):
+                return None
+
+            return (min(mem.span.begin for mem in members),
+                    max(mem.span.end for mem in members))
         else:
             raise ValueError(
-                f"Invalid entry type {type(inner_entry)}. A valid entry "
+                f"Invalid entry type {type(entry)}. A valid entry "
                 f"should be an instance of Annotation, Link, or Group."
             )
-        return inner_begin >= span.begin and inner_end <= span.end
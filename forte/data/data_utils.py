@@ -20,16 +20,20 @@ import sys
 import tarfile
 import urllib.request
 import zipfile
-from typing import List, Optional, overload
+from typing import Iterable, List, Optional, Type, Union, overload
 
 import jsonpickle
 
+from forte.data.base_pack import BasePack
+from forte.data.binary_format import deserialize_binary, is_binary_pack
+from forte.data.ontology.core import Entry
 from forte.pack_manager import PackManager
 from forte.utils.types import PathLike
 from forte.utils.utils_io import maybe_create_dir
 
 __all__ = [
     "maybe_download",
+    "serialize",
     "deserialize"
 ]
 
@@ -183,10 +187,55 @@ def _download_from_google_drive(url: str, filename: str, path: str) -> str:
     return filepath
 
 
-def deserialize(pack_manager: PackManager, string: str):
-    r"""Deserialize a pack from a string.
+def serialize(pack: BasePack, drop_record: bool = False,
+              serialize_method: str = "jsonpickle") -> Union[str, bytes]:
+    r"""Serialize a pack with the method given by its name.
+
+    Args:
+        pack: The pack to be serialized.
+        drop_record: Whether to drop the creation and field records in the
+            serialization.
+        serialize_method: The method used to serialize the pack, either
+            `"jsonpickle"` for a JSON string (see
+            :meth:`~forte.data.base_pack.BasePack.serialize`), or `"binary"`
+            for the compact bytes (see
+            :meth:`~forte.data.base_pack.BasePack.serialize_binary`).
+
+    Returns:
+        The serialized pack, which can be recovered by :func:`deserialize`.
     """
-    pack = jsonpickle.decode(string)
+    if serialize_method == "jsonpickle":
+        return pack.serialize(drop_record)
+    elif serialize_method == "binary":
+        return pack.serialize_binary(drop_record)
+    else:
+        raise ValueError(
+            f"Unsupported serialize method {serialize_method}, should be "
+            f"one of 'jsonpickle' and 'binary'.")
+
+
+def deserialize(pack_manager: PackManager, string: Union[str, bytes],
+                entry_types: Optional[Iterable[Type[Entry]]] = None,
+                lazy: bool = False):
+    r"""Deserialize a pack from a string created by
+    :meth:`~forte.data.base_pack.BasePack.serialize`, or from bytes created
+    by :meth:`~forte.data.base_pack.BasePack.serialize_binary`.
+
+    Args:
+        pack_manager: The pack manager to control the pack.
+        string: The serialized pack.
+        entry_types: If provided, only the entries of these types (and their
+            sub-types) are recovered. Only used for the binary packs, the
+            JSON packs are always fully recovered.
+        lazy: Whether to decode the entries of each type only when they are
+            first requested. Only used for the binary packs, see
+            :func:`~forte.data.binary_format.deserialize_binary`.
+    """
+    if is_binary_pack(string):
+        pack = deserialize_binary(
+            string, entry_types, lazy)  # type: ignore
+    else:
+        pack = jsonpickle.decode(string)
     # Need to assign the pack manager to the pack to control it after reading
     #  the raw data.
     # pylint: disable=protected-access
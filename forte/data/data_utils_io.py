@@ -21,30 +21,81 @@ from forte.data.types import ReplaceOperationsType
 from forte.data.span import Span
 
 __all__ = [
+    "BatchBuilder",
     "batch_instances",
     "merge_batches",
     "slice_batch",
+    "split_batch",
+    "split_columns",
+    "slice_columns",
     "dataset_path_iterator",
 ]
 
 
-def batch_instances(instances: List[Dict]):
-    r"""Merge a list of ``instances``."""
-    batch: Dict[str, Any] = {}
-    for instance in instances:
+class BatchBuilder:
+    r"""Accumulate instances, or batches of instances, into a batch in the
+    format created by :func:`batch_instances`. The lists in the batch are
+    appended in place, so the cost is linear in the size of the batch no
+    matter how many parts it is accumulated from.
+    """
+
+    def __init__(self):
+        self.batch: Dict[str, Any] = {}
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add_instance(self, instance: Dict):
+        r"""Append one ``instance`` to the batch."""
+        batch = self.batch
         for entry, fields in instance.items():
             if isinstance(fields, dict):
-                if entry not in batch.keys():
+                if entry not in batch:
                     batch[entry] = {}
+                entry_batch = batch[entry]
                 for k, value in fields.items():
-                    if k not in batch[entry].keys():
-                        batch[entry][k] = []
-                    batch[entry][k].append(value)
+                    if k not in entry_batch:
+                        entry_batch[k] = []
+                    entry_batch[k].append(value)
             else:  # context level feature
-                if entry not in batch.keys():
+                if entry not in batch:
                     batch[entry] = []
                 batch[entry].append(fields)
-    return batch
+        self.size += 1
+
+    def add_batch(self, batch: Dict, size: int):
+        r"""Append ``batch`` of ``size`` instances to the batch. The builder
+        takes the ownership of ``batch``, which should not be used by the
+        caller any more.
+        """
+        if not self.batch:
+            # Take over the lists instead of copying them.
+            self.batch = batch
+        else:
+            for entry, fields in batch.items():
+                if isinstance(fields, dict):
+                    entry_batch = self.batch.setdefault(entry, {})
+                    for k, value in fields.items():
+                        entry_batch.setdefault(k, []).extend(value)
+                else:  # context level feature
+                    self.batch.setdefault(entry, []).extend(fields)
+        self.size += size
+
+    def build(self) -> Dict:
+        r"""Return the accumulated batch, and start a new one."""
+        batch = self.batch
+        self.batch = {}
+        self.size = 0
+        return batch
+
+
+def batch_instances(instances: List[Dict]):
+    r"""Merge a list of ``instances``."""
+    builder = BatchBuilder()
+    for instance in instances:
+        builder.add_instance(instance)
+    return builder.batch
 
 
 def merge_batches(batches: List[Dict]):
@@ -82,6 +133,66 @@ def slice_batch(batch, start, length):
     return sliced_batch
 
 
+def split_batch(batch: Dict, sizes: List[int]) -> Iterator[Dict]:
+    r"""Split ``batch`` into consecutive parts of ``sizes``, the same as
+    calling :func:`slice_batch` for each part.
+    """
+    start = 0
+    for size in sizes:
+        part: Dict = {}
+        for entry, fields in batch.items():
+            if isinstance(fields, dict):
+                part[entry] = {k: value[start: start + size]
+                               for k, value in fields.items()}
+            else:  # context level feature
+                part[entry] = fields[start: start + size]
+        yield part
+        start += size
+
+
+def split_columns(columns: Dict[str, Any]) -> Dict[str, Any]:
+    r"""Convert the columnar data returned by
+    :meth:`~forte.data.data_pack.DataPack.get_columnar_data` into the batch
+    format created by :func:`batch_instances`, where each field is a list with
+    one item per context. The items are views of the flat column arrays, so no
+    data is copied.
+    """
+    batch: Dict[str, Any] = {}
+    for entry, fields in columns.items():
+        if isinstance(fields, dict):
+            offsets = fields["offsets"]
+            batch[entry] = {}
+            for k, value in fields.items():
+                if k == "offsets":
+                    continue
+                batch[entry][k] = [
+                    value[offsets[i]: offsets[i + 1]]
+                    for i in range(len(offsets) - 1)]
+        else:  # context level feature
+            batch[entry] = list(fields)
+    return batch
+
+
+def slice_columns(columns: Dict[str, Any], start: int, length: int):
+    r"""Return the columnar data of ``length`` contexts from ``start`` in
+    ``columns``, which is created by
+    :meth:`~forte.data.data_pack.DataPack.get_columnar_data`. The flat columns
+    of the result are views of the original ones.
+    """
+    sliced: Dict[str, Any] = {}
+    for entry, fields in columns.items():
+        if isinstance(fields, dict):
+            offsets = fields["offsets"][start: start + length + 1]
+            begin, end = (offsets[0], offsets[-1]) if len(offsets) else (0, 0)
+            sliced[entry] = {
+                k: value[begin: end] for k, value in fields.items()
+                if k != "offsets"}
+            sliced[entry]["offsets"] = offsets - begin
+        else:  # context level feature
+            sliced[entry] = fields[start: start + length]
+    return sliced
+
+
 def dataset_path_iterator_with_base(
         dir_path: str, file_extension: str) -> Iterator[Tuple[str, str]]:
     r"""An iterator returning file_paths in a directory containing files of the
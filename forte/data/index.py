@@ -15,13 +15,55 @@
 import logging
 from collections import defaultdict
 from typing import DefaultDict, Dict, List, Set, Type, Hashable, Generic, \
-    Iterable, Tuple
+    Iterable, Tuple, AbstractSet, Iterator, TypeVar
 
 from forte.common.exception import PackIndexError
 from forte.data.ontology.core import GroupType, LinkType, EntryType
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+
+class TypeIdsView(AbstractSet[int]):
+    r"""A read-only view of the entry tids of several types in the
+    :attr:`type_index`. The view is backed by the index directly, so it
+    reflects the changes made to the index after it is created. Set operations
+    (such as ``&`` and ``|``) on the view return new plain sets.
+
+    Args:
+        id_sets (list): The tid sets of the types covered by this view. The
+            sets should be disjoint, which is the case for the tid sets of
+            different concrete types.
+    """
+
+    def __init__(self, id_sets: List[Set[int]]):
+        self._id_sets = id_sets
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[T]) -> Set[T]:
+        return set(it)
+
+    def __contains__(self, tid) -> bool:
+        for ids in self._id_sets:
+            if tid in ids:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[int]:
+        for ids in self._id_sets:
+            yield from ids
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._id_sets)
+
+    def copy(self) -> Set[int]:
+        r"""Return the tids in this view as a new set."""
+        result: Set[int] = set()
+        for ids in self._id_sets:
+            result.update(ids)
+        return result
+
 
 class BaseIndex(Generic[EntryType]):
     r"""A set of indexes used in :class:`BasePack`:
@@ -45,6 +87,12 @@ class BaseIndex(Generic[EntryType]):
         # Mapping from entry's type to entries' id.
         self._type_index: DefaultDict[Type, Set[int]] = defaultdict(set)
 
+        # Mapping from a queried type to the indexed types that are its
+        # subclasses, and to the view of their entry ids. These caches are
+        # cleared when a new type is added to the type index.
+        self._subtype_cache: Dict[Type, List[Type]] = dict()
+        self._type_ids_cache: Dict[Type, TypeIdsView] = dict()
+
         # List of other indexes (built when first looked up).
         self._group_index: DefaultDict[Hashable, Set[int, int]] = defaultdict(
             set)
@@ -71,11 +119,53 @@ class BaseIndex(Generic[EntryType]):
         """
         for entry in entries:
             self._entry_index[entry.tid] = entry
-            self._type_index[type(entry)].add(entry.tid)
+            entry_type = type(entry)
+            if entry_type not in self._type_index:
+                self._subtype_cache.clear()
+                self._type_ids_cache.clear()
+            self._type_index[entry_type].add(entry.tid)
 
     def get_entry(self, tid: int) -> EntryType:
         return self._entry_index[tid]
 
+    def indexed_subtypes(self, entry_type: Type) -> List[Type]:
+        r"""Get the types in the :attr:`type_index` that are ``entry_type``
+        or its subclasses. The result is cached until a new type is indexed.
+
+        Args:
+            entry_type: The type to look up.
+
+        Returns:
+            A list of indexed types. This list is shared, do not modify it.
+        """
+        try:
+            return self._subtype_cache[entry_type]
+        except KeyError:
+            subtypes = [t for t in self._type_index
+                        if issubclass(t, entry_type)]
+            self._subtype_cache[entry_type] = subtypes
+            return subtypes
+
+    def query_by_type_subtype(self, entry_type: Type) -> TypeIdsView:
+        r"""Look up the :attr:`type_index` for the tids of the entries of
+        ``entry_type`` and its subclasses.
+
+        Args:
+            entry_type: The type of the entries to look up.
+
+        Returns:
+            A read-only :class:`TypeIdsView` of the tids, which is backed by
+            the index. Make a copy of it if the index is going to be changed
+            while iterating the result.
+        """
+        try:
+            return self._type_ids_cache[entry_type]
+        except KeyError:
+            view = TypeIdsView([self._type_index[t] for t in
+                                self.indexed_subtypes(entry_type)])
+            self._type_ids_cache[entry_type] = view
+            return view
+
     def iter_type_index(self) -> Iterable[Tuple[Type, Set[int]]]:
         for t, ids in self._type_index.items():
             yield t, ids
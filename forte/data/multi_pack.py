@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 from typing import (Dict, List, Set, Union, Iterator, Optional, Type, Any,
                     Tuple)
@@ -141,6 +140,7 @@ class MultiPack(BasePack[Entry, MultiPackLink, MultiPackGroup]):
         self._inverse_pack_ref = new_inverse_refs
 
     def __iter__(self):
+        self._load_lazy_entries()
         yield from self.links
         yield from self.groups
         yield from self.generics
@@ -496,8 +496,11 @@ class MultiPack(BasePack[Entry, MultiPackLink, MultiPackGroup]):
         Returns:
 
         """
-        # valid type
-        valid_id = self.get_ids_by_type(entry_type)
+        self._load_lazy_entries(entry_type)
+
+        # valid type, copied since the type index may change while the
+        # entries are being consumed.
+        valid_id = self.index.query_by_type_subtype(entry_type).copy()
         # valid component
         if components is not None:
             if isinstance(components, str):
@@ -562,8 +565,32 @@ class MultiPack(BasePack[Entry, MultiPackLink, MultiPackGroup]):
     def validate_group(cls, entry: EntryType) -> bool:
         return isinstance(entry, MultiPackGroup)
 
-    def view(self):
-        return copy.deepcopy(self)
+    def _init_view(self, pack: "MultiPack"):  # type: ignore
+        # pylint: disable=protected-access
+        super()._init_view(pack)
+        pack.links = SortedList([a._copy(pack) for a in self.links])
+        pack.groups = SortedList([a._copy(pack) for a in self.groups])
+        pack.generics = SortedList([a._copy(pack) for a in self.generics])
+
+        pack.index = MultiIndex()
+        pack.index.update_basic_index(list(pack.links))
+        pack.index.update_basic_index(list(pack.groups))
+        pack.index.update_basic_index(list(pack.generics))
+
+        # The data packs are copied too, the copies get new pack ids and are
+        # referenced by the copied multi pack at the same indices.
+        pack._pack_ref = []
+        pack._inverse_pack_ref = {}
+        for data_pack in self.packs:
+            data_pack_view = data_pack.view()
+            data_pack_view.meta.pack_id = -1
+            self._pack_manager.set_pack_id(data_pack_view)
+            self._pack_manager.reference_pack(data_pack_view)
+            pid = data_pack_view.pack_id
+            pack._pack_ref.append(pid)
+            pack._inverse_pack_ref[pid] = len(pack._pack_ref) - 1
+        pack._pack_names = list(self._pack_names)
+        pack._name_index = dict(self._name_index)
 
 
 class MultiIndex(BaseIndex):
@@ -16,17 +16,20 @@ Defines the basic data structures and interfaces for the Forte data
 representation system.
 """
 
+import copy
 from abc import abstractmethod, ABC
 from collections.abc import MutableSequence, MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import (
-    Iterable, Optional, Type, Hashable, TypeVar, Generic,
-    Union, Dict, Iterator, get_type_hints, overload, List)
+    Any, Iterable, Optional, Type, Hashable, TypeVar, Generic,
+    Union, Dict, Iterator, get_type_hints, overload, List, Tuple)
 
 import numpy as np
 
 from forte.common import PackDataException
 from forte.data.container import ContainerType, BasePointer
+from forte.data.span import Span
 
 __all__ = [
     "Entry",
@@ -39,15 +42,78 @@ __all__ = [
     "MpPointer",
     "FDict",
     "FList",
-    "MultiEntry"
+    "MultiEntry",
+    "set_trusted_mode",
+    "is_trusted_mode",
+    "trusted_mode",
 ]
 
-from forte.utils.utils import check_type
+from forte.utils.utils import get_check_types
 
-default_entry_fields = [
+default_entry_fields = frozenset([
     '_Entry__pack', '_tid', '_embedding', '_span', '_parent', '_child',
     '_members', '_Entry__field_modified', 'field_records', 'creation_records',
-    '_id_manager']
+    '_id_manager'])
+
+# The type hint of each field of each entry class, and the types to check the
+# field values against, which are resolved once per class.
+_field_types: Dict[type, Dict[str, Tuple[Any, Tuple]]] = {}
+
+# Whether to skip the type validation of the field values, see
+# :func:`set_trusted_mode`.
+_trusted_mode: bool = False
+
+
+def set_trusted_mode(trusted: bool):
+    r"""Turn on or off the trusted mode globally. In the trusted mode, the
+    values assigned to the fields of the entries are not validated against
+    the type hints of the fields, which saves time for the readers and
+    processors that are known to produce valid values. The modified fields
+    are still recorded.
+
+    Args:
+        trusted (bool): Whether to turn on the trusted mode.
+    """
+    global _trusted_mode  # pylint: disable=global-statement
+    _trusted_mode = trusted
+
+
+def is_trusted_mode() -> bool:
+    r"""Whether the trusted mode is on, see :func:`set_trusted_mode`."""
+    return _trusted_mode
+
+
+@contextmanager
+def trusted_mode():
+    r"""A context manager that turns on the trusted mode within the block,
+    see :func:`set_trusted_mode`."""
+    trusted = _trusted_mode
+    set_trusted_mode(True)
+    try:
+        yield
+    finally:
+        set_trusted_mode(trusted)
+
+
+def _get_field_types(entry_class: type) -> Dict[str, Tuple[Any, Tuple]]:
+    try:
+        return _field_types[entry_class]
+    except KeyError:
+        field_types = {
+            key: (hint, get_check_types(hint))
+            for key, hint in get_type_hints(entry_class).items()}
+        _field_types[entry_class] = field_types
+        return field_types
+
+
+# The field values of these types are not changed in place, so they can be
+# shared by the copies of an entry.
+_IMMUTABLE_FIELD_TYPES = (
+    str, int, float, bool, type(None), Span, BasePointer, frozenset)
+
+# The containers that can be copied with their `copy` method when they are
+# empty.
+_CONTAINER_TYPES = (list, dict, set)
 
 
 @dataclass
@@ -89,6 +155,32 @@ class Entry(Generic[ContainerType]):
     def regret_creation(self):
         self.__pack.regret_creation(self)
 
+    def _copy(self, pack: ContainerType) -> "Entry":
+        r"""Copy this entry into ``pack``, used to create a view of the pack.
+        The copy behaves like a deep copy, but the immutable field values are
+        shared instead of copied.
+        """
+        # Avoid `__getattribute__` of the entry, which resolves the pointers.
+        entry_class = type(self)
+        entry = entry_class.__new__(entry_class)
+        entry_dict = object.__getattribute__(entry, '__dict__')
+        for key, value in object.__getattribute__(self, '__dict__').items():
+            value_type = type(value)
+            if key == '_Entry__pack':
+                entry_dict[key] = pack
+            elif (value_type in _IMMUTABLE_FIELD_TYPES
+                  or isinstance(value, _IMMUTABLE_FIELD_TYPES)):
+                entry_dict[key] = value
+            elif value_type in _CONTAINER_TYPES and not value:
+                entry_dict[key] = value.copy()
+            elif isinstance(value, (FList, FDict)):
+                entry_dict[key] = value._copy(entry)
+            elif isinstance(value, np.ndarray):
+                entry_dict[key] = value.copy()
+            else:
+                entry_dict[key] = copy.deepcopy(value)
+        return entry
+
     def __getstate__(self):
         r"""In serialization, the pack is not serialize, and it will be set
         by the container.
@@ -119,6 +211,13 @@ class Entry(Generic[ContainerType]):
             state["_embedding"] = np.empty(0)
         self.__dict__.update(state)
 
+        # The parent entries of the containers are not serialized, bind them
+        # to this entry.
+        for key, value in state.items():
+            if isinstance(value, (FList, FDict)):
+                # pylint: disable=protected-access
+                self.__dict__[key] = value._copy(self)
+
     # using property decorator
     # a getter function for self._embedding
     @property
@@ -211,13 +310,12 @@ class Entry(Generic[ContainerType]):
         Returns:
 
         """
-        if key not in default_entry_fields:
-            hints = get_type_hints(self.__class__)
-            is_valid = check_type(value, hints[key])
-            if not is_valid:
+        if key not in default_entry_fields and not _trusted_mode:
+            hint, types = _get_field_types(type(self))[key]
+            if not isinstance(value, types):
                 raise TypeError(
                     f"The [{key}] attribute of [{type(self)}] "
-                    f"should be [{hints[key]}], but got [{type(value)}].")
+                    f"should be [{hint}], but got [{type(value)}].")
 
     def __setattr__(self, key, value):
         self._check_attr_type(key, value)
@@ -237,7 +335,7 @@ class Entry(Generic[ContainerType]):
             self.__pack.record_field(self.tid, key)
 
     def __getattribute__(self, item):
-        v = super().__getattribute__(item)
+        v = object.__getattribute__(self, item)
         if isinstance(v, BasePointer):
             # Using the pointer to get the entry.
             return self.resolve_pointer(v)
@@ -343,6 +441,11 @@ class FList(Generic[ParentEntryType], MutableSequence):
     def insert(self, index: int, entry: EntryType):
         self.__data.insert(index, entry.as_pointer(self.__parent_entry))
 
+    def _copy(self, parent_entry: ParentEntryType) -> "FList":
+        flist: FList = type(self)(parent_entry)
+        flist.__data = list(self.__data)
+        return flist
+
     @overload
     @abstractmethod
     def __getitem__(self, i: int) -> EntryType:
@@ -404,6 +507,11 @@ class FDict(Generic[KeyType, ValueType], MutableMapping):
             self.__data = {
                 k: v.as_pointer(self.__parent_entry) for k, v in data.items()}
 
+    def _copy(self, parent_entry: ParentEntryType) -> "FDict":
+        fdict: FDict = FDict(parent_entry)
+        fdict.__data = dict(self.__data)
+        return fdict
+
     def __setitem__(self, k: KeyType, v: ValueType) -> None:
         try:
             self.__data[k] = v.as_pointer(self.__parent_entry)
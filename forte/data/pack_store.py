@@ -0,0 +1,302 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A pack store keeps many serialized packs in a directory with random access.
+
+The serialized packs are appended one after another to the data segments
+(``data-00000.bin``, ``data-00001.bin``, ...), a new segment is started when
+the current one reaches ``shard_size`` bytes. Similar to the ``pack.idx`` file
+written by :class:`~forte.processors.base.writers.MultiPackWriter`, the store
+maintains a tab separated index file ``store.idx``, where each line records::
+
+    pack_id  shard  offset  length  pack_name
+
+The data segments are read through :mod:`mmap`, so a pack can be located by
+its position, pack id or pack name and deserialized without reading or
+decoding the other packs in the store.
+"""
+import mmap
+import os
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, \
+    TextIO, Tuple, Type, Union
+
+from forte.common.exception import PackDataException
+from forte.data.base_pack import BasePack
+from forte.data.binary_format import is_binary_pack
+from forte.data.data_utils import deserialize, serialize
+from forte.data.ontology.core import Entry
+from forte.pack_manager import PackManager
+
+__all__ = [
+    "PackStore",
+]
+
+
+class _IndexRecord:
+    __slots__ = ('pack_id', 'shard', 'offset', 'length', 'pack_name')
+
+    def __init__(self, pack_id: int, shard: int, offset: int, length: int,
+                 pack_name: Optional[str]):
+        self.pack_id = pack_id
+        self.shard = shard
+        self.offset = offset
+        self.length = length
+        self.pack_name = pack_name
+
+    def to_line(self) -> str:
+        name = '' if self.pack_name is None else self.pack_name
+        return (f'{self.pack_id}\t{self.shard}\t{self.offset}\t'
+                f'{self.length}\t{name}\n')
+
+    @classmethod
+    def from_line(cls, line: str) -> '_IndexRecord':
+        pack_id, shard, offset, length, name = line.rstrip('\n').split(
+            '\t', 4)
+        return cls(int(pack_id), int(shard), int(offset), int(length),
+                   name if name else None)
+
+
+class PackStore:
+    r"""An append-only store of serialized packs with an offset index, which
+    supports random access by position, pack id and pack name.
+
+    Args:
+        path: The directory of the store.
+        mode: `"r"` opens an existing store for reading, `"a"` opens a store
+            for appending (and reading) and creates it if it does not exist,
+            `"w"` creates an empty store, removing the existing one.
+        shard_size (int, optional): The maximum number of bytes of a data
+            segment before a new segment is started. A single pack larger
+            than this size is still written in one segment. If `None`, all
+            packs are written to one segment.
+    """
+    INDEX_FILE = 'store.idx'
+
+    def __init__(self, path: str, mode: str = 'r',
+                 shard_size: Optional[int] = None):
+        if mode not in ('r', 'a', 'w'):
+            raise ValueError(
+                f"Unknown mode {mode}, should be one of 'r', 'a' and 'w'.")
+
+        self._path: str = path
+        self._mode: str = mode
+        self._shard_size: Optional[int] = shard_size
+
+        self._records: List[_IndexRecord] = []
+        self._id_index: Dict[int, int] = {}
+        self._name_index: Dict[Optional[str], List[int]] = {}
+        self._mmaps: Dict[int, mmap.mmap] = {}
+        self._files: Dict[int, BinaryIO] = {}
+
+        index_path = os.path.join(path, self.INDEX_FILE)
+        if mode == 'r' and not os.path.exists(index_path):
+            raise FileNotFoundError(
+                f"Cannot find the pack store index {index_path}.")
+
+        if mode == 'w':
+            os.makedirs(path, exist_ok=True)
+            for file in os.listdir(path):
+                if file == self.INDEX_FILE or file.startswith('data-'):
+                    os.remove(os.path.join(path, file))
+
+        if os.path.exists(index_path):
+            with open(index_path) as index_file:
+                for line in index_file:
+                    if line.strip():
+                        self._add_record(_IndexRecord.from_line(line))
+
+        self._index_out: Optional[TextIO] = None
+        # The shard and the file that the packs are being appended to.
+        self._data_out: Optional[Tuple[int, BinaryIO]] = None
+        if mode != 'r':
+            os.makedirs(path, exist_ok=True)
+            self._index_out = open(index_path, 'a')
+
+    @staticmethod
+    def is_store(path: str) -> bool:
+        r"""Check whether ``path`` is the directory of a pack store."""
+        return os.path.isfile(os.path.join(path, PackStore.INDEX_FILE))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, pack_id: int) -> bool:
+        r"""Whether a pack with ``pack_id`` is stored."""
+        return pack_id in self._id_index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def pack_ids(self) -> List[int]:
+        r"""The ids of the stored packs, in the order they are stored."""
+        return [r.pack_id for r in self._records]
+
+    @property
+    def pack_names(self) -> List[Optional[str]]:
+        r"""The names of the stored packs, in the order they are stored."""
+        return [r.pack_name for r in self._records]
+
+    def position_of(self, pack_id: int) -> int:
+        r"""Get the position of the pack with ``pack_id`` in the store. If the
+        same id is stored multiple times, the last one is returned.
+        """
+        try:
+            return self._id_index[pack_id]
+        except KeyError:
+            raise KeyError(
+                f"Cannot find pack with id {pack_id} in the store "
+                f"{self._path}.") from None
+
+    def positions_of_name(self, pack_name: str) -> List[int]:
+        r"""Get the positions of all the packs named ``pack_name``."""
+        return list(self._name_index.get(pack_name, []))
+
+    def append(self, pack: BasePack, drop_record: bool = False,
+               serialize_method: str = 'binary') -> int:
+        r"""Serialize and append ``pack`` to the store.
+
+        Args:
+            pack: The pack to be stored.
+            drop_record: Whether to drop the creation records in the
+                serialization.
+            serialize_method: The method used to serialize the pack, see
+                :func:`~forte.data.data_utils.serialize`.
+
+        Returns:
+            The position of the pack in the store.
+        """
+        data = serialize(pack, drop_record, serialize_method)
+        return self.append_raw(
+            data, pack.meta.pack_id, pack.pack_name)
+
+    def append_raw(self, data: Union[str, bytes], pack_id: int,
+                   pack_name: Optional[str] = None) -> int:
+        r"""Append an already serialized pack to the store.
+
+        Returns:
+            The position of the pack in the store.
+        """
+        if self._index_out is None:
+            raise PackDataException(
+                f"The pack store {self._path} is opened as read only.")
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        if self._records:
+            last = self._records[-1]
+            shard, offset = last.shard, last.offset + last.length
+            if (self._shard_size is not None and offset > 0
+                    and offset + len(data) > self._shard_size):
+                shard, offset = shard + 1, 0
+        else:
+            shard, offset = 0, 0
+
+        if self._data_out is None or self._data_out[0] != shard:
+            self._close_data_out()
+            self._data_out = (shard, open(self._shard_path(shard), 'ab'))
+
+        data_file = self._data_out[1]
+        # The data segment may contain garbage from an interrupted append, so
+        # always write the pack at the offset computed from the index.
+        data_file.seek(offset)
+        data_file.truncate()
+        data_file.write(data)
+        data_file.flush()
+
+        record = _IndexRecord(pack_id, shard, offset, len(data), pack_name)
+        self._index_out.write(record.to_line())
+        self._index_out.flush()
+        return self._add_record(record)
+
+    def raw(self, position: int) -> Union[str, bytes]:
+        r"""Get the serialized pack at ``position``. Packs serialized with the
+        binary method are returned as bytes, others are returned as strings.
+        """
+        record = self._records[position]
+        buffer = self._get_mmap(record.shard, record.offset + record.length)
+        data = buffer[record.offset: record.offset + record.length]
+        return data if is_binary_pack(data) else data.decode('utf-8')
+
+    def iter_raw(self, start: int = 0,
+                 stop: Optional[int] = None) -> Iterator[Union[str, bytes]]:
+        r"""Iterate over the serialized packs from position ``start`` to
+        ``stop`` (exclusive).
+        """
+        for position in range(*slice(start, stop).indices(len(self))):
+            yield self.raw(position)
+
+    def load(self, pack_manager: PackManager, position: int,
+             entry_types: Optional[Iterable[Type[Entry]]] = None,
+             lazy: bool = False):
+        r"""Deserialize the pack at ``position``, see
+        :func:`~forte.data.data_utils.deserialize` for ``entry_types`` and
+        ``lazy``.
+        """
+        return deserialize(
+            pack_manager, self.raw(position), entry_types, lazy)
+
+    def close(self):
+        r"""Close the opened files of the store."""
+        for buffer in self._mmaps.values():
+            buffer.close()
+        self._mmaps.clear()
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        self._close_data_out()
+        if self._index_out is not None:
+            self._index_out.close()
+            self._index_out = None
+
+    def _add_record(self, record: _IndexRecord) -> int:
+        position = len(self._records)
+        self._records.append(record)
+        self._id_index[record.pack_id] = position
+        self._name_index.setdefault(record.pack_name, []).append(position)
+        return position
+
+    def _shard_path(self, shard: int) -> str:
+        return os.path.join(self._path, f'data-{shard:05d}.bin')
+
+    def _close_data_out(self):
+        if self._data_out is not None:
+            self._data_out[1].close()
+            self._data_out = None
+
+    def _get_mmap(self, shard: int, size: int) -> mmap.mmap:
+        buffer = self._mmaps.get(shard)
+        if buffer is None or len(buffer) < size:
+            # The segment grows after appending, so map it again.
+            if buffer is not None:
+                buffer.close()
+            if shard not in self._files:
+                self._files[shard] = open(self._shard_path(shard), 'rb')
+            buffer = mmap.mmap(
+                self._files[shard].fileno(),
+                0, access=mmap.ACCESS_READ)
+            if len(buffer) < size:
+                raise PackDataException(
+                    f"The data segment {self._shard_path(shard)} is shorter "
+                    f"than recorded in the index.")
+            self._mmaps[shard] = buffer
+        return buffer
@@ -26,6 +26,7 @@ from forte.data import data_utils
 from forte.data.base_pack import PackType
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
+from forte.data.pack_store import PackStore
 from forte.data.types import ReplaceOperationsType
 from forte.pipeline_component import PipelineComponent
 from forte.utils.utils import get_full_module_name
@@ -58,17 +59,25 @@ class BaseReader(PipelineComponent[PackType], ABC):
             if cache file already exists.  By default (``False``), we
             will overwrite the existing caching file. If ``True``, we will
             cache the datapack append to end of the caching file.
+        cache_in_store (bool, optional): Decide whether to cache the packs
+            of each collection in a :class:`~forte.data.pack_store.PackStore`
+            with the binary serialization, instead of a newline-delimited
+            JSON file. By default (``False``), the JSON file is used. Cache
+            files of both formats can be read regardless of this option.
     """
 
     def __init__(self,
                  from_cache: bool = False,
                  cache_directory: Optional[str] = None,
-                 append_to_cache: bool = False):
+                 append_to_cache: bool = False,
+                 cache_in_store: bool = False):
         super().__init__()
         self.from_cache = from_cache
         self._cache_directory = cache_directory
         self.component_name = get_full_module_name(self)
         self.append_to_cache = append_to_cache
+        self.cache_in_store = cache_in_store
+        self._cache_store: Optional[PackStore] = None
 
     @classmethod
     def default_configs(cls):
@@ -244,7 +253,18 @@ class BaseReader(PipelineComponent[PackType], ABC):
         )
 
         logger.info("Caching pack to %s", cache_filename)
-        if append:
+        if self.cache_in_store:
+            # Keep the store of the current collection opened, so the index
+            # is not loaded again for every pack.
+            if (append and self._cache_store is not None
+                    and self._cache_store.path == cache_filename):
+                store = self._cache_store
+            else:
+                self._close_cache_store()
+                store = PackStore(cache_filename, 'a' if append else 'w')
+                self._cache_store = store
+            store.append(pack)
+        elif append:
             with open(cache_filename, 'a') as cache:
                 cache.write(pack.serialize() + "\n")
         else:
@@ -262,17 +282,31 @@ class BaseReader(PipelineComponent[PackType], ABC):
         Returns: List of cached data packs.
         """
         logger.info("reading from cache file %s", cache_filename)
-        with open(cache_filename, "r") as cache_file:
-            for line in cache_file:
-                pack = data_utils.deserialize(self._pack_manager, line.strip())
-                if not isinstance(pack, self.pack_type):
-                    raise TypeError(
-                        f"Pack deserialized from {cache_filename} "
-                        f"is {type(pack)}, but expect {self.pack_type}")
-                yield pack
+        for pack in self.__read_cache(str(cache_filename)):
+            if not isinstance(pack, self.pack_type):
+                raise TypeError(
+                    f"Pack deserialized from {cache_filename} "
+                    f"is {type(pack)}, but expect {self.pack_type}")
+            yield pack
+
+    def __read_cache(self, cache_filename: str) -> Iterator[PackType]:
+        if PackStore.is_store(cache_filename):
+            with PackStore(cache_filename) as store:
+                for i in range(len(store)):
+                    yield store.load(self._pack_manager, i)
+        else:
+            with open(cache_filename, "r") as cache_file:
+                for line in cache_file:
+                    yield data_utils.deserialize(
+                        self._pack_manager, line.strip())
+
+    def _close_cache_store(self):
+        if self._cache_store is not None:
+            self._cache_store.close()
+            self._cache_store = None
 
     def finish(self, resources: Resources):
-        pass
+        self._close_cache_store()
 
 
 class PackReader(BaseReader[DataPack], ABC):
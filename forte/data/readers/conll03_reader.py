@@ -17,7 +17,7 @@ The reader that reads CoNLL ner_data into our internal json data datasets.
 import codecs
 import logging
 import os
-from typing import Iterator, Any
+from typing import Any, Dict, Iterator, List
 
 from forte.data.data_pack import DataPack
 from forte.data.data_utils_io import dataset_path_iterator
@@ -58,6 +58,11 @@ class CoNLL03Reader(PackReader):
         sentence_begin = 0
         sentence_cnt = 0
 
+        # The tokens are added at once after the text is set.
+        token_begins: List[int] = []
+        token_ends: List[int] = []
+        token_fields: Dict[str, List[str]] = {"pos": [], "chunk": [], "ner": []}
+
         for line in doc:
             line = line.strip()
 
@@ -73,10 +78,11 @@ class CoNLL03Reader(PackReader):
                 word_end = offset + len(word)
 
                 # Add tokens.
-                token = Token(pack, word_begin, word_end)
-                token.pos = pos
-                token.chunk = chunk_id
-                token.ner = ner_tag
+                token_begins.append(word_begin)
+                token_ends.append(word_end)
+                token_fields["pos"].append(pos)
+                token_fields["chunk"].append(chunk_id)
+                token_fields["ner"].append(ner_tag)
 
                 text += word + " "
                 offset = word_end + 1
@@ -98,6 +104,8 @@ class CoNLL03Reader(PackReader):
             sentence_cnt += 1
 
         pack.set_text(text, replace_func=self.text_replace_operation)
+        pack.add_annotations(Token, token_begins, token_ends,
+                             component_name=self.name, **token_fields)
 
         Document(pack, 0, len(text))
 
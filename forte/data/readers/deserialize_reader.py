@@ -13,7 +13,7 @@
 # limitations under the License.
 import os
 from abc import ABC
-from typing import Iterator, List, Any, Dict
+from typing import Iterator, List, Any, Dict, Optional, Type, Union
 
 from forte.common import Resources
 from forte.common.configuration import Config
@@ -21,28 +21,56 @@ from forte.common.exception import ProcessExecutionException
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.readers.base_reader import PackReader, MultiPackReader
+from forte.data.binary_format import is_binary_pack
 from forte.data.data_utils import deserialize
+from forte.data.ontology.core import Entry
+from forte.data.pack_store import PackStore
+from forte.utils.utils import get_class
 
 __all__ = [
     'RawDataDeserializeReader',
     'RecursiveDirectoryDeserializeReader',
     'DirPackReader',
+    'PackStoreReader',
     'MultiPackDiskReader',
 ]
 
 
+def read_pack_file(path: str) -> Union[str, bytes]:
+    r"""Read the serialized pack stored in ``path``. Packs serialized with the
+    binary method are returned as bytes, others are returned as strings.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return data if is_binary_pack(data) else data.decode('utf-8')
+
+
 class BaseDeserializeReader(PackReader, ABC):
+    def __init__(self):
+        super().__init__()
+        self._entry_types: Optional[List[Type[Entry]]] = None
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self._entry_types = None
+        if self.configs.entry_types is not None:
+            self._entry_types = [
+                get_class(t) for t in self.configs.entry_types]
+
     # pylint: disable=unused-argument
     def _cache_key_function(self, collection) -> str:
         return "cached_string_file"
 
-    def _parse_pack(self, data_source: str) -> Iterator[DataPack]:
+    def _parse_pack(self, data_source: Union[str, bytes]
+                    ) -> Iterator[DataPack]:
         if data_source is None:
             raise ProcessExecutionException(
                 "Data source is None, cannot deserialize.")
 
         # pack: DataPack = DataPack.deserialize(data_source)
-        pack: DataPack = deserialize(self._pack_manager, data_source)
+        pack: DataPack = deserialize(
+            self._pack_manager, data_source, self._entry_types,
+            self.configs.lazy_load)
 
         if pack is None:
             raise ProcessExecutionException(
@@ -51,13 +79,36 @@ class BaseDeserializeReader(PackReader, ABC):
 
         yield pack
 
+    @classmethod
+    def default_configs(cls):
+        """
+        Defaults configs for the deserialize readers.
+
+        Here:
+
+          - "entry_types": A list of entry type names. If provided, only the
+            entries of these types (and their sub-types) are read from the
+            packs serialized with the binary method.
+          - "lazy_load": Whether to decode the entries of the packs serialized
+            with the binary method only when they are first requested.
+
+        Returns: The default configuration of deserialize readers.
+        """
+        config = super().default_configs()
+        config.update({
+            "entry_types": None,
+            "lazy_load": False,
+        })
+        return config
+
 
 class RawDataDeserializeReader(BaseDeserializeReader):
     """
     This reader assumes the data passed in are raw DataPack strings.
     """
 
-    def _collect(self, data_list: List[str]) -> Iterator[str]:  # type: ignore
+    def _collect(self, data_list: List[Union[str, bytes]]  # type: ignore
+                 ) -> Iterator[Union[str, bytes]]:
         yield from data_list
 
 
@@ -67,7 +118,8 @@ class RecursiveDirectoryDeserializeReader(BaseDeserializeReader):
     a DataPack.
     """
 
-    def _collect(self, data_dir: str) -> Iterator[str]:  # type: ignore
+    def _collect(self, data_dir: str  # type: ignore
+                 ) -> Iterator[Union[str, bytes]]:
         """
         This function will collect the files of the given directory. If the
          'suffix' field in the config is set, it will only take files matching
@@ -84,14 +136,71 @@ class RecursiveDirectoryDeserializeReader(BaseDeserializeReader):
             for file in files:
                 if not self.configs.suffix or file.endswith(
                         self.configs.suffix):
-                    with open(os.path.join(root, file)) as f:
-                        yield f.read()
+                    yield read_pack_file(os.path.join(root, file))
 
     @classmethod
     def default_configs(cls):
-        return {
+        config = super().default_configs()
+        config.update({
             "suffix": ".json"
-        }
+        })
+        return config
+
+
+class PackStoreReader(BaseDeserializeReader):
+    """
+    This reader reads the DataPacks from a
+    :class:`~forte.data.pack_store.PackStore`. Only the selected packs are
+    read and decoded, see :func:`~forte.data.readers.PackStoreReader
+    .default_configs` for the selection options.
+    """
+
+    def _collect(self, store_path: str  # type: ignore
+                 ) -> Iterator[Union[str, bytes]]:
+        """
+        This function will collect the selected packs in the store.
+
+        Args:
+            store_path: The directory of the pack store.
+
+        Returns:
+
+        """
+        with PackStore(store_path) as store:
+            if self.configs.pack_ids is not None:
+                for pid in self.configs.pack_ids:
+                    yield store.raw(store.position_of(pid))
+            elif self.configs.pack_names is not None:
+                for name in self.configs.pack_names:
+                    for position in store.positions_of_name(name):
+                        yield store.raw(position)
+            else:
+                yield from store.iter_raw(self.configs.start, self.configs.end)
+
+    @classmethod
+    def default_configs(cls):
+        """
+        Defaults configs for the pack store reader.
+
+        Here:
+
+          - "pack_ids": A list of pack ids to be read in this order.
+          - "pack_names": A list of pack names to be read, all the packs with
+            these names are read. Only used if "pack_ids" is None.
+          - "start", "end": If both of above are None, the packs from
+            position "start" to "end" (exclusive) in the store are read.
+            "end" can be None to read to the end of the store.
+
+        Returns: The default configuration of pack store reader.
+        """
+        config = super().default_configs()
+        config.update({
+            "pack_ids": None,
+            "pack_names": None,
+            "start": 0,
+            "end": None,
+        })
+        return config
 
 
 class MultiPackDiskReader(MultiPackReader):
@@ -102,18 +211,31 @@ class MultiPackDiskReader(MultiPackReader):
 
     in this format, the DataPacks are serialized on the side, and the Multipack
     contains references to them. The reader here assemble these information
-    together.
+    together. The packs can be either stored as individual files indexed by
+    `pack.idx` and `multi.idx`, or in two
+    :class:`~forte.data.pack_store.PackStore` when the writer sets
+    `use_pack_store`.
     """
 
     def __init__(self):
         super().__init__()
         self.__pack_index: Dict[int, str] = {}
+        self.__pack_store: Optional[PackStore] = None
+        self.__multi_store: Optional[PackStore] = None
 
     def initialize(self, resources: Resources, configs: Config):
         super().initialize(resources, configs)
-        self.__get_pack_paths()
+        self.__close_stores()
 
-    def _collect(self) -> Iterator[str]:  # type: ignore
+        pack_store_path = os.path.join(self.configs.data_path, 'packs')
+        multi_store_path = os.path.join(self.configs.data_path, 'multi')
+        if PackStore.is_store(multi_store_path):
+            self.__pack_store = PackStore(pack_store_path)
+            self.__multi_store = PackStore(multi_store_path)
+        else:
+            self.__get_pack_paths()
+
+    def _collect(self) -> Iterator[Union[str, bytes]]:  # type: ignore
         """
         This collect actually do not need any data source, it directly read
         the data from the configurations.
@@ -121,6 +243,10 @@ class MultiPackDiskReader(MultiPackReader):
         Returns:
 
         """
+        if self.__multi_store is not None:
+            yield from self.__multi_store.iter_raw()
+            return
+
         multi_idx_path = os.path.join(self.configs.data_path, 'multi.idx')
 
         if not os.path.exists(multi_idx_path):
@@ -131,32 +257,33 @@ class MultiPackDiskReader(MultiPackReader):
         with open(multi_idx_path) as multi_idx:
             for line in multi_idx:
                 _, multi_path = line.strip().split()
-                yield multi_path
+                yield read_pack_file(
+                    os.path.join(self.configs.data_path, multi_path))
 
-    def _parse_pack(self, multi_pack_path: str) -> Iterator[MultiPack]:
+    def _parse_pack(self, multi_pack_data: Union[str, bytes]
+                    ) -> Iterator[MultiPack]:
         # pylint: disable=protected-access
-        with open(os.path.join(
-                self.configs.data_path, multi_pack_path)) as m_data:
-            # m_pack: MultiPack = MultiPack.deserialize(m_data.read())
-            m_pack: MultiPack = deserialize(self._pack_manager, m_data.read())
-
-            for pid in m_pack._pack_ref:
-                sub_pack_path = self.__pack_index[pid]
-                if self._pack_manager.get_remapped_id(pid) >= 0:
-                    # This pid is already been read.
-                    continue
-
-                with open(os.path.join(
-                        self.configs.data_path, sub_pack_path)) as pack_data:
-                    # pack: DataPack = DataPack.deserialize(pack_data.read())
-                    pack: DataPack = deserialize(self._pack_manager,
-                                                 pack_data.read())
-
-                    # Add a reference count to this pack, because the multipack
-                    # needs it.
-                    self._pack_manager.reference_pack(pack)
-            m_pack.realign_packs()
-            yield m_pack
+        m_pack: MultiPack = deserialize(self._pack_manager, multi_pack_data)
+
+        for pid in m_pack._pack_ref:
+            if self._pack_manager.get_remapped_id(pid) >= 0:
+                # This pid is already been read.
+                continue
+
+            pack: DataPack = deserialize(
+                self._pack_manager, self.__read_sub_pack(pid))
+
+            # Add a reference count to this pack, because the multipack
+            # needs it.
+            self._pack_manager.reference_pack(pack)
+        m_pack.realign_packs()
+        yield m_pack
+
+    def __read_sub_pack(self, pid: int) -> Union[str, bytes]:
+        if self.__pack_store is not None:
+            return self.__pack_store.raw(self.__pack_store.position_of(pid))
+        return read_pack_file(
+            os.path.join(self.configs.data_path, self.__pack_index[pid]))
 
     def __get_pack_paths(self):
         pack_idx_path = os.path.join(self.configs.data_path, 'pack.idx')
@@ -178,6 +305,17 @@ class MultiPackDiskReader(MultiPackReader):
             "data_path": None
         }
 
+    def finish(self, resources: Resources):
+        super().finish(resources)
+        self.__close_stores()
+
+    def __close_stores(self):
+        for store in (self.__pack_store, self.__multi_store):
+            if store is not None:
+                store.close()
+        self.__pack_store = None
+        self.__multi_store = None
+
     def _cache_key_function(self, collection: Any) -> str:
         pass
 
@@ -15,7 +15,7 @@
 Conditional random field.
 Adapted from AllenNLP but removed the feature of external restriction
 """
-from typing import Optional, List, Tuple, Dict, Union
+from typing import Optional, List, Tuple, Dict
 import logging
 
 import torch
@@ -235,6 +235,10 @@ class ConditionalRandomField(torch.nn.Module):
             self.start_transitions = torch.nn.Parameter(torch.Tensor(num_tags))
             self.end_transitions = torch.nn.Parameter(torch.Tensor(num_tags))
 
+        # The cached transition matrix used in decoding.
+        self._transitions_key: Optional[Tuple] = None
+        self._transitions_cache: Optional[torch.Tensor] = None
+
         self.reset_parameters()
 
     def reset_parameters(self):
@@ -285,9 +289,8 @@ class ConditionalRandomField(torch.nn.Module):
             # the current_tag dimension
             # of ``inner``. Otherwise (mask == 0) we want to retain the
             # previous alpha.
-            alpha = torch.logsumexp(inner, 1) * mask[i].view(
-                batch_size, 1
-            ) + alpha * (1 - mask[i]).view(batch_size, 1)
+            mask_i = mask[i].view(batch_size, 1)
+            alpha = torch.logsumexp(inner, 1) * mask_i + alpha * (1 - mask_i)
 
         # Every sequence needs to end with a transition to the stop_tag.
         if self.include_start_end_transitions:
@@ -313,12 +316,10 @@ class ConditionalRandomField(torch.nn.Module):
 
         # Start with the transition scores from start_tag to the first tag in
         # each input
-        score: Union[float, torch.Tensor]
-
         if self.include_start_end_transitions:
             score = self.start_transitions.index_select(0, tags[0])
         else:
-            score = 0.0
+            score = logits.new_zeros(batch_size)
 
         # Add up the scores for the observed transitions and all the inputs
         # but the last
@@ -352,14 +353,12 @@ class ConditionalRandomField(torch.nn.Module):
         )
 
         # Compute score of transitioning to `stop_tag` from each "last tag".
-        last_transition_score: Union[float, torch.Tensor]
-
         if self.include_start_end_transitions:
             last_transition_score = self.end_transitions.index_select(
                 0, last_tags
             )
         else:
-            last_transition_score = 0.0
+            last_transition_score = logits.new_zeros(batch_size)
 
         # Add the last input if it's not masked.
         last_inputs = logits[-1]  # (batch_size, num_tags)
@@ -387,81 +386,117 @@ class ConditionalRandomField(torch.nn.Module):
 
         return torch.sum(log_numerator - log_denominator)
 
-    def viterbi_tags(self, logits: torch.Tensor,
-                     mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+    def _constrained_transitions(self) -> torch.Tensor:
         """
-        Uses viterbi algorithm to find most likely tags for the given inputs.
-        If constraints are applied, disallows all other transitions.
+        Returns the ``(num_tags + 2, num_tags + 2)`` transition matrix used in
+        decoding, augmented with the start and end tags, where the disallowed
+        transitions are set to -10000. The matrix is cached until the
+        parameters are changed.
         """
-        _, max_seq_length, num_tags = logits.size()
-
-        # Get the tensors out of the variables
-        logits, mask = logits.data, mask.data
+        num_tags = self.num_tags
+        params = [self.transitions, self._constraint_mask]
+        if self.include_start_end_transitions:
+            params.extend([self.start_transitions, self.end_transitions])
+        # The version of a tensor is increased by the in-place updates, such
+        # as the optimizer steps and loading the state dict, and the data
+        # pointer is changed when the module is moved.
+        # pylint: disable=protected-access
+        key = tuple((p.data_ptr(), p._version) for p in params)
+        if self._transitions_cache is not None and \
+                self._transitions_key == key:
+            return self._transitions_cache
 
         # Augment transitions matrix with start and end transitions
         start_tag = num_tags
         end_tag = num_tags + 1
-        transitions = torch.Tensor(num_tags + 2, num_tags + 2).fill_(-10000.0)
+        constraint_mask = self._constraint_mask.detach()
+        transitions = self.transitions.detach().new_full(
+            (num_tags + 2, num_tags + 2), -10000.0)
 
         # Apply transition constraints
-        constrained_transitions = self.transitions * self._constraint_mask[
-                                                     :num_tags, :num_tags
-                                                     ] + -10000.0 * (
-                                          1 - self._constraint_mask[
-                                              :num_tags, :num_tags])
-        transitions[:num_tags, :num_tags] = constrained_transitions.data
+        transitions[:num_tags, :num_tags] = \
+            self.transitions.detach() * constraint_mask[:num_tags, :num_tags] \
+            + -10000.0 * (1 - constraint_mask[:num_tags, :num_tags])
 
         if self.include_start_end_transitions:
-            transitions[
-            start_tag, :num_tags
-            ] = self.start_transitions.detach() * self._constraint_mask[
-                                                  start_tag, :num_tags
-                                                  ].data + -10000.0 * (
-                        1 - self._constraint_mask[start_tag, :num_tags].detach()
-                )
-            transitions[
-            :num_tags, end_tag
-            ] = self.end_transitions.detach() * self._constraint_mask[
-                                                :num_tags, end_tag
-                                                ].data + -10000.0 * (
-                        1 - self._constraint_mask[:num_tags, end_tag].detach()
-                )
+            transitions[start_tag, :num_tags] = \
+                self.start_transitions.detach() * \
+                constraint_mask[start_tag, :num_tags] + \
+                -10000.0 * (1 - constraint_mask[start_tag, :num_tags])
+            transitions[:num_tags, end_tag] = \
+                self.end_transitions.detach() * \
+                constraint_mask[:num_tags, end_tag] + \
+                -10000.0 * (1 - constraint_mask[:num_tags, end_tag])
         else:
-            transitions[start_tag, :num_tags] = -10000.0 * (
-                    1 - self._constraint_mask[start_tag, :num_tags].detach()
-            )
-            transitions[:num_tags, end_tag] = -10000.0 * (
-                    1 - self._constraint_mask[:num_tags, end_tag].detach()
-            )
+            transitions[start_tag, :num_tags] = \
+                -10000.0 * (1 - constraint_mask[start_tag, :num_tags])
+            transitions[:num_tags, end_tag] = \
+                -10000.0 * (1 - constraint_mask[:num_tags, end_tag])
 
-        best_paths = []
-        # Pad the max sequence length by 2 to account for start_tag + end_tag.
-        tag_sequence = torch.Tensor(max_seq_length + 2, num_tags + 2)
-
-        for prediction, prediction_mask in zip(logits, mask):
-            sequence_length = torch.sum(prediction_mask)
-
-            # Start with everything totally unlikely
-            tag_sequence.fill_(-10000.0)
-            # At timestep 0 we must have the START_TAG
-            tag_sequence[0, start_tag] = 0.0
-            # At steps 1, ..., sequence_length we just use the
-            # incoming prediction
-            tag_sequence[1:(sequence_length + 1), :num_tags] = prediction[
-                                                               :sequence_length
-                                                               ]
-            # And at the last timestep we must have the END_TAG
-            tag_sequence[sequence_length + 1, end_tag] = 0.0
-
-            # We pass the tags and the transitions to ``viterbi_decode``.
-            viterbi_path, viterbi_score = viterbi_decode(
-                tag_sequence[: (sequence_length + 2)], transitions
-            )
-            # Get rid of START and END sentinels and append.
-            viterbi_path = viterbi_path[1:-1]
-            best_paths.append((viterbi_path, viterbi_score.item()))
+        self._transitions_key = key
+        self._transitions_cache = transitions
+        return transitions
+
+    def viterbi_tags(self, logits: torch.Tensor,
+                     mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+        """
+        Uses viterbi algorithm to find most likely tags for the given inputs.
+        If constraints are applied, disallows all other transitions.
+
+        The sequences in the batch are decoded together, which gives the same
+        paths and scores as decoding each of them with ``viterbi_decode``.
+        """
+        batch_size, max_seq_length, num_tags = logits.size()
+        start_tag = num_tags
+        end_tag = num_tags + 1
 
-        return best_paths
+        transitions = self._constrained_transitions()
+        logits = logits.detach().to(transitions)
+        lengths = mask.detach().sum(1).long().to(transitions.device)
+
+        # The scores of the tags at each step, where the start and end tags
+        # are totally unlikely.
+        emissions = transitions.new_full(
+            (batch_size, max_seq_length, num_tags + 2), -10000.0)
+        emissions[:, :, :num_tags] = logits
+
+        # At timestep 0 we must have the START_TAG
+        path_scores = transitions.new_full(
+            (batch_size, num_tags + 2), -10000.0)
+        path_scores[:, start_tag] = 0.0
+
+        # After the end of a sequence, the scores are kept and each tag points
+        # back to itself.
+        identity = torch.arange(
+            num_tags + 2, device=transitions.device).expand(batch_size, -1)
+        path_indices = []
+        for timestep in range(max_seq_length):
+            # (batch_size, from_tag, to_tag)
+            summed_potentials = path_scores.unsqueeze(-1) + transitions
+            scores, paths = torch.max(summed_potentials, 1)
+            active = lengths.gt(timestep).unsqueeze(-1)
+            path_scores = torch.where(
+                active, emissions[:, timestep] + scores, path_scores)
+            path_indices.append(torch.where(active, paths, identity))
+
+        # And at the last timestep we must have the END_TAG
+        end_scores = transitions.new_full((num_tags + 2,), -10000.0)
+        end_scores[end_tag] = 0.0
+        scores, paths = torch.max(path_scores.unsqueeze(-1) + transitions, 1)
+        viterbi_scores, best_tags = torch.max(end_scores + scores, 1)
+
+        # Construct the most likely sequences backwards, the END_TAG is not
+        # included.
+        best_tags = paths.gather(1, best_tags.unsqueeze(-1))
+        best_paths = [best_tags]
+        for backward_timestep in reversed(path_indices[1:]):
+            best_tags = backward_timestep.gather(1, best_tags)
+            best_paths.append(best_tags)
+        best_paths.reverse()
+        tags = torch.cat(best_paths, 1).tolist()
+
+        return [(path[:length], score) for path, length, score in zip(
+            tags, lengths.tolist(), viterbi_scores.tolist())]
 
 
 def viterbi_decode(tag_sequence: torch.Tensor, transition_matrix: torch.Tensor,
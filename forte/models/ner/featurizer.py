@@ -0,0 +1,185 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Turn the words of the NER instances into the id tensors of the model.
+"""
+import functools
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+
+from forte.models.ner.utils import normalize_digit_word, MAX_CHAR_LENGTH, \
+    NUM_CHAR_PAD
+
+__all__ = [
+    "NERFeaturizer",
+    "pad_ids",
+]
+
+# The word ids and the char ids of each word of a sentence.
+NERInstance = Tuple[np.ndarray, List[np.ndarray]]
+
+
+def pad_ids(sequences: Sequence[Union[Sequence[int], np.ndarray]],
+            pad_id: int) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Pad the id sequences into a single array.
+
+    Args:
+        sequences: The id sequences.
+        pad_id: The id used for padding.
+
+    Returns:
+        A tuple of the array of shape `[batch_size, batch_length]` and the
+        boolean mask of the same shape, where `True` marks the ids that are
+        not padding.
+    """
+    lengths = np.fromiter((len(s) for s in sequences), dtype=np.int64,
+                          count=len(sequences))
+    batch_length = int(lengths.max()) if len(sequences) else 0
+    mask = np.arange(batch_length) < lengths[:, None]
+
+    ids = np.full([len(sequences), batch_length], pad_id, dtype=np.int64)
+    if batch_length:
+        ids[mask] = np.concatenate([np.asarray(s, dtype=np.int64)
+                                    for s in sequences])
+    return ids, mask
+
+
+class NERFeaturizer:
+    r"""Encode the words of the NER instances with the word and the char
+    alphabets, and build the padded tensors of a batch.
+
+    The ids of the words and the chars of the words are cached, so the
+    frequent words are only looked up once across batches and epochs. Each
+    cache keeps at most ``cache_size`` of the most recently used words.
+
+    Note that an alphabet that is closed gives the unknown id to the new
+    words, which is cached as well, so :meth:`clear_cache` should be called
+    if the alphabets are changed afterwards.
+
+    Args:
+        word_alphabet: The alphabet of the words.
+        char_alphabet: The alphabet of the characters.
+        normalize_func: The function to normalize the words before looking
+            up the word ids.
+        max_char_length: The maximum number of characters of a word, the
+            longer words are truncated.
+        num_char_pad: The number of extra paddings of the chars of each word.
+        cache_size (int, optional): The maximum number of words in each cache.
+            If `None`, the caches are not bounded.
+    """
+
+    def __init__(self, word_alphabet, char_alphabet,
+                 normalize_func: Callable[[str], str] = normalize_digit_word,
+                 max_char_length: int = MAX_CHAR_LENGTH,
+                 num_char_pad: int = NUM_CHAR_PAD,
+                 cache_size: Optional[int] = 100000):
+        self.word_alphabet = word_alphabet
+        self.char_alphabet = char_alphabet
+        self.normalize_func = normalize_func
+        self.max_char_length = max_char_length
+        self.num_char_pad = num_char_pad
+
+        self.word_id: Callable[[str], int] = functools.lru_cache(
+            maxsize=cache_size)(self._word_id)
+        self.char_ids: Callable[[str], np.ndarray] = functools.lru_cache(
+            maxsize=cache_size)(self._char_ids)
+
+    def _word_id(self, word: str) -> int:
+        return self.word_alphabet.get_index(self.normalize_func(word))
+
+    def _char_ids(self, word: str) -> np.ndarray:
+        char_ids = np.fromiter(
+            (self.char_alphabet.get_index(char)
+             for char in word[:self.max_char_length]),
+            dtype=np.int64)
+        # The arrays are shared through the cache.
+        char_ids.flags.writeable = False
+        return char_ids
+
+    def clear_cache(self):
+        r"""Clear the cached ids of the words."""
+        self.word_id.cache_clear()
+        self.char_ids.cache_clear()
+
+    def encode(self, words: Sequence[str]) -> NERInstance:
+        r"""Encode the words of a sentence.
+
+        Args:
+            words: The words of the sentence.
+
+        Returns:
+            A tuple of the array of the word ids, and the arrays of the char
+            ids of each word, truncated to ``max_char_length``.
+        """
+        word_ids = np.fromiter((self.word_id(word) for word in words),
+                               dtype=np.int64, count=len(words))
+        return word_ids, [self.char_ids(word) for word in words]
+
+    def get_batch_tensor(
+            self, data: Sequence[NERInstance],
+            device: Optional[torch.device] = None) -> \
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Get the tensors to be fed into the model.
+
+        Args:
+            data: A list of tuple (word_ids, char_id_sequences), as returned
+                by :meth:`encode`.
+            device: The device for the tensors.
+
+        Returns:
+            A tuple where
+
+            - ``words``: A tensor of shape `[batch_size, batch_length]`
+              representing the word ids in the batch
+            - ``chars``: A tensor of shape
+              `[batch_size, batch_length, char_length]` representing the char
+              ids for each word in the batch
+            - ``masks``: A tensor of shape `[batch_size, batch_length]`
+              representing the indices to be masked in the batch. 1 indicates
+              no masking.
+            - ``lengths``: A tensor of shape `[batch_size]` representing the
+              length of each sentences in the batch
+        """
+        wid_inputs, mask = pad_ids([d[0] for d in data],
+                                   self.word_alphabet.pad_id)
+        batch_size, batch_length = wid_inputs.shape
+        lengths = mask.sum(axis=1)
+
+        cid_seqs = [cids for d in data for cids in d[1]]
+        char_lengths = np.fromiter((len(cids) for cids in cid_seqs),
+                                   dtype=np.int64, count=len(cid_seqs))
+        char_length = int(char_lengths.max()) if len(cid_seqs) else 0
+        char_length = min(self.max_char_length,
+                          char_length + self.num_char_pad)
+
+        # Scatter the chars of all the words at once: the words are placed at
+        # the unmasked positions, and the chars at the start of the words.
+        cid_inputs = np.full([batch_size * batch_length, char_length],
+                             self.char_alphabet.pad_id, dtype=np.int64)
+        if char_lengths.sum():
+            rows = np.repeat(np.flatnonzero(mask), char_lengths)
+            starts = np.cumsum(char_lengths) - char_lengths
+            cols = np.arange(len(rows)) - np.repeat(starts, char_lengths)
+            cid_inputs[rows, cols] = np.concatenate(cid_seqs)
+        cid_inputs = cid_inputs.reshape(
+            [batch_size, batch_length, char_length])
+
+        words = torch.from_numpy(wid_inputs).to(device)
+        chars = torch.from_numpy(cid_inputs).to(device)
+        masks = torch.from_numpy(mask.astype(np.float32)).to(device)
+        lengths = torch.from_numpy(lengths).to(device)
+
+        return words, chars, masks, lengths
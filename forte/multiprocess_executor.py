@@ -0,0 +1,232 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Execute a chain of pack processors in a pool of worker processes.
+
+The reader runs in the main process, each pack is serialized with the binary
+method and sent to a worker, which holds its own initialized copy of the
+processors. The processed pack is serialized again and sent back. The packs
+keep the ids assigned by the pack manager of the main process.
+"""
+import multiprocessing
+import queue
+from multiprocessing import util
+from multiprocessing.pool import Pool
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from forte.common.configuration import Config
+from forte.common.exception import ProcessExecutionException, \
+    ProcessorConfigError
+from forte.common.resources import Resources
+from forte.data.binary_format import deserialize_binary
+from forte.data.data_pack import DataPack
+from forte.data.selector import DummySelector, Selector
+from forte.pack_manager import PackManager
+from forte.pipeline_component import PipelineComponent
+from forte.process_manager import ProcessManager
+from forte.processors.base.pack_processor import PackProcessor
+
+__all__ = [
+    "MultiProcessExecutor",
+]
+
+
+class _WorkerState:
+    r"""The processors held by a worker process."""
+
+    def __init__(self, components: List[PackProcessor],
+                 configs: List[Config], resource: Resources):
+        self.components = components
+        self.resource = resource
+        self.pack_manager = PackManager()
+
+        process_manager = ProcessManager(len(components))
+        for component, config in zip(components, configs):
+            component.assign_manager(process_manager, self.pack_manager)
+            component.initialize(resource, config)
+
+    def process(self, data: bytes) -> bytes:
+        pack: DataPack = _load_pack(data, self.pack_manager)
+        for component in self.components:
+            # This follows `BaseProcessor.process`, without the job status
+            # bookkeeping of the process manager.
+            # pylint: disable=protected-access
+            pack.set_control_component(component.name)
+            component._process(pack)
+            pack.add_all_remaining_entries()
+        return pack.serialize_binary()
+
+    def finish(self):
+        for component in self.components:
+            component.finish(self.resource)
+
+
+# The state of the current worker process.
+_worker_state: Optional[_WorkerState] = None
+
+
+def _init_worker(components: List[PackProcessor], configs: List[Config],
+                 resource: Resources):
+    global _worker_state  # pylint: disable=global-statement
+    _worker_state = _WorkerState(components, configs, resource)
+    # Finish the processors when the worker exits normally.
+    util.Finalize(None, _worker_state.finish, exitpriority=10)
+
+
+def _process_in_worker(seq: int, data: bytes) -> Tuple[int, bytes]:
+    if _worker_state is None:
+        raise ProcessExecutionException("The worker is not initialized.")
+    return seq, _worker_state.process(data)
+
+
+def _load_pack(data: bytes, pack_manager: PackManager) -> DataPack:
+    # Unlike `data_utils.deserialize`, the pack id is not remapped, so the
+    # pack keeps the id assigned in the main process.
+    pack: DataPack = deserialize_binary(data)
+    pack._pack_manager = pack_manager  # pylint: disable=protected-access
+    return pack
+
+
+class MultiProcessExecutor:
+    r"""Run a chain of :class:`~forte.processors.base.PackProcessor` in a
+    pool of worker processes. Each worker initializes its own copy of the
+    processors, so the processors should not rely on states shared across
+    packs, such as the resources registered by another processor, or the
+    outputs written by the same processor on other packs.
+
+    Args:
+        num_workers: The number of worker processes.
+        max_in_flight (int, optional): The maximum number of packs that are
+            sent to the workers but not yielded yet. This bounds the memory
+            used by the executor. If `None`, `2 * num_workers` is used.
+        ordered: Whether to yield the packs in the order they are read. If
+            False, the packs are yielded as soon as they are processed.
+        start_method (str, optional): The start method of the worker
+            processes, see :mod:`multiprocessing`. If `None`, the default
+            method of the platform is used.
+    """
+
+    def __init__(self, num_workers: int, max_in_flight: Optional[int] = None,
+                 ordered: bool = True, start_method: Optional[str] = None):
+        if num_workers < 1:
+            raise ProcessorConfigError(
+                f"The number of workers should be positive, got "
+                f"{num_workers}.")
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        if max_in_flight < 1:
+            raise ProcessorConfigError(
+                f"The in-flight limit should be positive, got "
+                f"{max_in_flight}.")
+
+        self.num_workers = num_workers
+        self.max_in_flight = max_in_flight
+        self.ordered = ordered
+        self.start_method = start_method
+
+        self._pool: Optional[Pool] = None
+
+    @staticmethod
+    def validate(components: List[PipelineComponent],
+                 selectors: List[Selector]):
+        r"""Check whether the components can be run by this executor."""
+        for component, selector in zip(components, selectors):
+            if not isinstance(component, PackProcessor):
+                raise ProcessorConfigError(
+                    f"Only PackProcessors can be run in multiple processes, "
+                    f"but got {component.name}.")
+            if not isinstance(selector, DummySelector):
+                raise ProcessorConfigError(
+                    f"Selectors are not supported when running in multiple "
+                    f"processes, but {component.name} has "
+                    f"{type(selector).__name__}.")
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    def start(self, components: List[PackProcessor], configs: List[Config],
+              resource: Resources):
+        r"""Start the worker processes, each of them initializes a copy of
+        ``components`` with ``configs`` and ``resource``.
+        """
+        self.shutdown()
+        context = multiprocessing.get_context(self.start_method)
+        self._pool = context.Pool(
+            self.num_workers, initializer=_init_worker,
+            initargs=(components, configs, resource))
+
+    def shutdown(self):
+        r"""Wait for the worker processes to finish their processors and
+        exit."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def process(self, data_iter: Iterator[DataPack],
+                pack_manager: PackManager) -> Iterator[DataPack]:
+        r"""Process the packs from ``data_iter`` in the workers.
+
+        Args:
+            data_iter: The packs to be processed.
+            pack_manager: The pack manager of the main process, which is
+                assigned to the processed packs.
+
+        Returns:
+            An iterator of the processed packs.
+        """
+        if self._pool is None:
+            raise ProcessExecutionException(
+                "The executor is not started, please initialize the pipeline "
+                "first.")
+
+        results: queue.Queue = queue.Queue()
+        # Packs that are processed but cannot be yielded yet, when ordered.
+        finished: Dict[int, DataPack] = {}
+        in_flight = 0
+        next_seq = 0
+
+        def _wait() -> Iterator[DataPack]:
+            nonlocal in_flight, next_seq
+            result: Union[Tuple[int, bytes], BaseException] = results.get()
+            in_flight -= 1
+            if isinstance(result, BaseException):
+                raise ProcessExecutionException(
+                    "Exception occurred when processing a pack in a "
+                    "worker process.") from result
+
+            seq, data = result
+            pack = _load_pack(data, pack_manager)
+            if not self.ordered:
+                yield pack
+                return
+
+            finished[seq] = pack
+            while next_seq in finished:
+                yield finished.pop(next_seq)
+                next_seq += 1
+
+        for seq, pack in enumerate(data_iter):
+            while in_flight + len(finished) >= self.max_in_flight:
+                yield from _wait()
+
+            self._pool.apply_async(
+                _process_in_worker,
+                (seq, pack.serialize_binary()),
+                callback=results.put, error_callback=results.put)
+            in_flight += 1
+
+        while in_flight > 0:
+            yield from _wait()
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
 from collections import Counter
 from typing import Dict, Optional
 
@@ -50,6 +51,35 @@ class PackManager:
         # their new id.
         self.remap: Dict[int, int] = {}
 
+        # The ids and the references may be updated from the threads of
+        # different pipeline stages. Re-entrant since packs may be released
+        # (and dereferenced) by the garbage collector at any point.
+        self._lock = threading.RLock()
+
+        # The number of entries created in each thread, used to profile the
+        # components.
+        self._created_entries = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        state.pop('_created_entries')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._created_entries = threading.local()
+
+    def on_entry_creation(self, num: int = 1):
+        r"""Count ``num`` new entries created in the current thread."""
+        self._created_entries.count = self.num_created_entries + num
+
+    @property
+    def num_created_entries(self) -> int:
+        r"""The number of entries created in the current thread."""
+        return getattr(self._created_entries, 'count', 0)
+
     def reset(self):
         self.__init__()
 
@@ -77,12 +107,13 @@ class PackManager:
 
         pid = get_pack_id(pack)
 
-        # Assign a new id to the pack.
-        if pid not in self.remap:
-            self.remap[pid] = self.next_id
+        with self._lock:
+            # Assign a new id to the pack.
+            if pid not in self.remap:
+                self.remap[pid] = self.next_id
 
-        pack.meta.pack_id = self.remap[pid]  # type: ignore
-        self.next_id += 1
+            pack.meta.pack_id = self.remap[pid]  # type: ignore
+            self.next_id += 1
 
     def get_remapped_id(self, old_id: int) -> int:
         """
@@ -108,8 +139,9 @@ class PackManager:
         """
         # Negative pack id means this is a new pack.
         assert get_pack_id(pack) < 0
-        pack.meta.pack_id = self.next_id  # type: ignore
-        self.next_id += 1
+        with self._lock:
+            pack.meta.pack_id = self.next_id  # type: ignore
+            self.next_id += 1
 
     def reference_pack(self, pack: ContainerType):
         """
@@ -128,8 +160,9 @@ class PackManager:
         """
         pid: int = get_pack_id(pack)
         # Increment the reference and store the pack itself.
-        self.pack_references[pid] += 1
-        self.pack_pool[pid] = pack
+        with self._lock:
+            self.pack_references[pid] += 1
+            self.pack_pool[pid] = pack
 
     def dereference_pack(self, pack_id: int):
         """
@@ -145,25 +178,27 @@ class PackManager:
         Returns:
 
         """
-        if pack_id not in self.pack_references:
-            # This can happen when the instance is reset by the pipeline.
-            return
-
-        if self.pack_references[pack_id] < 0:
-            # I am not sure if there are cases that can deduct the reference
-            # count too much, but we'd put a check here just in case.
-            raise ProcessFlowException(
-                f"Pack reference count for pack [{pack_id}] is only "
-                f"{self.pack_references[pack_id]},"
-                f" which is invalid.")
-
-        # Reduce the reference count.
-        self.pack_references[pack_id] -= 1
-
-        # If the reference count reaches 0, then we can remove the pack from
-        # the pool and allow Python to garbage collect it.
-        if self.pack_references[pack_id] == 0:
-            self.pack_pool.pop(pack_id)
+        with self._lock:
+            if pack_id not in self.pack_references:
+                # This can happen when the instance is reset by the pipeline.
+                return
+
+            if self.pack_references[pack_id] < 0:
+                # I am not sure if there are cases that can deduct the
+                # reference count too much, but we'd put a check here just in
+                # case.
+                raise ProcessFlowException(
+                    f"Pack reference count for pack [{pack_id}] is only "
+                    f"{self.pack_references[pack_id]},"
+                    f" which is invalid.")
+
+            # Reduce the reference count.
+            self.pack_references[pack_id] -= 1
+
+            # If the reference count reaches 0, then we can remove the pack
+            # from the pool and allow Python to garbage collect it.
+            if self.pack_references[pack_id] == 0:
+                self.pack_pool.pop(pack_id)
 
     def get_from_pool(self, pack_id: int) -> ContainerType:
         r"""Return the data pack corresponding to the id.
@@ -17,7 +17,9 @@ Base class for Pipeline module.
 
 import itertools
 import logging
-from typing import Any, Dict, Generic, Iterator, List, Optional, Union, Tuple
+import time
+from typing import Any, Dict, Generic, Iterator, List, Optional, Union, Tuple, \
+    cast
 
 import yaml
 
@@ -28,15 +30,20 @@ from forte.common.exception import ProcessExecutionException, \
 from forte.common.resources import Resources
 from forte.data.base_pack import PackType
 from forte.data.caster import Caster
+from forte.data.data_pack import DataPack
 from forte.data.readers.base_reader import BaseReader
 from forte.data.selector import Selector, DummySelector
 from forte.evaluation.base.base_evaluator import Evaluator
+from forte.multiprocess_executor import MultiProcessExecutor
 from forte.pack_manager import PackManager
 from forte.pipeline_component import PipelineComponent
+from forte.pipeline_stats import PipelineStats
 from forte.process_job import ProcessJob
 from forte.process_manager import ProcessManager, ProcessJobStatus
 from forte.processors.base.base_processor import BaseProcessor
 from forte.processors.base.batch_processor import BaseBatchProcessor
+from forte.processors.base.parallel_processor import ParallelPackProcessor
+from forte.threaded_executor import ThreadedStageExecutor
 from forte.utils import create_class_with_kwargs
 
 logger = logging.getLogger(__name__)
@@ -46,6 +53,14 @@ __all__ = [
 ]
 
 
+def _num_batches(component: Any) -> int:
+    r"""The number of batches predicted by ``component``, or 0 if it is not a
+    batch processor."""
+    if isinstance(component, BaseBatchProcessor):
+        return component.num_batches
+    return 0
+
+
 class ProcessBuffer:
     def __init__(self,
                  pipeline: "Pipeline",
@@ -123,8 +138,115 @@ class Pipeline(Generic[PackType]):
         else:
             self.resource = resource
 
+        # Will run the processors in worker processes if set.
+        self._executor: Optional[MultiProcessExecutor] = None
+
+        # Will run the components in parallel threads if set, each stage is
+        # a sub-pipeline of some consecutive components.
+        self._stage_executor: Optional[ThreadedStageExecutor] = None
+        self._stage_sizes: Optional[List[int]] = None
+        self._stages: List["Pipeline"] = []
+
+        # The runtime statistics, collected since initialization.
+        self._stats: PipelineStats = PipelineStats()
+
         self.initialized: bool = False
 
+    def set_multiprocessing(self, num_workers: int,
+                            max_in_flight: Optional[int] = None,
+                            ordered: bool = True,
+                            start_method: Optional[str] = None):
+        r"""Run the processors in a pool of worker processes, while the
+        reader runs in the current process. Each worker initializes its own
+        copy of the processors, and the packs are sent to the workers with
+        the binary serialization. Only pipelines of
+        :class:`~forte.processors.base.PackProcessor` are supported, and the
+        processors should not share states across packs. See
+        :class:`~forte.multiprocess_executor.MultiProcessExecutor` for the
+        arguments.
+
+        This need to be called before :meth:`initialize`. Set ``num_workers``
+        to 0 to process in the current process again.
+        """
+        if num_workers == 0:
+            self._executor = None
+        else:
+            self._executor = MultiProcessExecutor(
+                num_workers, max_in_flight, ordered, start_method)
+
+    def set_threaded_stages(self, stage_sizes: Optional[List[int]] = None,
+                            queue_size: int = 2):
+        r"""Run the reader and the components in parallel threads. The
+        components are split into stages of consecutive components, each
+        stage runs in its own thread and passes the packs to the next stage
+        through a bounded queue. This allows, for example, the reader to read
+        the next packs while a model runs on the current ones, since I/O and
+        most of the tensor operations release the GIL. The order of the packs
+        is preserved. Evaluators are not supported in this mode.
+
+        This need to be called before :meth:`initialize`.
+
+        Args:
+            stage_sizes (list, optional): The number of components in each
+                stage, which should sum up to the number of components. If
+                `None`, each component runs in its own stage. Set it to an
+                empty list to process in the current thread again.
+            queue_size: The capacity of the queues between the stages, a
+                stage blocks when its output queue is full.
+        """
+        if stage_sizes is not None and len(stage_sizes) == 0:
+            self._stage_executor = None
+            self._stage_sizes = None
+        else:
+            self._stage_executor = ThreadedStageExecutor(queue_size)
+            self._stage_sizes = stage_sizes
+
+    def set_stats_report(self, interval: Optional[float],
+                         dump_path: Optional[str] = None):
+        r"""Report the statistics of the pipeline (see :meth:`stats`) every
+        ``interval`` seconds while the pipeline is running, and when a run
+        finishes. The statistics are logged at INFO level, and also written
+        to ``dump_path`` as JSON if it is given. Set ``interval`` to `None` to
+        stop reporting.
+        """
+        self._stats.set_report(interval, dump_path)
+
+    def stats(self) -> Dict[str, Any]:
+        r"""Get the runtime statistics collected since the pipeline is
+        initialized, which contain the number of packs and the throughput of
+        the pipeline, and for the reader and each component:
+
+          - `calls`, `packs`, `entries`: the number of calls, processed packs
+            and entries added to the packs after the component is called. The
+            calls of a batch processor are the batches it predicts.
+          - `wall_time`, `cpu_time`: the time (in seconds) spent in the
+            component.
+          - `select_time`: the time spent in the selector.
+          - `index_time`: the time spent to add the new entries to the packs.
+          - `queued_time`: the total time the jobs wait for the batches of the
+            component.
+          - `peak_queue_length`: the maximum number of jobs in the queue of
+            the component.
+          - `packs_per_sec`, `entries_per_sec`: the throughput of the
+            component.
+
+        When running with :meth:`set_multiprocessing`, the components run in
+        the worker processes so only the statistics of the reader and the
+        pipeline are collected.
+
+        Returns:
+            A dictionary of the statistics, which can be dumped as JSON.
+        """
+        return self._stats.to_dict()
+
+    def _peak_queue_lengths(self) -> List[int]:
+        if self._stage_executor is not None:
+            managers = [stage._proc_mgr for stage in self._stages]
+        else:
+            managers = [self._proc_mgr]
+        return list(itertools.chain.from_iterable(
+            m.peak_queue_lengths for m in managers if m is not None))
+
     def init_from_config_path(self, config_path):
         r"""Read the configurations from the given path ``config_path``
         and build the pipeline with the config.
@@ -165,11 +287,27 @@ class Pipeline(Generic[PackType]):
     def initialize(self):
         # The process manager need to be assigned first.
         self._proc_mgr = ProcessManager(len(self._components))
+        self._stats.reset([c.name for c in self.components],
+                          self._peak_queue_lengths)
 
         self._reader.assign_manager(self._proc_mgr, self._pack_manager)
 
         self._reader.initialize(self.resource, self._reader_config)
-        self.initialize_processors()
+        if self._executor is not None and self._stage_executor is not None:
+            raise ProcessFlowException(
+                "Multiprocessing and threaded stages cannot be used at the "
+                "same time.")
+
+        if self._stage_executor is not None:
+            self._stages = self._build_stages()
+        elif self._executor is None:
+            self.initialize_processors()
+        else:
+            # The processors are initialized in the worker processes.
+            self._executor.validate(self.components, self._selectors)
+            self._pack_manager.reset_remap()
+            self._executor.start(
+                self.components, self.processor_configs, self.resource)
 
         self.initialized = True
 
@@ -184,6 +322,45 @@ class Pipeline(Generic[PackType]):
                               "processor %s", processor.name)
                 raise e
 
+    def _build_stages(self) -> List["Pipeline"]:
+        r"""Split the components into the stages and initialize them, each
+        stage has its own process manager to track its jobs.
+        """
+        if len(self.evaluator_indices) > 0:
+            raise ProcessorConfigError(
+                "Evaluators are not supported in threaded stages.")
+
+        stage_sizes = self._stage_sizes
+        if stage_sizes is None:
+            stage_sizes = [1] * len(self.components)
+        if (sum(stage_sizes) != len(self.components)
+                or any(s <= 0 for s in stage_sizes)):
+            raise ProcessorConfigError(
+                f"The stage sizes {stage_sizes} do not split the "
+                f"{len(self.components)} components.")
+
+        self._pack_manager.reset_remap()
+        stages: List[Pipeline] = []
+        begin = 0
+        for size in stage_sizes:
+            end = begin + size
+            stage: Pipeline = Pipeline(self.resource)
+            stage._pack_manager = self._pack_manager
+            stage._components = self._components[begin:end]
+            stage._configs = self._configs[begin:end]
+            stage._selectors = self._selectors[begin:end]
+            stage._proc_mgr = ProcessManager(size)
+            # The stages collect the statistics into this pipeline.
+            stage._stats.components = self._stats.components[begin:end]
+            for processor, config in zip(stage.components,
+                                         stage.processor_configs):
+                processor.assign_manager(stage._proc_mgr, self._pack_manager)
+                processor.initialize(self.resource, config)
+            stage.initialized = True
+            stages.append(stage)
+            begin = end
+        return stages
+
     def set_reader(self, reader: BaseReader,
                    config: Optional[Union[Config, Dict[str, Any]]] = None):
         self._reader = reader
@@ -278,12 +455,13 @@ class Pipeline(Generic[PackType]):
 
         first_pack = []
 
-        for p in self._reader.iter(*args, **kwargs):
+        for p in self._stats.reader.timed(self._reader.iter(*args, **kwargs)):
             first_pack.append(p)
             break
 
         if len(first_pack) == 1:
-            results = list(self._process_packs(iter(first_pack)))
+            results = list(self._stats.track(
+                self._process_packs(iter(first_pack))))
             return results[0]
         else:
             raise ValueError("Input data source contains no packs.")
@@ -297,8 +475,9 @@ class Pipeline(Generic[PackType]):
             raise ProcessFlowException(
                 "Please call initialize before running the pipeline")
 
-        data_iter = self._reader.iter(*args, **kwargs)
-        return self._process_packs(data_iter)
+        data_iter = self._stats.reader.timed(
+            self._reader.iter(*args, **kwargs))
+        return self._stats.track(self._process_packs(data_iter))
 
     def finish(self):
         """
@@ -309,8 +488,12 @@ class Pipeline(Generic[PackType]):
 
         """
         self.reader.finish(self.resource)
-        for p in self.components:
-            p.finish(self.resource)
+        if self._executor is not None and self._executor.started:
+            # The workers finish their own processors before exiting.
+            self._executor.shutdown()
+        else:
+            for p in self.components:
+                p.finish(self.resource)
         self._pack_manager.reset()
 
     def _process_packs(
@@ -439,6 +622,18 @@ class Pipeline(Generic[PackType]):
             # Write return here instead of using if..else to reduce indent.
             return
 
+        if self._executor is not None:
+            # The executor only runs pack processors (checked in
+            # `initialize`), so the packs are data packs.
+            yield from cast(Iterator[PackType], self._executor.process(
+                cast(Iterator[DataPack], data_iter), self._pack_manager))
+            return
+
+        if self._stage_executor is not None:
+            yield from self._stage_executor.process(
+                data_iter, [stage._process_packs for stage in self._stages])
+            return
+
         while not self._proc_mgr.exhausted():
             # job has to be the first UNPROCESSED element
             # the status of the job now is UNPROCESSED
@@ -447,6 +642,7 @@ class Pipeline(Generic[PackType]):
             processor_index = self._proc_mgr.current_processor_index
             processor = self.components[processor_index]
             selector = self._selectors[processor_index]
+            component_stats = self._stats.components[processor_index]
             current_queue_index = self._proc_mgr.current_queue_index
             current_queue = self._proc_mgr.current_queue
             pipeline_length = self._proc_mgr.pipeline_length
@@ -458,29 +654,47 @@ class Pipeline(Generic[PackType]):
             should_yield = next_queue_index >= pipeline_length
 
             if not unprocessed_job.is_poison:
-                for pack in selector.select(unprocessed_job.pack):
+                for pack in component_stats.timed_select(
+                        selector.select(unprocessed_job.pack)):
                     # First, perform the component action on the pack
+                    num_batches = _num_batches(processor)
                     try:
-                        if isinstance(processor, Caster):
-                            # Replacing the job pack with the casted version.
-                            unprocessed_job.alter_pack(processor.cast(pack))
-                        elif isinstance(processor, BaseProcessor):
-                            processor.process(pack)
-                        elif isinstance(processor, Evaluator):
-                            processor.consume_next(
-                                pack, self._predict_to_gold[unprocessed_job.id]
-                            )
+                        with component_stats.measure(self._pack_manager):
+                            if isinstance(processor, Caster):
+                                # Replacing the job pack with the casted
+                                # version.
+                                unprocessed_job.alter_pack(
+                                    processor.cast(pack))
+                            elif isinstance(processor, BaseProcessor):
+                                processor.process(pack)
+                            elif isinstance(processor, Evaluator):
+                                processor.consume_next(
+                                    pack,
+                                    self._predict_to_gold[unprocessed_job.id]
+                                )
+                        # A batch processor is counted by its predictions.
+                        component_stats.calls += (
+                            _num_batches(processor) - num_batches
+                            if isinstance(processor, BaseBatchProcessor)
+                            else 1)
+                        component_stats.packs += 1
 
                         # After the component action, make sure the entry is
                         # added into the index.
+                        start = time.perf_counter()
                         pack.add_all_remaining_entries()
+                        component_stats.index_time += \
+                            time.perf_counter() - start
                     except ValueError as e:
                         raise ProcessExecutionException(
                             f'Exception occurred when running '
                             f'{processor.name}') from e
 
                     # Then, based on component type, handle the queue.
-                    if isinstance(processor, BaseBatchProcessor):
+                    # These processors may keep the packs, the jobs of which
+                    # are QUEUED.
+                    if isinstance(processor, (BaseBatchProcessor,
+                                              ParallelPackProcessor)):
                         index = unprocessed_queue_indices[current_queue_index]
 
                         # check status of all the jobs up to "index"
@@ -517,6 +731,8 @@ class Pipeline(Generic[PackType]):
                             c_queue = list(current_queue)
                             for job_i in \
                                     c_queue[:processed_queue_index + 1]:
+                                component_stats.queued_time += \
+                                    job_i.pop_queued_time()
 
                                 if should_yield:
                                     if job_i.id in self._predict_to_gold:
@@ -588,10 +804,14 @@ class Pipeline(Generic[PackType]):
                                 self._proc_mgr.current_queue_index \
                                     = next_queue_index
             else:
-                processor.flush()
+                num_batches = _num_batches(processor)
+                with component_stats.measure(self._pack_manager):
+                    processor.flush()
+                component_stats.calls += _num_batches(processor) - num_batches
 
                 # current queue is modified in the loop
                 for job in list(current_queue):
+                    component_stats.queued_time += job.pop_queued_time()
                     if job.status != ProcessJobStatus.PROCESSED and \
                             not job.is_poison:
                         raise ValueError("Job is neither PROCESSED nor is "
@@ -0,0 +1,239 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Runtime statistics of a pipeline, such as the time spent in each component,
+used to find the bottlenecks without attaching a profiler.
+"""
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from forte.pack_manager import PackManager
+
+__all__ = [
+    "ComponentStats",
+    "PipelineStats",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# The CPU time of the current thread, which is not available before Python 3.7.
+_cpu_time = getattr(time, 'thread_time', time.process_time)
+
+# Marks the end of an iterator.
+_END = object()
+
+
+def _rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+class ComponentStats:
+    r"""The statistics of a component in the pipeline.
+
+    Attributes:
+        name (str): The name of the component.
+        calls (int): The number of times the component is called, which is
+            the number of batches predicted for a batch processor.
+        packs (int): The number of packs processed by the component.
+        entries (int): The number of entries created by the component.
+        wall_time (float): The wall time (in seconds) spent in the component.
+        cpu_time (float): The CPU time (in seconds) spent in the component.
+        select_time (float): The time spent in the selector to select the
+            packs for this component.
+        index_time (float): The time spent to add the remaining entries to
+            the packs, see
+            :meth:`~forte.data.base_pack.BasePack.add_all_remaining_entries`.
+        queued_time (float): The total time the jobs wait in the queue of
+            this component in the QUEUED status, i.e., waiting for a batch to
+            be full.
+        peak_queue_length (int): The maximum number of jobs in the queue of
+            this component.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.packs: int = 0
+        self.entries: int = 0
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self.select_time: float = 0.0
+        self.index_time: float = 0.0
+        self.queued_time: float = 0.0
+        self.peak_queue_length: int = 0
+
+    @contextmanager
+    def measure(self, pack_manager: Optional[PackManager] = None):
+        r"""Add the wall time and CPU time spent in the block, and the number
+        of entries created in the block if ``pack_manager`` is given."""
+        start, start_cpu = time.perf_counter(), _cpu_time()
+        if pack_manager is not None:
+            start_entries = pack_manager.num_created_entries
+        try:
+            yield
+        finally:
+            self.wall_time += time.perf_counter() - start
+            self.cpu_time += _cpu_time() - start_cpu
+            if pack_manager is not None:
+                self.entries += (
+                    pack_manager.num_created_entries - start_entries)
+
+    def timed(self, items: Iterator[T]) -> Iterator[T]:
+        r"""Wrap ``items`` to measure the time spent to produce each item,
+        which are counted as the processed packs."""
+        while True:
+            with self.measure():
+                item = next(items, _END)
+            if item is _END:
+                return
+            self.calls += 1
+            self.packs += 1
+            yield item  # type: ignore
+
+    def timed_select(self, items: Iterator[T]) -> Iterator[T]:
+        r"""Wrap the packs returned by a selector to measure the time spent
+        in the selector."""
+        while True:
+            start = time.perf_counter()
+            item = next(items, _END)
+            self.select_time += time.perf_counter() - start
+            if item is _END:
+                return
+            yield item  # type: ignore
+
+    def to_dict(self) -> Dict[str, Any]:
+        busy_time = self.wall_time + self.index_time
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'packs': self.packs,
+            'entries': self.entries,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'select_time': self.select_time,
+            'index_time': self.index_time,
+            'queued_time': self.queued_time,
+            'peak_queue_length': self.peak_queue_length,
+            'packs_per_sec': _rate(self.packs, busy_time),
+            'entries_per_sec': _rate(self.entries, busy_time),
+        }
+
+
+class PipelineStats:
+    r"""The statistics of a pipeline, collected since the pipeline is
+    initialized. The statistics can be reported periodically to the log, or
+    dumped to a JSON file, see :meth:`set_report`.
+    """
+
+    def __init__(self):
+        self.reader: ComponentStats = ComponentStats('reader')
+        self.components: List[ComponentStats] = []
+        self.packs: int = 0
+        self.elapsed_time: float = 0.0
+
+        self._peak_queue_lengths: Optional[Callable[[], List[int]]] = None
+        self._report_interval: Optional[float] = None
+        self._dump_path: Optional[str] = None
+        self._last_report: float = 0.0
+
+    def reset(self, component_names: List[str],
+              peak_queue_lengths: Optional[Callable[[], List[int]]] = None):
+        r"""Clear the statistics, and start to collect for the components
+        named ``component_names``.
+
+        Args:
+            component_names: The names of the components.
+            peak_queue_lengths (callable, optional): A function that returns
+                the peak queue length of each component, since the queues are
+                managed by the pipeline.
+        """
+        self.reader = ComponentStats('reader')
+        self.components = [ComponentStats(name) for name in component_names]
+        self._peak_queue_lengths = peak_queue_lengths
+        self.packs = 0
+        self.elapsed_time = 0.0
+
+    def set_report(self, interval: Optional[float],
+                   dump_path: Optional[str] = None):
+        r"""Report the statistics every ``interval`` seconds while the
+        pipeline is running, and when a run finishes. The statistics are
+        logged at INFO level, and written to ``dump_path`` as JSON if it is
+        given. Set ``interval`` to `None` to stop reporting.
+        """
+        self._report_interval = interval
+        self._dump_path = dump_path
+
+    def track(self, packs: Iterator[T]) -> Iterator[T]:
+        r"""Wrap the output of the pipeline to count the packs and the
+        elapsed time, and report the statistics if required."""
+        start = time.perf_counter()
+        elapsed_time = self.elapsed_time
+        self._last_report = start
+        try:
+            for pack in packs:
+                self.packs += 1
+                now = time.perf_counter()
+                self.elapsed_time = elapsed_time + now - start
+                if (self._report_interval is not None
+                        and now - self._last_report >= self._report_interval):
+                    self.report()
+                    self._last_report = now
+                yield pack
+        finally:
+            self.elapsed_time = elapsed_time + time.perf_counter() - start
+            if self._report_interval is not None:
+                self.report()
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._peak_queue_lengths is not None:
+            for stats, peak in zip(self.components,
+                                   self._peak_queue_lengths()):
+                stats.peak_queue_length = peak
+        return {
+            'packs': self.packs,
+            'elapsed_time': self.elapsed_time,
+            'packs_per_sec': _rate(self.packs, self.elapsed_time),
+            'reader': self.reader.to_dict(),
+            'components': [c.to_dict() for c in self.components],
+        }
+
+    def report(self):
+        r"""Log the statistics, and dump them to the JSON file if set."""
+        info = self.to_dict()
+        lines = [f"Pipeline processed {info['packs']} packs in "
+                 f"{info['elapsed_time']:.3f}s "
+                 f"({info['packs_per_sec']:.2f} packs/s)."]
+        for c_info in [info['reader']] + info['components']:
+            lines.append(
+                f"  {c_info['name']}: {c_info['calls']} calls, "
+                f"{c_info['packs']} packs, "
+                f"{c_info['entries']} entries, "
+                f"wall {c_info['wall_time']:.3f}s, "
+                f"cpu {c_info['cpu_time']:.3f}s, "
+                f"select {c_info['select_time']:.3f}s, "
+                f"index {c_info['index_time']:.3f}s, "
+                f"queued {c_info['queued_time']:.3f}s, "
+                f"peak queue {c_info['peak_queue_length']}, "
+                f"{c_info['packs_per_sec']:.2f} packs/s, "
+                f"{c_info['entries_per_sec']:.2f} entries/s")
+        logger.info('\n'.join(lines))
+
+        if self._dump_path is not None:
+            with open(self._dump_path, 'w') as f:
+                json.dump(info, f, indent=2)
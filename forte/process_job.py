@@ -1,4 +1,5 @@
 import itertools
+import time
 from enum import Enum
 from typing import Optional
 
@@ -20,10 +21,28 @@ class ProcessJob:
         self.__is_poison: bool = is_poison
         self.__status = ProcessJobStatus.UNPROCESSED
         self.__id = next(ProcessJob.counter)
+        # The time this job entered the QUEUED status, and the total time it
+        # has been QUEUED.
+        self.__queued_since: Optional[float] = None
+        self.__queued_time: float = 0.0
 
     def set_status(self, status):
+        if status == ProcessJobStatus.QUEUED:
+            if self.__queued_since is None:
+                self.__queued_since = time.perf_counter()
+        elif self.__queued_since is not None:
+            self.__queued_time += time.perf_counter() - self.__queued_since
+            self.__queued_since = None
         self.__status = status
 
+    def pop_queued_time(self) -> float:
+        r"""Return the time (in seconds) this job has been QUEUED since the
+        last call, used to measure how long the jobs wait for the batches.
+        """
+        queued_time = self.__queued_time
+        self.__queued_time = 0.0
+        return queued_time
+
     @property
     def id(self):
         return self.__id
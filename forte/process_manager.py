@@ -70,6 +70,9 @@ class ProcessManager:
 
     def __init__(self, pipeline_length):
         self._pipeline_length: int = pipeline_length
+        # The maximum number of jobs ever held by each queue, this is not
+        # cleared by `reset` so it covers all the runs.
+        self._peak_queue_lengths: List[int] = [0] * pipeline_length
         self.reset()
 
     def reset(self):
@@ -117,6 +120,10 @@ class ProcessManager:
     def pipeline_length(self):
         return self._pipeline_length
 
+    @property
+    def peak_queue_lengths(self) -> List[int]:
+        return list(self._peak_queue_lengths)
+
     def add_to_queue(self, queue_index: int, job: ProcessJob):
         if queue_index > len(self._queues):
             raise ValueError(f"Queue number {queue_index} exceeds queue "
@@ -125,6 +132,9 @@ class ProcessManager:
             # change the job status
             job.set_status(ProcessJobStatus.UNPROCESSED)
             self._queues[queue_index].append(job)
+            self._peak_queue_lengths[queue_index] = max(
+                self._peak_queue_lengths[queue_index],
+                len(self._queues[queue_index]))
 
     def exhausted(self):
         r"""Returns True only if the last element remaining in the last queue is
@@ -16,5 +16,6 @@ from forte.processors.base.base_processor import *
 from forte.processors.base.batch_processor import *
 from forte.processors.base.index_processor import *
 from forte.processors.base.pack_processor import *
+from forte.processors.base.parallel_processor import *
 from forte.processors.base.query_processor import *
 from forte.processors.base.writers import *
@@ -16,13 +16,15 @@ The processors that process data in batch.
 """
 import itertools
 from abc import abstractmethod, ABC
-from typing import Dict, Optional, Type, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type, Any
 
 from forte.common import Resources, ProcessorConfigError
 from forte.common.configuration import Config
-from forte.data import slice_batch
+from forte.data import split_batch
 from forte.data.base_pack import PackType
-from forte.data.batchers import ProcessingBatcher, FixedSizeDataPackBatcher
+from forte.data.batchers import (
+    ProcessingBatcher, FixedSizeDataPackBatcher, TokenBudgetDataPackBatcher)
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Annotation
@@ -35,6 +37,7 @@ __all__ = [
     "BatchProcessor",
     "MultiPackBatchProcessor",
     "FixedSizeBatchProcessor",
+    "TokenBudgetBatchProcessor",
     "FixedSizeMultiPackBatchProcessor"
 ]
 
@@ -46,6 +49,14 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
     dependency parsing, the context is normally a sentence, in entity
     coreference, the context is normally a document. The processor will create
     data batches relative to the context.
+
+    If ``async_predict`` is set in the config, :meth:`predict` runs in a
+    worker thread, while the processor packs the results of the previous batch
+    and collects the next batch, so the model is not idle during the data
+    handling. Collecting and packing still run in the calling thread, but the
+    next batch is collected before the results of the current batch are
+    packed, so :meth:`predict` should not depend on the results packed by
+    this processor, and should be safe to run along with :meth:`pack`.
     """
 
     def __init__(self):
@@ -54,6 +65,16 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         self.input_info: DataRequest = self._define_input_info()
         self.batcher: ProcessingBatcher = self.define_batcher()
         self.use_coverage_index = False
+        # The number of batches sent to :meth:`predict`.
+        self.num_batches: int = 0
+
+        # The packs received but not finished, in the order they are received.
+        self._unfinished_packs: List[PackType] = []
+        self._predict_executor: Optional[ThreadPoolExecutor] = None
+        # The prediction running in the worker thread, with the packs and the
+        # number of instances of each pack in the batch.
+        self._pending: Optional[Tuple[Future, List[PackType], List[int]]] = \
+            None
 
     def initialize(self, resources: Resources, configs: Optional[Config]):
         super().initialize(resources, configs)
@@ -67,6 +88,12 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
                    "check the config to see if you have the key 'batcher'."
             )
 
+        self._unfinished_packs = []
+        self._pending = None
+        self._shutdown_predict_executor()
+        if configs.get('async_predict', False):
+            self._predict_executor = ThreadPoolExecutor(max_workers=1)
+
     @staticmethod
     @abstractmethod
     def _define_context() -> Type[Annotation]:
@@ -118,20 +145,29 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         if self.use_coverage_index:
             self.prepare_coverage_index(input_pack)
 
+        self._unfinished_packs.append(input_pack)
         for batch in self.batcher.get_batch(
                 input_pack, self.context_type, self.input_info):
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
+            self._process_batch(batch)
 
         if len(self.batcher.current_batch_sources) == 0:
             self.update_batcher_pool()
 
-        # update the status of the jobs. The jobs which were removed from
-        # data_pack_pool will have status "PROCESSED" else they are "QUEUED"
+        # A pack is unfinished if it is still in data_pack_pool, or its
+        # results are being predicted. The unfinished packs are the last ones
+        # received, since the packs are batched in order.
+        waiting = {id(pack) for pack in self.batcher.data_pack_pool}
+        if self._pending is not None:
+            waiting.update(id(pack) for pack in self._pending[1])
+        first = next((i for i, pack in enumerate(self._unfinished_packs)
+                      if id(pack) in waiting), len(self._unfinished_packs))
+        self._unfinished_packs = self._unfinished_packs[first:]
+
+        # update the status of the jobs. The jobs of the finished packs will
+        # have status "PROCESSED" else they are "QUEUED"
         q_index = self._process_manager.current_queue_index
         u_index = self._process_manager.unprocessed_queue_indices[q_index]
-        data_pool_length = len(self.batcher.data_pack_pool)
+        data_pool_length = len(self._unfinished_packs)
         current_queue = self._process_manager.current_queue
 
         for i, job_i in enumerate(
@@ -143,15 +179,53 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
 
     def flush(self):
         for batch in self.batcher.flush():
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
+            self._process_batch(batch)
+        self._pack_pending()
+        self._unfinished_packs = []
 
         current_queue = self._process_manager.current_queue
 
         for job in current_queue:
             job.set_status(ProcessJobStatus.PROCESSED)
 
+    def finish(self, resource: Resources):
+        self._shutdown_predict_executor()
+        super().finish(resource)
+
+    def _shutdown_predict_executor(self):
+        if self._predict_executor is not None:
+            self._predict_executor.shutdown()
+            self._predict_executor = None
+
+    def _process_batch(self, batch: Dict):
+        r"""Predict and pack the results of ``batch``, which comes from the
+        packs in :attr:`data_pack_pool` of the batcher. In the async mode, the
+        prediction is started in the worker thread, and the results of the
+        previous batch are packed while it runs.
+        """
+        self.num_batches += 1
+        if self._predict_executor is None:
+            pred = self.predict(batch)
+            self.pack_all(pred)
+            self.update_batcher_pool(-1)
+            return
+
+        future = self._predict_executor.submit(self.predict, batch)
+        # ``update_batcher_pool`` creates new lists, so these are kept as is.
+        packs = self.batcher.data_pack_pool
+        sources = self.batcher.current_batch_sources
+        self.update_batcher_pool(-1)
+
+        self._pack_pending()
+        self._pending = (future, packs, sources)
+
+    def _pack_pending(self):
+        r"""Wait for the pending prediction and pack its results."""
+        if self._pending is not None:
+            future, packs, sources = self._pending
+            self._pending = None
+            self._pack_results(future.result(), packs, sources)
+
     @abstractmethod
     def predict(self, data_batch: Dict) -> Dict:
         r"""The function that task processors should implement. Make
@@ -169,13 +243,16 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         r"""Pack the prediction results ``output_dict`` back to the
         corresponding packs.
         """
-        start = 0
-        for i in range(len(self.batcher.data_pack_pool)):
-            pack_i = self.batcher.data_pack_pool[i]
-            output_dict_i = slice_batch(output_dict, start,
-                                        self.batcher.current_batch_sources[i])
+        self._pack_results(output_dict, self.batcher.data_pack_pool,
+                           self.batcher.current_batch_sources)
+
+    def _pack_results(self, output_dict: Dict, packs: List[PackType],
+                      sources: List[int]):
+        # The results of each pack are sliced from ``output_dict``, the lists
+        # are copies and the numpy arrays are views.
+        for pack_i, output_dict_i in zip(
+                packs, split_batch(output_dict, sources)):
             self.pack(pack_i, output_dict_i)
-            start += self.batcher.current_batch_sources[i]
             pack_i.add_all_remaining_entries()
 
     @classmethod
@@ -183,6 +260,7 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         super_config = super().default_configs()
 
         super_config['batcher'] = cls.define_batcher().default_configs()
+        super_config['async_predict'] = False
 
         return super_config
 
@@ -251,6 +329,16 @@ class FixedSizeBatchProcessor(BatchProcessor, ABC):
         return FixedSizeDataPackBatcher()
 
 
+class TokenBudgetBatchProcessor(BatchProcessor, ABC):
+    r"""The batch processors that limit the total size of the instances in
+    each batch, see :class:`~forte.data.batchers.TokenBudgetDataPackBatcher`.
+    """
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return TokenBudgetDataPackBatcher()
+
+
 class MultiPackBatchProcessor(BaseBatchProcessor[MultiPack], ABC):
     r"""This just defines the generic type to :class:`MultiPack`.
     The implemented batch processors will process :class:`MultiPacks`.
@@ -0,0 +1,303 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Run a single pack processor in a pool of worker processes.
+"""
+import collections
+import itertools
+import multiprocessing
+import pickle
+from multiprocessing import util
+from multiprocessing.pool import Pool
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple, Union
+
+from forte.common.configuration import Config
+from forte.common.exception import ProcessExecutionException, \
+    ProcessorConfigError
+from forte.common.resources import Resources
+from forte.data.binary_format import deserialize_binary, _decode_entries, \
+    _encode_entries
+from forte.data.container import EntryIdManager
+from forte.data.data_pack import DataPack
+from forte.data.ontology.core import Entry, FDict, FList
+from forte.pack_manager import PackManager
+from forte.process_manager import ProcessJobStatus, ProcessManager
+from forte.processors.base.pack_processor import PackProcessor
+
+__all__ = [
+    "ParallelPackProcessor",
+]
+
+# The attributes of a pack that are changed along with its text.
+_TEXT_STATE = ('_text', 'replace_back_operations', 'processed_original_spans',
+               'orig_text_len')
+
+
+def _all_entries(pack: DataPack) -> Iterable[Entry]:
+    return itertools.chain(
+        pack.annotations, pack.links, pack.groups, pack.generics)
+
+
+class _Worker:
+    r"""The processor held by a worker process, which processes the packs and
+    returns the changes made to them."""
+
+    def __init__(self, processor: PackProcessor, config: Config,
+                 resource: Resources):
+        self.processor = processor
+        self.resource = resource
+        self.pack_manager = PackManager()
+        processor.assign_manager(ProcessManager(1), self.pack_manager)
+        processor.initialize(resource, config)
+
+    def process(self, data: bytes) -> bytes:
+        # pylint: disable=protected-access
+        # The pack keeps the id assigned in the main process.
+        pack: DataPack = deserialize_binary(data)
+        pack._pack_manager = self.pack_manager
+        name = self.processor.name
+        text = pack.text
+        tids = {entry.tid for entry in _all_entries(pack)}
+        # The fields set by the processor are recorded under its name, the
+        # records made before are put back after processing.
+        field_records = pack.field_records.pop(name, set())
+
+        # This follows `BaseProcessor.process`, without the job status
+        # bookkeeping of the process manager.
+        pack.set_control_component(name)
+        self.processor._process(pack)
+        pack.add_all_remaining_entries()
+
+        new_entries = []
+        remaining = set()
+        for entry in _all_entries(pack):
+            if entry.tid in tids:
+                remaining.add(entry.tid)
+            else:
+                new_entries.append(entry)
+        new_tids = {entry.tid for entry in new_entries}
+
+        new_fields = pack.field_records.get(name, set())
+        modified = {tid for tid, _ in new_fields if tid in remaining}
+
+        diff: Dict[str, Any] = {
+            'meta': pack.meta,
+            'next_id': pack._id_manager.current_id_counter(),
+            'deleted': tids - remaining,
+            'modified': _encode_entries(
+                [pack.get_entry(tid) for tid in modified]),
+            'new': _encode_entries(new_entries),
+            'creation_records': {
+                c: records & new_tids
+                for c, records in pack.creation_records.items()},
+            'field_records': {name: new_fields},
+        }
+        if pack.text != text:
+            diff['text_state'] = {k: pack.__dict__[k] for k in _TEXT_STATE}
+
+        pack.field_records[name] = field_records | new_fields
+        return pickle.dumps(diff)
+
+    def finish(self):
+        self.processor.finish(self.resource)
+
+
+# The worker of the current worker process.
+_worker: Optional[_Worker] = None
+
+
+def _init_worker(processor: PackProcessor, config: Config,
+                 resource: Resources):
+    global _worker  # pylint: disable=global-statement
+    _worker = _Worker(processor, config, resource)
+    # Finish the processor when the worker exits normally.
+    util.Finalize(None, _worker.finish, exitpriority=10)
+
+
+def _process_in_worker(data: bytes) -> bytes:
+    if _worker is None:
+        raise ProcessExecutionException("The worker is not initialized.")
+    return _worker.process(data)
+
+
+def _own_containers(entry: Entry):
+    r"""Bind the entry containers of ``entry`` to itself, which are copied
+    from a decoded entry."""
+    # pylint: disable=protected-access
+    entry_dict = entry.__dict__
+    for key, value in entry_dict.items():
+        if isinstance(value, (FList, FDict)):
+            entry_dict[key] = value._copy(entry)
+
+
+def _apply_diff(pack: DataPack, data: bytes):
+    r"""Apply the changes made by a worker to ``pack``."""
+    # pylint: disable=protected-access
+    diff: Dict[str, Any] = pickle.loads(data)
+    if 'text_state' in diff:
+        pack.__dict__.update(diff['text_state'])
+    pack.meta = diff['meta']
+    pack._id_manager = EntryIdManager(diff['next_id'])
+
+    for tid in diff['deleted']:
+        pack.delete_entry(pack.get_entry(tid))
+
+    for modified in _decode_entries(diff['modified']):
+        entry = pack.get_entry(modified.tid)
+        entry.__dict__.update(modified.__dict__)
+        _own_containers(entry)
+
+    for entry in _decode_entries(diff['new']):
+        entry.set_pack(pack)
+        # The entry is added the same way as a newly created one, it keeps
+        # the tid assigned by the worker, which is before the id counter of
+        # the pack set above.
+        pack.on_entry_creation(entry)
+        pack._add_entry(entry)
+
+    for c, records in diff['creation_records'].items():
+        if records:
+            pack.creation_records.setdefault(c, set()).update(records)
+    for c, records in diff['field_records'].items():
+        if records:
+            pack.field_records.setdefault(c, set()).update(records)
+
+
+class ParallelPackProcessor(PackProcessor):
+    r"""Run ``processor`` in a pool of worker processes, while the rest of the
+    pipeline runs in the current process. This is useful for the processors
+    that are CPU bound and process each pack independently, such as the
+    NLTK processors, so only the slow stage is parallelized.
+
+    Each pack is sent to a worker with the binary serialization, and the
+    worker sends back the changes made by ``processor``, which are applied
+    to the original pack: the created and deleted entries, the entries with
+    fields set by the processor, and the text of the pack. Changes that are
+    not recorded as setting a field, such as modifying a list of an entry in
+    place, are not sent back.
+
+    The packs are returned to the pipeline in the order they are received.
+    Like the batch processors, the packs being processed by the workers stay
+    in the queue of this component as QUEUED jobs.
+
+    The configuration of this component is the configuration of
+    ``processor``. Each worker initializes its own copy of ``processor``, so
+    the processor should not rely on states shared across packs.
+
+    Args:
+        processor: The processor to run in the workers, which should not be
+            initialized.
+        num_workers: The number of worker processes.
+        max_in_flight (int, optional): The maximum number of packs that are
+            sent to the workers but not returned yet. If `None`,
+            `2 * num_workers` is used.
+        start_method (str, optional): The start method of the worker
+            processes, see :mod:`multiprocessing`. If `None`, the default
+            method of the platform is used.
+    """
+
+    def __init__(self, processor: PackProcessor, num_workers: int,
+                 max_in_flight: Optional[int] = None,
+                 start_method: Optional[str] = None):
+        super().__init__()
+        if num_workers < 1:
+            raise ProcessorConfigError(
+                f"The number of workers should be positive, got "
+                f"{num_workers}.")
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        if max_in_flight < 1:
+            raise ProcessorConfigError(
+                f"The in-flight limit should be positive, got "
+                f"{max_in_flight}.")
+
+        self.processor = processor
+        self.num_workers = num_workers
+        self.max_in_flight = max_in_flight
+        self.start_method = start_method
+
+        self._pool: Optional[Pool] = None
+        # The packs sent to the workers, in the order they are received.
+        self._in_flight: Deque[Tuple[DataPack, Any]] = collections.deque()
+
+    def make_configs(  # type: ignore
+            self, configs: Optional[Union[Config, Dict[str, Any]]]) -> Config:
+        return self.processor.make_configs(configs)
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self._shutdown()
+        self._in_flight.clear()
+        context = multiprocessing.get_context(self.start_method)
+        self._pool = context.Pool(
+            self.num_workers, initializer=_init_worker,
+            initargs=(self.processor, configs, resources))
+
+    def _process(self, input_pack: DataPack):
+        if self._pool is None:
+            raise ProcessExecutionException(
+                "The processor is not initialized.")
+
+        self._in_flight.append((input_pack, self._pool.apply_async(
+            _process_in_worker,
+            (input_pack.serialize_binary(),))))
+
+        # Apply the results that are ready, in order.
+        while self._in_flight and (len(self._in_flight) > self.max_in_flight
+                                   or self._in_flight[0][1].ready()):
+            self._finish_next()
+
+    def process(self, input_pack: DataPack):
+        input_pack.set_control_component(self.name)
+        self._process(input_pack)
+
+        # The jobs of the packs in the workers are "QUEUED", the others are
+        # "PROCESSED".
+        q_index = self._process_manager.current_queue_index
+        u_index = self._process_manager.unprocessed_queue_indices[q_index]
+        current_queue = self._process_manager.current_queue
+
+        for i, job_i in enumerate(
+                itertools.islice(current_queue, 0, u_index + 1)):
+            if i <= u_index - len(self._in_flight):
+                job_i.set_status(ProcessJobStatus.PROCESSED)
+            else:
+                job_i.set_status(ProcessJobStatus.QUEUED)
+
+    def _finish_next(self):
+        pack, result = self._in_flight.popleft()
+        try:
+            data = result.get()
+        except Exception as e:
+            raise ProcessExecutionException(
+                f"Exception occurred when running {self.processor.name} in "
+                f"a worker process.") from e
+        _apply_diff(pack, data)
+
+    def flush(self):
+        while self._in_flight:
+            self._finish_next()
+
+        for job in self._process_manager.current_queue:
+            job.set_status(ProcessJobStatus.PROCESSED)
+
+    def _shutdown(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def finish(self, resource: Resources):
+        # The workers finish their own processors before exiting.
+        self._shutdown()
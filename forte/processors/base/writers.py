@@ -27,7 +27,9 @@ from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.base_pack import BasePack
 from forte.data.data_pack import DataPack
+from forte.data.data_utils import serialize
 from forte.data.multi_pack import MultiPack
+from forte.data.pack_store import PackStore
 from forte.processors.base.pack_processor import PackProcessor, \
     MultiPackProcessor
 from forte.utils.utils_io import maybe_create_dir, ensure_dir
@@ -36,13 +38,15 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     'JsonPackWriter',
+    'PackStoreWriter',
     'MultiPackWriter',
 ]
 
 
 def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
                indent: Optional[int] = None, zip_pack: bool = False,
-               overwrite: bool = False, drop_record: bool = False) -> str:
+               overwrite: bool = False, drop_record: bool = False,
+               serialize_method: str = "jsonpickle") -> str:
     """
     Write a pack to a path.
 
@@ -54,30 +58,36 @@ def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
         zip_pack: Whether to zip the output JSON.
         overwrite: Whether to overwrite the file if already exists.
         drop_record: Whether to drop the creation records in the serialization.
+        serialize_method: The method to serialize the pack, `"jsonpickle"`
+          writes a `.json` file and `"binary"` writes a `.bin` file. See
+          :func:`~forte.data.data_utils.serialize`.
 
     Returns:
         If successfully written, will return the path of the output file.
         otherwise, will return None.
 
     """
-    output_path = os.path.join(output_dir, sub_path) + '.json'
+    suffix = '.bin' if serialize_method == 'binary' else '.json'
+    output_path = os.path.join(output_dir, sub_path) + suffix
     if overwrite or not os.path.exists(output_path):
         if zip_pack:
             output_path = output_path + '.gz'
 
         ensure_dir(output_path)
 
-        out_str: str = input_pack.serialize(drop_record)
-
-        if indent:
-            out_str = json.dumps(json.loads(out_str), indent=indent)
+        out_data = serialize(input_pack, drop_record, serialize_method)
+        # JSON packs are encoded, so both formats are written as bytes.
+        if isinstance(out_data, str):
+            if indent:
+                out_data = json.dumps(json.loads(out_data), indent=indent)
+            out_data = out_data.encode('utf-8')
 
         if zip_pack:
-            with gzip.open(output_path, 'wt') as out:
-                out.write(out_str)
+            with gzip.open(output_path, 'wb') as out:
+                out.write(out_data)
         else:
-            with open(output_path, 'w') as out:
-                out.write(out_str)
+            with open(output_path, 'wb') as out:
+                out.write(out_data)
     else:
         logging.info("Will not overwrite existing path %s", output_path)
 
@@ -122,7 +132,8 @@ class JsonPackWriter(PackProcessor, ABC):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle',
         })
         return config
 
@@ -135,10 +146,65 @@ class JsonPackWriter(PackProcessor, ABC):
         maybe_create_dir(self.configs.output_dir)
         write_pack(input_pack, self.configs.output_dir, sub_path,
                    self.configs.indent, self.configs.zip_pack,
-                   self.configs.overwrite, self.configs.drop_record)
+                   self.configs.overwrite, self.configs.drop_record,
+                   self.configs.serialize_method)
+
+
+class PackStoreWriter(PackProcessor):
+    r"""Append the packs to a :class:`~forte.data.pack_store.PackStore` at
+    `output_dir`, which can be read by
+    :class:`~forte.data.readers.PackStoreReader`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._store: Optional[PackStore] = None
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+
+        if not configs.output_dir:
+            raise NotADirectoryError('Root output directory is not defined '
+                                     'correctly in the configs.')
+
+        self._store = PackStore(
+            configs.output_dir, 'w' if configs.overwrite else 'a',
+            configs.shard_size)
+
+    def _process(self, input_pack: DataPack):
+        self._store.append(  # type: ignore
+            input_pack, self.configs.drop_record,
+            self.configs.serialize_method)
+
+    def finish(self, _):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    @classmethod
+    def default_configs(cls):
+        r"""This defines a basic ``Hparams`` structure. If `overwrite` is
+        True, the existing store at `output_dir` is cleared, otherwise the
+        packs are appended to it. See
+        :class:`~forte.data.pack_store.PackStore` for `shard_size`.
+        """
+        config = super().default_configs()
+        config.update({
+            'output_dir': None,
+            'drop_record': False,
+            'shard_size': None,
+            'serialize_method': 'binary'
+        })
+        return config
 
 
 class MultiPackWriter(MultiPackProcessor):
+    r"""Write the multi packs and their data packs. By default, each pack is
+    written to its own file, and the files are indexed by `pack.idx` and
+    `multi.idx`. If `use_pack_store` is True, the data packs and the multi
+    packs are appended to two :class:`~forte.data.pack_store.PackStore`
+    instead, which are indexed by themselves.
+    """
     pack_base_out = 'packs'
     multi_base = 'multi'
     pack_idx = 'pack.idx'
@@ -148,6 +214,17 @@ class MultiPackWriter(MultiPackProcessor):
         # pylint: disable=attribute-defined-outside-init
         super().initialize(resources, configs)
 
+        self.pack_store: Optional[PackStore] = None
+        self.multi_store: Optional[PackStore] = None
+        if self.configs.use_pack_store:
+            mode = 'w' if self.configs.overwrite else 'a'
+            self.pack_store = PackStore(
+                os.path.join(self.configs.output_dir, self.pack_base_out),
+                mode)
+            self.multi_store = PackStore(
+                os.path.join(self.configs.output_dir, self.multi_base), mode)
+            return
+
         pack_paths = os.path.join(self.configs.output_dir, self.pack_idx)
         ensure_dir(pack_paths)
         self.pack_idx_out = open(pack_paths, 'w')
@@ -173,6 +250,19 @@ class MultiPackWriter(MultiPackProcessor):
         return f"mult_pack_{pack.meta.pack_id}"
 
     def _process(self, input_pack: MultiPack):
+        if self.multi_store is not None:
+            for pack in input_pack.packs:
+                # A data pack shared by multiple multi packs is stored once.
+                if pack.meta.pack_id in self.pack_store:  # type: ignore
+                    continue
+                self.pack_store.append(  # type: ignore
+                    pack, self.configs.drop_record,
+                    self.configs.serialize_method)
+            self.multi_store.append(
+                input_pack, self.configs.drop_record,
+                self.configs.serialize_method)
+            return
+
         multi_out_dir = os.path.join(self.configs.output_dir, self.multi_base)
         pack_out_dir = os.path.join(self.configs.output_dir, self.pack_base_out)
 
@@ -180,7 +270,7 @@ class MultiPackWriter(MultiPackProcessor):
             pack_out = write_pack(
                 pack, pack_out_dir, self.pack_name(pack), self.configs.indent,
                 self.configs.zip_pack, self.configs.overwrite,
-                self.configs.drop_record)
+                self.configs.drop_record, self.configs.serialize_method)
 
             self.pack_idx_out.write(
                 f'{pack.meta.pack_id}\t'
@@ -190,7 +280,7 @@ class MultiPackWriter(MultiPackProcessor):
             input_pack, multi_out_dir,
             self.multipack_name(input_pack), self.configs.indent,
             self.configs.zip_pack, self.configs.overwrite,
-            self.configs.drop_record
+            self.configs.drop_record, self.configs.serialize_method
         )
 
         self.multi_idx_out.write(
@@ -198,8 +288,12 @@ class MultiPackWriter(MultiPackProcessor):
             f'{posixpath.relpath(multi_out, self.configs.output_dir)}\n')
 
     def finish(self, _):
-        self.pack_idx_out.close()
-        self.multi_idx_out.close()
+        if self.multi_store is not None:
+            self.pack_store.close()
+            self.multi_store.close()
+        else:
+            self.pack_idx_out.close()
+            self.multi_idx_out.close()
 
     @classmethod
     def default_configs(cls) -> Dict[str, Any]:
@@ -208,6 +302,8 @@ class MultiPackWriter(MultiPackProcessor):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle',
+            'use_pack_store': False,
         })
         return config
@@ -14,7 +14,7 @@
 
 # pylint: disable=attribute-defined-outside-init
 import pickle
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Type
 
 import numpy as np
 import torch
@@ -23,23 +23,47 @@ from texar.torch.modules import BERTEncoder
 
 from forte.common.configuration import Config
 from forte.common.resources import Resources
-from forte.data.data_pack import DataPack
+from forte.data.batchers import ProcessingBatcher, WholePackBatcher
 from forte.data.multi_pack import MultiPack
-from forte.processors.base import QueryProcessor
+from forte.data.ontology.top import Annotation, Query
+from forte.data.types import DataRequest
+from forte.processors.base import MultiPackBatchProcessor
 
 __all__ = [
     "BertBasedQueryCreator"
 ]
 
 
-class BertBasedQueryCreator(QueryProcessor):
-    r"""This processor searches relevant documents for a query"""
+class BertBasedQueryCreator(MultiPackBatchProcessor):
+    r"""This processor creates a :class:`Query` for each MultiPack, whose value
+    is the BERT embedding of the text of the query pack, together with the
+    user and the bot utterances if there are.
+
+    The MultiPacks are batched by a
+    :class:`~forte.data.batchers.WholePackBatcher`, and the queries of a
+    batch are encoded in one forward pass. With the default ``batch_size`` of
+    1, each query is created as soon as its MultiPack arrives.
+    """
 
     # pylint: disable=useless-super-delegation
     def __init__(self) -> None:
         super().__init__()
 
+    @staticmethod
+    def _define_context() -> Type[Annotation]:
+        # The query is created from the texts of the packs.
+        return Annotation
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {}
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return WholePackBatcher()
+
     def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
         self.resource = resources
         self.config = configs
 
@@ -88,24 +112,34 @@ class BertBasedQueryCreator(QueryProcessor):
 
         return cls_token
 
-    def _build_query(self, text: str) -> np.ndarray:
-        input_ids, segment_ids, input_mask = \
+    def _build_queries(self, texts: List[str]) -> np.ndarray:
+        r"""Encode ``texts`` in one batch.
+
+        Returns:
+            The query vectors of shape ``[len(texts), hidden_size]``.
+        """
+        encoded = [
             self.tokenizer.encode_text(
                 text_a=text, max_seq_length=self.config.max_seq_length)
-        input_ids = torch.LongTensor(input_ids).unsqueeze(0).to(self.device)
-        segment_ids = torch.LongTensor(segment_ids).unsqueeze(0).to(self.device)
-        input_mask = torch.LongTensor(input_mask).unsqueeze(0).to(self.device)
+            for text in texts]
+        input_ids, segment_ids, input_mask = [
+            torch.tensor(item, dtype=torch.long, device=self.device)
+            for item in zip(*encoded)]
         sequence_length = (~(input_mask == 0)).sum(dim=1)
-        query_vector = self.get_embeddings(inputs=input_ids,
-                                           sequence_length=sequence_length,
-                                           segment_ids=segment_ids)
-        query_vector = torch.mean(query_vector, dim=0, keepdim=True)
-        query_vector = query_vector.cpu().numpy()
-        return query_vector
-
-    def _process_query(self, input_pack: MultiPack) \
-            -> Tuple[DataPack, Dict[str, Any]]:
-        query_pack: DataPack = input_pack.get_pack(self.config.query_pack_name)
+
+        # Only pad to the longest query of the batch.
+        max_length = int(sequence_length.max())
+        query_vectors = self.get_embeddings(
+            inputs=input_ids[:, :max_length],
+            sequence_length=sequence_length,
+            segment_ids=segment_ids[:, :max_length])
+        return query_vectors.cpu().numpy()
+
+    def _build_query(self, text: str) -> np.ndarray:
+        return self._build_queries([text])
+
+    def _query_text(self, input_pack: MultiPack) -> str:
+        query_pack = input_pack.get_pack(self.config.query_pack_name)
         context = [query_pack.text]
 
         # use context to build the query
@@ -117,8 +151,13 @@ class BertBasedQueryCreator(QueryProcessor):
             bot_pack = input_pack.get_pack("bot_utterance")
             context.append(bot_pack.text)
 
-        text = ' '.join(context)
+        return ' '.join(context)
 
-        query_vector = self._build_query(text=text)
+    def predict(self, data_batch: Dict) -> Dict:
+        texts = [self._query_text(pack) for pack in data_batch["pack"]]
+        return {"query": self._build_queries(texts)}
 
-        return query_pack, query_vector
+    def pack(self, pack: MultiPack, inputs: Dict):
+        query = Query(pack=pack.get_pack(self.config.query_pack_name))
+        # Copy the vector out of the batch.
+        query.value = np.array(inputs["query"])
@@ -14,17 +14,21 @@
 
 # pylint: disable=attribute-defined-outside-init
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Type
 
+import numpy as np
 import torch
 
 from texar.torch.data.tokenizers.bert_tokenizer import BERTTokenizer
 
 from forte.common.configuration import Config
 from forte.common.resources import Resources
+from forte.data.batchers import ProcessingBatcher
+from forte.data.data_utils_io import batch_instances
 from forte.data.multi_pack import MultiPack
-from forte.data.ontology import Query
-from forte.processors.base import MultiPackProcessor
+from forte.data.ontology import Annotation, Query
+from forte.data.types import DataRequest
+from forte.processors.base import MultiPackBatchProcessor
 
 from examples.passage_ranker.bert_ranker import (
     BERTClassifier, BERTEncoder)
@@ -34,11 +38,119 @@ __all__ = [
 ]
 
 
-class BertRerankingProcessor(MultiPackProcessor):
+class _QueryDocumentBatcher(ProcessingBatcher[MultiPack]):
+    r"""Batch the (query, document) pairs of the MultiPacks, where the query
+    is the text of the pack named :attr:`query_pack_name`, and each of the
+    other packs is a document. A batch has ``batch_size`` pairs, which can
+    come from several MultiPacks.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.query_pack_name: str = "query"
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.batch_size = config.batch_size
+        self.batch_is_full = False
+
+    def _should_yield(self) -> bool:
+        return self.batch_is_full
+
+    def _get_data_batch(
+            self, multi_pack: MultiPack, context_type: Type[Annotation],
+            requests: Optional[DataRequest] = None,
+            offset: int = 0) -> Iterable[Tuple[Dict, int]]:
+        query_text = multi_pack.get_pack(self.query_pack_name).text
+
+        instances: List[Dict] = []
+        num_pairs = 0
+        for doc_id, pack in multi_pack.iter_packs():
+            if doc_id == self.query_pack_name:
+                continue
+            num_pairs += 1
+            instances.append({
+                "query": query_text,
+                "doc_id": doc_id,
+                "document": pack.text,
+            })
+            if len(instances) == self.batch_size - len(self._builder):
+                self.batch_is_full = True
+                yield (batch_instances(instances), len(instances))
+                instances = []
+                self.batch_is_full = False
+
+        # A MultiPack without documents still takes its place in the batch,
+        # so the results are sliced back to the right packs.
+        if instances or num_pairs == 0:
+            yield (batch_instances(instances), len(instances))
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            "batch_size": 32
+        }
+
+
+def _micro_batches(lengths: np.ndarray,
+                   max_batch_tokens: Optional[int]) -> List[np.ndarray]:
+    r"""Split the sequences into batches of similar lengths, where the padded
+    size of each batch (the number of sequences times the longest length)
+    does not exceed ``max_batch_tokens``, unless a sequence exceeds it by
+    itself.
+
+    Returns:
+        The indices of the sequences in each batch.
+    """
+    order = np.argsort(lengths, kind="stable")
+    if max_batch_tokens is None:
+        return [order]
+
+    batches: List[np.ndarray] = []
+    start = 0
+    for end in range(1, len(order) + 1):
+        # The sequences are sorted, so the last one is the longest.
+        if end - start > 1 and \
+                (end - start) * lengths[order[end - 1]] > max_batch_tokens:
+            batches.append(order[start:end - 1])
+            start = end - 1
+    if start < len(order):
+        batches.append(order[start:])
+    return batches
+
+
+class BertRerankingProcessor(MultiPackBatchProcessor):
+    r"""Score the documents retrieved for a query with a BERT cross-encoder,
+    and record the scores in the results of the :class:`Query` of the query
+    pack.
+
+    The (query, document) pairs of the incoming MultiPacks are batched by
+    the batcher, with ``batch_size`` pairs in each batch. Each batch is
+    sorted by the length of the pairs and run in micro-batches of at most
+    ``max_batch_tokens`` padded tokens, so the pairs are padded to the
+    longest pair in their micro-batch instead of ``max_seq_length``.
+    """
+
+    @staticmethod
+    def _define_context() -> Type[Annotation]:
+        # The pairs are created from the texts of the packs.
+        return Annotation
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {}
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return _QueryDocumentBatcher()
 
     def initialize(self, resources: Resources, configs: Config):
         self.resources = resources
         self.config = Config(configs, self.default_configs())
+        super().initialize(resources, self.config)
+        # The batcher reads the query from the same pack as the processor.
+        self.batcher.query_pack_name = (  # type: ignore
+            self.config.query_pack_name)
 
         # TODO: At the time of writing, no way in texar to set encoder in
         # `texar.torch.modules.classifiers.BertClassifier`. Should not ideally
@@ -73,37 +185,46 @@ class BertRerankingProcessor(MultiPackProcessor):
             "field": "content",
             "pretrained_model_name": pretrained_model_name,
             "model_dir": os.path.join(os.path.dirname(__file__), "models"),
-            "max_seq_length": 512
+            "max_seq_length": 512,
+            "max_batch_tokens": 8192,
         })
         return configs
 
-    def _process(self, input_pack: MultiPack):
+    @torch.no_grad()
+    def predict(self, data_batch: Dict) -> Dict:
         max_len = self.config.max_seq_length
-        query_pack_name = self.config.query_pack_name
-
-        query_pack = input_pack.get_pack(self.config.query_pack_name)
+        doc_ids = data_batch.get("doc_id", [])
+        if not doc_ids:
+            return {"doc_id": [], "score": []}
+
+        encoded = np.array([
+            self.tokenizer.encode_text(query_text, document_text, max_len)
+            for query_text, document_text in zip(
+                data_batch["query"], data_batch["document"])],
+            dtype=np.int64)
+        input_ids, segment_ids, input_mask = (
+            encoded[:, 0], encoded[:, 1], encoded[:, 2])
+        lengths = input_mask.sum(axis=-1)
+
+        scores = np.empty(len(doc_ids), dtype=np.float32)
+        for indices in _micro_batches(lengths, self.config.max_batch_tokens):
+            # Only pad to the longest pair of the micro-batch.
+            batch_length = int(lengths[indices].max())
+            logits, _ = self.model(
+                torch.from_numpy(
+                    input_ids[indices, :batch_length]).to(self.device),
+                torch.from_numpy(lengths[indices]).to(self.device),
+                torch.from_numpy(
+                    segment_ids[indices, :batch_length]).to(self.device))
+            preds = torch.softmax(logits, dim=1)
+            scores[indices] = preds[:, 1].cpu().numpy()
+
+        return {"doc_id": doc_ids, "score": scores.tolist()}
+
+    def pack(self, pack: MultiPack, inputs: Dict):
+        if not inputs["doc_id"]:
+            return
+        query_pack = pack.get_pack(self.config.query_pack_name)
         query_entry = list(query_pack.get(Query))[0]
-        query_text = query_pack.text
-
-        packs = {}
-        for doc_id in input_pack.pack_names:
-            if doc_id == query_pack_name:
-                continue
-
-            pack = input_pack.get_pack(doc_id)
-            document_text = pack.text
-
-            # BERT Inference
-            input_ids, segment_ids, input_mask = [
-                torch.LongTensor(item).unsqueeze(0).to(self.device)
-                for item in self.tokenizer.encode_text(
-                    query_text, document_text, max_len)]
-
-            seq_length = (input_mask == 1).sum(dim=-1)
-            logits, _ = self.model(input_ids, seq_length, segment_ids)
-            preds = torch.nn.functional.softmax(torch.Tensor(logits), dim=1)
-
-            score = preds.detach().tolist()[0][1]
-
-            query_entry.update_results({doc_id: score})
-            packs[doc_id] = pack
+        query_entry.update_results(dict(zip(inputs["doc_id"],
+                                            inputs["score"])))
@@ -13,14 +13,18 @@
 # limitations under the License.
 
 # pylint: disable=attribute-defined-outside-init
-from typing import Dict, Any
+from typing import Any, Dict, List, Type
+
+import numpy as np
 
 from forte.common.configuration import Config
 from forte.common.resources import Resources
+from forte.data.batchers import ProcessingBatcher, WholePackBatcher
 from forte.data.multi_pack import MultiPack
-from forte.data.ontology.top import Query
+from forte.data.ontology.top import Annotation, Query
+from forte.data.types import DataRequest
 from forte.indexers import EmbeddingBasedIndexer
-from forte.processors.base import MultiPackProcessor
+from forte.processors.base import MultiPackBatchProcessor
 from ft.onto.base_ontology import Document
 
 __all__ = [
@@ -28,8 +32,14 @@ __all__ = [
 ]
 
 
-class SearchProcessor(MultiPackProcessor):
-    r"""This processor searches for relevant documents for a query"""
+class SearchProcessor(MultiPackBatchProcessor):
+    r"""This processor searches for relevant documents for a query.
+
+    The first :class:`Query` of the query pack of each MultiPack is searched,
+    and the documents found are added to the MultiPack. The MultiPacks are
+    batched by a :class:`~forte.data.batchers.WholePackBatcher`, and the
+    queries of a batch are searched in the index at once.
+    """
 
     def __init__(self) -> None:
         super().__init__()
@@ -40,33 +50,66 @@ class SearchProcessor(MultiPackProcessor):
             "device": "gpu0"
         })
 
+    @staticmethod
+    def _define_context() -> Type[Annotation]:
+        # The queries are read from the query packs.
+        return Annotation
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {}
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return WholePackBatcher()
+
     def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
         self.resources = resources
         self.config = configs
         self.index.load(self.config.model_dir)
         self.k = self.config.k or 5
 
-    def _process(self, input_pack: MultiPack):
-        query_pack = input_pack.get_pack(self.config.query_pack_name)
-        first_query = list(query_pack.get(Query))[0]
-        results = self.index.search(first_query.value, self.k)
-        documents = [r[1] for result in results for r in result]
+    def predict(self, data_batch: Dict) -> Dict:
+        query_vectors = []
+        for input_pack in data_batch["pack"]:
+            query_pack = input_pack.get_pack(self.config.query_pack_name)
+            first_query = list(query_pack.get(Query))[0]
+            query_vectors.append(np.atleast_2d(first_query.value))
+
+        results = self.index.search(np.concatenate(query_vectors), self.k)
+
+        # Scatter the results back to the queries, each of them can have
+        # several vectors.
+        documents: List[List[str]] = []
+        start = 0
+        for vectors in query_vectors:
+            end = start + len(vectors)
+            documents.append(
+                [r[1] for result in results[start:end] for r in result])
+            start = end
+        return {"documents": documents}
 
-        packs = {}
-        for i, doc in enumerate(documents):
-            pack = input_pack.add_pack()
-            pack.set_text(doc)
+    def pack(self, pack: MultiPack, inputs: Dict):
+        for documents in inputs["documents"]:
+            packs = {}
+            for i, doc in enumerate(documents):
+                doc_pack = pack.add_pack()
+                doc_pack.set_text(doc)
 
-            Document(pack, 0, len(doc))
-            packs[self.config.response_pack_name_prefix + f'_{i}'] = pack
+                Document(doc_pack, 0, len(doc))
+                packs[self.config.response_pack_name_prefix + f'_{i}'] = \
+                    doc_pack
 
-        input_pack.update_pack(packs)
+            pack.update_pack(packs)
 
     @classmethod
     def default_configs(cls) -> Dict[str, Any]:
         config = super().default_configs()
         config.update({
             'model_dir': None,
+            'k': 5,
+            'query_pack_name': 'query',
             'response_pack_name_prefix': 'doc'
         })
         return config
@@ -26,6 +26,7 @@ from forte.data.data_pack import DataPack
 from forte.data.ontology import Annotation
 from forte.data.types import DataRequest
 from forte.models.ner import utils
+from forte.models.ner.featurizer import NERFeaturizer
 from forte.models.ner.model_factory import BiRecurrentConvCRF
 from forte.processors.base.batch_processor import FixedSizeBatchProcessor
 from ft.onto.base_ontology import Token, Sentence, EntityMention
@@ -53,6 +54,7 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
         self.config_model = None
         self.config_data = None
         self.normalize_func = None
+        self.featurizer = None
         self.device = None
 
         self.train_instances_cache = []
@@ -99,6 +101,9 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                 else torch.device('cpu')
 
         self.normalize_func = utils.normalize_digit_word
+        self.featurizer = NERFeaturizer(
+            self.word_alphabet, self.char_alphabet, self.normalize_func,
+            self.config_data.max_char_length, self.config_data.num_char_pad)
 
         if "model" not in self.resource.keys():
             def load_model(path):
@@ -125,22 +130,8 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
             -> Dict[str, Dict[str, List[np.array]]]:
         tokens = data_batch["Token"]
 
-        instances = []
-        for words in tokens["text"]:
-            char_id_seqs = []
-            word_ids = []
-            for word in words:
-                char_ids = []
-                for char in word:
-                    char_ids.append(self.char_alphabet.get_index(char))
-                if len(char_ids) > self.config_data.max_char_length:
-                    char_ids = char_ids[: self.config_data.max_char_length]
-                char_id_seqs.append(char_ids)
-
-                word = self.normalize_func(word)
-                word_ids.append(self.word_alphabet.get_index(word))
-
-            instances.append((word_ids, char_id_seqs))
+        instances = [self.featurizer.encode(words)
+                     for words in tokens["text"]]
 
         self.model.eval()
         batch_data = self.get_batch_tensor(instances, device=self.device)
@@ -178,6 +169,9 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
             return
 
         current_entity_mention: Tuple[int, str] = (-1, "None")
+        entity_begins: List[int] = []
+        entity_ends: List[int] = []
+        entity_types: List[str] = []
 
         for i in range(len(output_dict["Token"]["tid"])):
             # an instance
@@ -203,15 +197,17 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                     if token_ner[2:] != current_entity_mention[1]:
                         continue
 
-                    entity = EntityMention(data_pack,
-                                           current_entity_mention[0],
-                                           token.span.end)
-                    entity.ner_type = current_entity_mention[1]
+                    entity_begins.append(current_entity_mention[0])
+                    entity_ends.append(token.span.end)
+                    entity_types.append(current_entity_mention[1])
                 elif token_ner[0] == "S":
                     current_entity_mention = (token.span.begin, token_ner[2:])
-                    entity = EntityMention(data_pack, current_entity_mention[0],
-                                           token.span.end)
-                    entity.ner_type = current_entity_mention[1]
+                    entity_begins.append(current_entity_mention[0])
+                    entity_ends.append(token.span.end)
+                    entity_types.append(current_entity_mention[1])
+
+        data_pack.add_annotations(EntityMention, entity_begins, entity_ends,
+                                  ner_type=entity_types)
 
     def get_batch_tensor(
             self, data: List[Tuple[List[int], List[List[int]]]],
@@ -237,46 +233,7 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
             - ``lengths``: A tensor of shape `[batch_size]` representing the
               length of each sentences in the batch
         """
-        batch_size = len(data)
-        batch_length = max([len(d[0]) for d in data])
-        char_length = max(
-            [max([len(charseq) for charseq in d[1]]) for d in data]
-        )
-
-        char_length = min(
-            self.config_data.max_char_length,
-            char_length + self.config_data.num_char_pad,
-        )
-
-        wid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-        cid_inputs = np.empty(
-            [batch_size, batch_length, char_length], dtype=np.int64
-        )
-
-        masks = np.zeros([batch_size, batch_length], dtype=np.float32)
-
-        lengths = np.empty(batch_size, dtype=np.int64)
-
-        for i, inst in enumerate(data):
-            wids, cid_seqs = inst
-
-            inst_size = len(wids)
-            lengths[i] = inst_size
-            # word ids
-            wid_inputs[i, :inst_size] = wids
-            wid_inputs[i, inst_size:] = self.word_alphabet.pad_id
-            for c, cids in enumerate(cid_seqs):
-                cid_inputs[i, c, : len(cids)] = cids
-                cid_inputs[i, c, len(cids):] = self.char_alphabet.pad_id
-            cid_inputs[i, inst_size:, :] = self.char_alphabet.pad_id
-            masks[i, :inst_size] = 1.0
-
-        words = torch.from_numpy(wid_inputs).to(device)
-        chars = torch.from_numpy(cid_inputs).to(device)
-        masks = torch.from_numpy(masks).to(device)
-        lengths = torch.from_numpy(lengths).to(device)
-
-        return words, chars, masks, lengths
+        return self.featurizer.get_batch_tensor(data, device)
 
     # TODO: change this to manageable size
     @classmethod
@@ -43,8 +43,9 @@ class NLTKWordTokenizer(PackProcessor):
         self.tokenizer = TreebankWordTokenizer()
 
     def _process(self, input_pack: DataPack):
-        for begin, end in self.tokenizer.span_tokenize(input_pack.text):
-            Token(input_pack, begin, end)
+        spans = list(self.tokenizer.span_tokenize(input_pack.text))
+        input_pack.add_annotations(Token, [begin for begin, _ in spans],
+                                   [end for _, end in spans])
 
 
 class NLTKPOSTagger(PackProcessor):
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Set
 
 import spacy
 from spacy.language import Language
@@ -21,13 +21,34 @@ from forte.common import ProcessExecutionException
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.data_pack import DataPack
-from forte.processors.base import PackProcessor
-from ft.onto.base_ontology import EntityMention, Sentence, Token
+from forte.processors.base import FixedSizeBatchProcessor, PackProcessor
+from ft.onto.base_ontology import Document, EntityMention, Sentence, Token
 
 __all__ = [
     "SpacyProcessor",
+    "SpacyBatchProcessor",
 ]
 
+# The spaCy pipeline components used by each of the processors, the parser is
+# always used to segment the sentences.
+_SPACY_COMPONENTS = {
+    'pos': ['tagger'],
+    'lemma': ['tagger'],
+    'ner': ['ner'],
+}
+
+
+def _load_model(lang_model: str, disable: Sequence[str] = ()) -> Language:
+    try:
+        return spacy.load(lang_model, disable=disable)
+    except OSError:
+        download(lang_model)
+        return spacy.load(lang_model, disable=disable)
+
+
+def _shift(positions: List[int], offset: int) -> List[int]:
+    return [position + offset for position in positions]
+
 
 class SpacyProcessor(PackProcessor):
     """
@@ -41,11 +62,7 @@ class SpacyProcessor(PackProcessor):
         self.lang_model: str = ''
 
     def set_up(self):
-        try:
-            self.nlp = spacy.load(self.lang_model)
-        except OSError:
-            download(self.lang_model)
-            self.nlp = spacy.load(self.lang_model)
+        self.nlp = _load_model(self.lang_model)
 
     # pylint: disable=unused-argument
     def initialize(self, resources: Resources, configs: Config):
@@ -80,21 +97,23 @@ class SpacyProcessor(PackProcessor):
         Returns:
 
         """
+        words = []
         for sentence in sentences:
             Sentence(input_pack, sentence.start_char, sentence.end_char)
 
             if "tokenize" in self.processors:
                 # Iterating through spaCy token objects
-                for word in sentence:
-                    begin_pos_word = word.idx
-                    end_pos_word = begin_pos_word + len(word.text)
-                    token = Token(input_pack, begin_pos_word, end_pos_word)
-
-                    if "pos" in self.processors:
-                        token.pos = word.tag_
+                words.extend(sentence)
 
-                    if "lemma" in self.processors:
-                        token.lemma = word.lemma_
+        # Add the tokens to the pack at once.
+        fields = {}
+        if "pos" in self.processors:
+            fields["pos"] = [word.tag_ for word in words]
+        if "lemma" in self.processors:
+            fields["lemma"] = [word.lemma_ for word in words]
+        input_pack.add_annotations(
+            Token, [word.idx for word in words],
+            [word.idx + len(word.text) for word in words], **fields)
 
     def _process_ner(self, result, input_pack):
         """Perform spaCy's NER Pipeline on the document.
@@ -126,3 +145,132 @@ class SpacyProcessor(PackProcessor):
 
         # Process sentence parses.
         self._process_parser(result.sents, input_pack)
+
+
+class SpacyBatchProcessor(FixedSizeBatchProcessor):
+    """
+    A wrapper for spaCy processors, which processes the documents of the packs
+    in batches with ``nlp.pipe``, and only runs the spaCy components needed by
+    the configured ``processors``. The results are the same as
+    :class:`SpacyProcessor` when the documents cover the text of the packs.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.processors: Set[str] = set()
+        self.nlp: Optional[Language] = None
+        self.n_process: int = 1
+        self.pipe_batch_size: int = 1
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self.processors = {
+            p.strip() for p in configs.processors.split(',') if p.strip()}
+
+        needed = {'parser'}
+        for p in self.processors:
+            needed.update(_SPACY_COMPONENTS.get(p, []))
+        self.nlp = _load_model(
+            configs.lang, [c for c in ('tagger', 'parser', 'ner')
+                           if c not in needed])
+
+        self.n_process = configs.n_process
+        self.pipe_batch_size = configs.batcher.batch_size
+
+    @staticmethod
+    def _define_context():
+        return Document
+
+    @staticmethod
+    def _define_input_info():
+        return {}
+
+    @classmethod
+    def default_configs(cls):
+        """
+        This defines a basic config structure for spaCy. The batch size of
+        the batcher is the number of documents in each ``nlp.pipe`` call, and
+        ``n_process`` is the number of processes used by ``nlp.pipe``.
+        Returns:
+
+        """
+        config = super().default_configs()
+        config.update({
+            'processors': 'tokenize, pos, lemma',
+            'lang': 'en_core_web_sm',
+            # Language code for the language to build the Pipeline
+            'use_gpu': False,
+            'n_process': 1,
+        })
+        config['batcher'] = {'batch_size': 64}
+        return config
+
+    def predict(self, data_batch: Dict) -> Dict[str, List]:
+        if self.nlp is None:
+            raise ProcessExecutionException(
+                "The SpaCy pipeline is not initialized, maybe you "
+                "haven't called the initialization function.")
+
+        tokenize = "tokenize" in self.processors
+        outputs: Dict[str, List] = {
+            'offset': data_batch['offset'],
+            'sentence_begins': [],
+            'sentence_ends': [],
+            'token_begins': [],
+            'token_ends': [],
+        }
+        if "pos" in self.processors:
+            outputs['pos'] = []
+        if "lemma" in self.processors:
+            outputs['lemma'] = []
+        if "ner" in self.processors:
+            outputs['entity_begins'] = []
+            outputs['entity_ends'] = []
+            outputs['ner_type'] = []
+
+        # The spaCy docs are converted to plain values here, so they are not
+        # kept in the batch.
+        for doc in self.nlp.pipe(data_batch['context'],
+                                 batch_size=self.pipe_batch_size,
+                                 n_process=self.n_process):
+            sentences = list(doc.sents)
+            outputs['sentence_begins'].append(
+                [sentence.start_char for sentence in sentences])
+            outputs['sentence_ends'].append(
+                [sentence.end_char for sentence in sentences])
+
+            words = [word for sentence in sentences for word in sentence] \
+                if tokenize else []
+            outputs['token_begins'].append([word.idx for word in words])
+            outputs['token_ends'].append(
+                [word.idx + len(word.text) for word in words])
+            if 'pos' in outputs:
+                outputs['pos'].append([word.tag_ for word in words])
+            if 'lemma' in outputs:
+                outputs['lemma'].append([word.lemma_ for word in words])
+
+            if 'ner_type' in outputs:
+                outputs['entity_begins'].append(
+                    [ent.start_char for ent in doc.ents])
+                outputs['entity_ends'].append(
+                    [ent.end_char for ent in doc.ents])
+                outputs['ner_type'].append([ent.label_ for ent in doc.ents])
+        return outputs
+
+    def pack(self, pack: DataPack, inputs: Dict[str, List]):
+        for i, offset in enumerate(inputs['offset']):
+            if 'ner_type' in inputs:
+                pack.add_annotations(
+                    EntityMention, _shift(inputs['entity_begins'][i], offset),
+                    _shift(inputs['entity_ends'][i], offset),
+                    ner_type=inputs['ner_type'][i])
+
+            pack.add_annotations(
+                Sentence, _shift(inputs['sentence_begins'][i], offset),
+                _shift(inputs['sentence_ends'][i], offset))
+
+            fields = {name: inputs[name][i] for name in ('pos', 'lemma')
+                      if name in inputs}
+            pack.add_annotations(
+                Token, _shift(inputs['token_begins'][i], offset),
+                _shift(inputs['token_ends'][i], offset), **fields)
@@ -0,0 +1,137 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Execute the stages of a pipeline in parallel threads.
+
+The reader and each stage run in their own threads, and pass the packs to the
+next stage through bounded queues. A stage blocks when the queue to the next
+stage is full, so a slow stage slows down the stages before it instead of
+accumulating the packs in memory. Since each stage processes the packs in the
+order they arrive, the order of the packs is preserved.
+"""
+import queue
+import threading
+from typing import Any, Callable, Iterator, List, Optional
+
+from forte.common.exception import ProcessorConfigError
+
+__all__ = [
+    "ThreadedStageExecutor",
+]
+
+# A stage takes the iterator of the input packs and returns the iterator of
+# the output packs.
+StageType = Callable[[Iterator[Any]], Iterator[Any]]
+
+# How often (in seconds) the blocked threads check whether to stop.
+_POLL_INTERVAL = 0.1
+
+
+class _EndOfData:
+    r"""Put in a queue after the last pack, carrying the exception if the
+    upstream stage fails."""
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+
+class ThreadedStageExecutor:
+    r"""Run a chain of stages in parallel threads connected by bounded
+    queues.
+
+    Args:
+        queue_size: The capacity of the queue between two stages.
+    """
+
+    def __init__(self, queue_size: int = 2):
+        if queue_size < 1:
+            raise ProcessorConfigError(
+                f"The queue size should be positive, got {queue_size}.")
+        self.queue_size = queue_size
+
+    def process(self, data_iter: Iterator[Any],
+                stages: List[StageType]) -> Iterator[Any]:
+        r"""Feed ``data_iter`` through ``stages``, where the data iterator and
+        each stage are consumed in their own threads.
+
+        Args:
+            data_iter: The input packs, usually read by the reader.
+            stages: The stages to process the packs.
+
+        Returns:
+            An iterator of the packs from the last stage.
+        """
+        stop = threading.Event()
+        queues: List[queue.Queue] = [
+            queue.Queue(self.queue_size) for _ in range(len(stages) + 1)]
+
+        threads = [threading.Thread(
+            target=self._produce, args=(data_iter, queues[0], stop),
+            name='forte-stage-reader', daemon=True)]
+        for i, stage in enumerate(stages):
+            threads.append(threading.Thread(
+                target=self._produce,
+                args=(stage(self._consume(queues[i], stop)), queues[i + 1],
+                      stop),
+                name=f'forte-stage-{i}', daemon=True))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for item in self._consume(queues[-1], stop):
+                yield item
+        finally:
+            # Stop the threads if the consumer stops early or fails.
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    @staticmethod
+    def _put(out_queue: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _consume(in_queue: queue.Queue,
+                 stop: threading.Event) -> Iterator[Any]:
+        while not stop.is_set():
+            try:
+                item = in_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if isinstance(item, _EndOfData):
+                if item.error is not None:
+                    # Raise the original exception of the failed stage.
+                    raise item.error
+                return
+            yield item
+
+    def _produce(self, items: Iterator[Any], out_queue: queue.Queue,
+                 stop: threading.Event):
+        try:
+            for item in items:
+                if not self._put(out_queue, item, stop):
+                    return
+        except BaseException as e:  # pylint: disable=broad-except
+            # Pass the exception to the consumer of the last stage.
+            self._put(out_queue, _EndOfData(e), stop)
+        else:
+            self._put(out_queue, _EndOfData(), stop)
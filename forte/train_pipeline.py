@@ -21,7 +21,7 @@ from forte.data.readers.base_reader import BaseReader
 from forte.evaluation.base.base_evaluator import Evaluator
 from forte.pipeline import Pipeline
 from forte.processors.base import BaseProcessor
-from forte.trainer.base import BaseTrainer
+from forte.trainer.base import BaseTrainer, fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -80,13 +80,17 @@ class TrainPipeline:
         prepare_pl.run(self.configs.config_data.train_path)
 
     def train(self):
+        data_key = self._train_data_key()
         epoch = 0
         while True:
             epoch += 1
-            for pack in self.train_reader.iter(
-                    self.configs.config_data.train_path):
-                for instance in pack.get_data(**self.trainer.data_request()):
-                    self.trainer.consume(instance)
+            if not self.trainer.restore_instances(data_key):
+                for pack in self.train_reader.iter(
+                        self.configs.config_data.train_path):
+                    for instance in pack.get_data(
+                            **self.trainer.data_request()):
+                        self.trainer.consume(instance)
+                self.trainer.store_instances(data_key)
 
             self.trainer.epoch_finish_action(epoch)
 
@@ -99,6 +103,15 @@ class TrainPipeline:
 
             logging.info("End of epoch %d", epoch)
 
+    def _train_data_key(self) -> str:
+        # The training instances depend on the reader, the training data and
+        # the request of the trainer.
+        return fingerprint(
+            type(self.train_reader).__qualname__,
+            self.train_reader.configs.todict(),
+            self.configs.config_data.train_path,
+            repr(self.trainer.data_request()))
+
     def _validate(self, epoch: int):
         validation_result = {"epoch": epoch}
 
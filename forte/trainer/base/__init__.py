@@ -13,3 +13,4 @@
 # limitations under the License.
 
 from forte.trainer.base.base_trainer import *
+from forte.trainer.base.instance_store import *
@@ -141,6 +141,40 @@ class BaseTrainer(PipelineComponent):
         """
         pass
 
+    def restore_instances(self, data_key: str) -> bool:
+        """
+        This function will be called by the pipeline at the beginning of
+        each epoch. A trainer that keeps the instances consumed in the
+        previous epochs (see
+        :class:`~forte.trainer.base.instance_store.InstanceStore`) can restore
+        them here, so the pipeline does not read the training data again.
+
+        Args:
+            data_key: The key of the training data, which changes when the
+                reader or its configuration changes.
+
+        Returns: True if the instances are restored, in which case
+            :meth:`consume` is not called in this epoch.
+        """
+        # pylint: disable=unused-argument
+        return False
+
+    def store_instances(self, data_key: str):
+        """
+        This function will be called by the pipeline after all the training
+        instances of an epoch are consumed, if they are not restored by
+        :meth:`restore_instances`. The trainer can store the consumed
+        instances to be restored in the later epochs.
+
+        Args:
+            data_key: The key of the training data, same as in
+                :meth:`restore_instances`.
+
+        Returns:
+
+        """
+        pass
+
     def request_eval(self):
         """
         The trainer should call this method to inform the pipeline to
@@ -0,0 +1,189 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Store the encoded training instances across the epochs.
+"""
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = [
+    "InstanceStore",
+    "fingerprint",
+]
+
+_META_FILE = "meta.json"
+
+
+def fingerprint(*values: Any) -> str:
+    r"""Compute a digest of the picklable ``values``, which is used as the key
+    of the instances built from them."""
+    return hashlib.sha1(
+        pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class _RaggedField:
+    r"""A field of the instances, where the value of each instance is a 1-D
+    array (``depth`` 1), or a list of 1-D arrays (``depth`` 2). The values
+    are concatenated into ``data``, and ``offsets[d]`` gives the boundaries
+    of the values at each depth."""
+
+    def __init__(self, depth: int, data: np.ndarray,
+                 offsets: List[np.ndarray]):
+        self.depth = depth
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, values: Sequence[Any]) -> "_RaggedField":
+        depth = 1 if isinstance(values[0], np.ndarray) else 2
+        if depth == 1:
+            arrays = [np.asarray(v) for v in values]
+            offsets = [_offsets(len(v) for v in arrays)]
+        else:
+            arrays = [np.asarray(a) for v in values for a in v]
+            offsets = [_offsets(len(v) for v in values),
+                       _offsets(len(a) for a in arrays)]
+        data = np.concatenate(arrays) if arrays else np.empty(0, np.int64)
+        return cls(depth, data, offsets)
+
+    def values(self) -> List[Any]:
+        # Split the data into views, from the innermost depth out.
+        bounds = self.offsets[-1]
+        values: List[Any] = [self.data[bounds[i]:bounds[i + 1]]
+                             for i in range(len(bounds) - 1)]
+        if self.depth == 2:
+            bounds = self.offsets[0]
+            values = [values[bounds[i]:bounds[i + 1]]
+                      for i in range(len(bounds) - 1)]
+        return values
+
+
+def _save_array(path: str, array: np.ndarray):
+    # Replace the file instead of writing it in place, since the old file may
+    # still be memory-mapped by a loaded store.
+    with open(path + ".tmp", "wb") as f:
+        np.save(f, array)
+    os.replace(path + ".tmp", path)
+
+
+def _offsets(lengths: Iterator[int]) -> np.ndarray:
+    offsets = np.fromiter(lengths, dtype=np.int64)
+    return np.concatenate([[0], np.cumsum(offsets)]).astype(np.int64)
+
+
+class InstanceStore:
+    r"""The training instances encoded by a trainer, kept in compact arrays
+    so they can be replayed in the later epochs without reading and encoding
+    the data again.
+
+    Each instance is a tuple of fields, where each field is a 1-D array, or a
+    list of 1-D arrays, such as the char ids of each word of a sentence. The
+    values of a field are concatenated into a single array, and the
+    instances returned by the store are views of these arrays.
+
+    The store is identified by ``key``, which the trainer should derive from
+    everything that the encoded instances depend on, such as the
+    configuration of the reader and the vocabulary (see :func:`fingerprint`).
+    A store saved to disk is only loaded back with the same key.
+
+    Args:
+        key: The key of the instances.
+        instances: The encoded instances.
+    """
+
+    def __init__(self, key: str, instances: Sequence[Tuple]):
+        self.key = key
+        self._fields: List[_RaggedField] = []
+        if instances:
+            self._fields = [_RaggedField.build(values)
+                            for values in zip(*instances)]
+        self._build_views(len(instances))
+
+    def _build_views(self, size: int):
+        if self._fields:
+            self._instances = list(
+                zip(*(field.values() for field in self._fields)))
+        else:
+            self._instances = [()] * size
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __getitem__(self, index: int) -> Tuple:
+        return self._instances[index]
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return iter(self._instances)
+
+    def save(self, path: str):
+        r"""Save the store to the directory ``path``."""
+        os.makedirs(path, exist_ok=True)
+        # The meta file is removed first and written last, so an incomplete
+        # store is not loaded.
+        meta_path = os.path.join(path, _META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        for i, field in enumerate(self._fields):
+            _save_array(os.path.join(path, f"field_{i}.npy"), field.data)
+            for d, offsets in enumerate(field.offsets):
+                _save_array(
+                    os.path.join(path, f"field_{i}_offsets_{d}.npy"), offsets)
+
+        with open(meta_path, "w") as f:
+            json.dump({
+                "key": self.key,
+                "size": len(self),
+                "depths": [field.depth for field in self._fields],
+            }, f)
+
+    @classmethod
+    def load(cls, path: str, key: str,
+             mmap: bool = True) -> Optional["InstanceStore"]:
+        r"""Load the store saved in the directory ``path``.
+
+        Args:
+            path: The directory of the store.
+            key: The expected key of the store.
+            mmap: Whether to memory-map the arrays instead of reading them
+                into memory.
+
+        Returns:
+            The store, or `None` if there is no store saved with ``key`` in
+            ``path``.
+        """
+        meta_path = os.path.join(path, _META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["key"] != key:
+            return None
+
+        store = cls(key, [])
+        for i, depth in enumerate(meta["depths"]):
+            data_path = os.path.join(path, f"field_{i}.npy")
+            store._fields.append(_RaggedField(
+                depth,
+                np.load(data_path, mmap_mode="r") if mmap
+                else np.load(data_path),
+                [np.load(os.path.join(path, f"field_{i}_offsets_{d}.npy"))
+                 for d in range(depth)]))
+        store._build_views(meta["size"])
+        return store
@@ -32,8 +32,10 @@ from tqdm import tqdm
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.models.ner import utils
+from forte.models.ner.featurizer import NERFeaturizer, pad_ids
 from forte.models.ner.model_factory import BiRecurrentConvCRF
 from forte.trainer.base.base_trainer import BaseTrainer
+from forte.trainer.base.instance_store import InstanceStore, fingerprint
 from ft.onto.base_ontology import Token, Sentence
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,7 @@ class CoNLLNERTrainer(BaseTrainer):
         self.config_model = None
         self.config_data = None
         self.normalize_func = None
+        self.featurizer = None
 
         self.device = None
         self.optim, self.trained_epochs = None, None
@@ -62,6 +65,8 @@ class CoNLLNERTrainer(BaseTrainer):
         self.resource: Optional[Resources] = None
 
         self.train_instances_cache = []
+        # The encoded training instances kept across the epochs.
+        self.instance_store = None
 
         # Just for recording
         self.max_char_length = 0
@@ -92,6 +97,9 @@ class CoNLLNERTrainer(BaseTrainer):
         self.config_data = configs.config_data
 
         self.normalize_func = utils.normalize_digit_word
+        self.featurizer = NERFeaturizer(
+            self.word_alphabet, self.char_alphabet, self.normalize_func,
+            self.config_data.max_char_length, self.config_data.num_char_pad)
 
         self.device = torch.device("cuda") if torch.cuda.is_available() \
             else torch.device("cpu")
@@ -143,28 +151,77 @@ class CoNLLNERTrainer(BaseTrainer):
         """
 
         tokens = instance["Token"]
-        word_ids = []
-        char_id_seqs = []
-        ner_tags, ner_ids = tokens["ner"], []
+        word_ids, char_id_seqs = self.featurizer.encode(tokens["text"])
+        ner_ids = np.fromiter(
+            (self.ner_alphabet.get_index(ner) for ner in tokens["ner"]),
+            dtype=np.int64, count=len(tokens["ner"]))
 
-        for word in tokens["text"]:
-            char_ids = []
-            for char in word:
-                char_ids.append(self.char_alphabet.get_index(char))
-            if len(char_ids) > self.config_data.max_char_length:
-                char_ids = char_ids[: self.config_data.max_char_length]
-            char_id_seqs.append(char_ids)
+        max_len = max((len(char_seq) for char_seq in char_id_seqs), default=0)
+        self.max_char_length = max(self.max_char_length, max_len)
 
-            word = self.normalize_func(word)
-            word_ids.append(self.word_alphabet.get_index(word))
+        self.train_instances_cache.append((word_ids, char_id_seqs, ner_ids))
 
-        for ner in ner_tags:
-            ner_ids.append(self.ner_alphabet.get_index(ner))
+    def _instance_key(self, data_key: str) -> str:
+        # The instances are invalidated when the vocabulary changes.
+        return fingerprint(
+            data_key, self.word_alphabet.instances,
+            self.char_alphabet.instances, self.ner_alphabet.instances,
+            self.config_data.max_char_length)
 
-        max_len = max([len(char_seq) for char_seq in char_id_seqs])
-        self.max_char_length = max(self.max_char_length, max_len)
+    def restore_instances(self, data_key: str) -> bool:
+        """
+        Restore the training instances encoded in the previous epochs, or
+        saved in ``instance_cache_dir`` of the data config by a previous run
+        with the same data and vocabulary.
 
-        self.train_instances_cache.append((word_ids, char_id_seqs, ner_ids))
+        Args:
+            data_key: The key of the training data.
+
+        Returns: True if the instances are restored.
+        """
+        if not self.config_data.get("cache_instances", True):
+            return False
+
+        key = self._instance_key(data_key)
+        if self.instance_store is None or self.instance_store.key != key:
+            self.instance_store = None
+            cache_dir = self.config_data.get("instance_cache_dir")
+            if cache_dir:
+                self.instance_store = InstanceStore.load(cache_dir, key)
+            if self.instance_store is None:
+                return False
+            logger.info(f"Loaded {len(self.instance_store)} training "
+                        f"instances from {cache_dir}")
+            self.max_char_length = max(
+                (len(char_ids) for _, char_id_seqs, _ in self.instance_store
+                 for char_ids in char_id_seqs), default=0)
+
+        self.train_instances_cache = list(self.instance_store)
+        return True
+
+    def store_instances(self, data_key: str):
+        """
+        Keep the training instances consumed in this epoch in an
+        :class:`~forte.trainer.base.instance_store.InstanceStore`, which is
+        also saved to ``instance_cache_dir`` of the data config if set.
+
+        Args:
+            data_key: The key of the training data.
+
+        Returns:
+
+        """
+        if not self.config_data.get("cache_instances", True):
+            return
+
+        self.instance_store = InstanceStore(
+            self._instance_key(data_key), self.train_instances_cache)
+        cache_dir = self.config_data.get("instance_cache_dir")
+        if cache_dir:
+            self.instance_store.save(cache_dir)
+        # Train on the views of the store, so the arrays of each instance
+        # are released.
+        self.train_instances_cache = list(self.instance_store)
 
     def epoch_finish_action(self, epoch):
         """
@@ -374,50 +431,11 @@ class CoNLLNERTrainer(BaseTrainer):
             - ``lengths``: A tensor of shape `[batch_size]` representing the
               length of each sentences in the batch
         """
-        batch_size = len(data)
-        batch_length = max([len(d[0]) for d in data])
-        char_length = max(
-            [max([len(charseq) for charseq in d[1]]) for d in data]
-        )
-
-        char_length = min(
-            self.config_data.max_char_length,
-            char_length + self.config_data.num_char_pad,
-        )
-
-        wid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-        cid_inputs = np.empty(
-            [batch_size, batch_length, char_length], dtype=np.int64
-        )
-        nid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-
-        masks = np.zeros([batch_size, batch_length], dtype=np.float32)
-
-        lengths = np.empty(batch_size, dtype=np.int64)
-
-        for i, inst in enumerate(data):
-            wids, cid_seqs, nids = inst
-
-            inst_size = len(wids)
-            lengths[i] = inst_size
-            # word ids
-            wid_inputs[i, :inst_size] = wids
-            wid_inputs[i, inst_size:] = self.word_alphabet.pad_id
-            for c, cids in enumerate(cid_seqs):
-                cid_inputs[i, c, : len(cids)] = cids
-                cid_inputs[i, c, len(cids):] = self.char_alphabet.pad_id
-            cid_inputs[i, inst_size:, :] = self.char_alphabet.pad_id
-            # ner ids
-            nid_inputs[i, :inst_size] = nids
-            nid_inputs[i, inst_size:] = self.ner_alphabet.pad_id
-            # masks
-            masks[i, :inst_size] = 1.0
-
-        words = torch.from_numpy(wid_inputs).to(device)
-        chars = torch.from_numpy(cid_inputs).to(device)
+        words, chars, masks, lengths = self.featurizer.get_batch_tensor(
+            [(d[0], d[1]) for d in data], device)
+        nid_inputs, _ = pad_ids([d[2] for d in data],
+                                self.ner_alphabet.pad_id)
         ners = torch.from_numpy(nid_inputs).to(device)
-        masks = torch.from_numpy(masks).to(device)
-        lengths = torch.from_numpy(lengths).to(device)
 
         return words, chars, ners, masks, lengths
 
@@ -17,7 +17,7 @@ Utility functions
 from functools import wraps
 from inspect import getfullargspec
 from pydoc import locate
-from typing import Dict, List, Optional, get_type_hints
+from typing import Dict, List, Optional, Tuple, get_type_hints
 
 from typing_inspect import is_union_type, get_origin
 
@@ -28,6 +28,7 @@ __all__ = [
     "get_qual_name",
     "create_class_with_kwargs",
     "check_type",
+    "get_check_types",
 ]
 
 
@@ -156,6 +157,28 @@ def check_type(obj, tp):
             return check_type(obj, origin)
 
 
+def get_check_types(tp) -> Tuple:
+    r"""Get the types that an object is checked against by
+    :func:`check_type`, so that ``check_type(obj, tp)`` is the same as
+    ``isinstance(obj, get_check_types(tp))``, but the type hint does not need
+    to be inspected again for each object.
+
+    Args:
+        tp: The type hint.
+
+    Returns:
+        A tuple of types.
+    """
+    if is_union_type(tp):
+        return tuple(t for a in tp.__args__ for t in get_check_types(a))
+    else:
+        origin = get_origin(tp)
+        if origin is None or origin == tp:
+            return (tp,)
+        else:
+            return get_check_types(origin)
+
+
 def validate_input(func, **kwargs):
     hints = get_type_hints(func)
 
@@ -0,0 +1,107 @@
+"""
+Script to run the benchmarks of the core data model and the pipeline engine,
+save the results as a baseline, and compare the results with a baseline.
+
+The timings depend on the machine, so the stored `baseline.json` is only a
+reference of the numbers at the time it is saved. Before comparing a change,
+regenerate the baseline locally on the revision before the change, and
+compare on the same machine:
+
+    git stash
+    python -m scripts.benchmark --save_baseline --baseline /tmp/base.json
+    git stash pop
+    python -m scripts.benchmark --compare --baseline /tmp/base.json
+
+When a change adds or fixes a benchmark, or changes the performance on
+purpose, save the stored baseline again with `--save_baseline`.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from scripts.benchmark.benchmarks import (
+    BENCHMARKS, compare_reports, run_benchmarks)
+
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+log = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the core data model and the pipeline engine.")
+    parser.add_argument('-s', '--size', type=int, default=100,
+                        help='The number of synthetic sentences used in '
+                             'each benchmark.')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='The number of times to run each benchmark.')
+    parser.add_argument('-b', '--benchmarks', type=str, nargs='*',
+                        default=None, choices=list(BENCHMARKS.keys()),
+                        help='The benchmarks to run, run all if not set.')
+    parser.add_argument('-o', '--output', type=str, default=None,
+                        help='The path to write the JSON report.')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE,
+                        help='The path of the baseline report.')
+    parser.add_argument('--save_baseline', default=False,
+                        action='store_true',
+                        help='Save the report as the baseline.')
+    parser.add_argument('--compare', default=False, action='store_true',
+                        help='Compare the report with the baseline, and exit '
+                             'with status 1 if there are regressions. The '
+                             'baseline should be run on the same machine.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='The relative change of the time to be counted '
+                             'as a regression or an improvement.')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.size, args.repeat, args.benchmarks)
+    for name, result in report["results"].items():
+        if "error" in result:
+            log.info("%-24s error: %s", name, result["error"])
+        else:
+            log.info("%-24s min %.6fs, median %.6fs", name,
+                     result["min"], result["median"])
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        log.info("Report written to %s.", args.output)
+
+    if args.save_baseline:
+        errors = [name for name, result in report["results"].items()
+                  if "error" in result]
+        if errors:
+            log.error("Not saving the baseline, since these benchmarks "
+                      "failed: %s.", ", ".join(errors))
+            sys.exit(1)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        log.info("Baseline written to %s.", args.baseline)
+
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ("python", "platform"):
+            if baseline["meta"].get(key) != report["meta"][key]:
+                log.warning(
+                    "The baseline is run with %s %s, but this run is with "
+                    "%s. The timings on different machines are not "
+                    "comparable, please regenerate the baseline locally.",
+                    key, baseline["meta"].get(key), report["meta"][key])
+        comparison = compare_reports(report, baseline, args.threshold)
+        for item in comparison:
+            if item["ratio"] is None:
+                log.info("%-24s %s", item["name"], item["status"])
+            else:
+                log.info("%-24s %s: %.6fs -> %.6fs (x%.2f)", item["name"],
+                         item["status"], item["baseline"], item["current"],
+                         item["ratio"])
+        if any(item["status"] == "regression" for item in comparison):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
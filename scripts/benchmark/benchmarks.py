@@ -0,0 +1,337 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of the core data model and the pipeline engine, running on
+synthetic packs.
+
+Each benchmark has a setup function, which builds the inputs from the size of
+the benchmark (the number of sentences), and a run function, which is timed.
+The setup is run again before each repeat, so the benchmarks can modify their
+inputs.
+"""
+import gc
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
+from forte.data.readers.base_reader import PackReader
+from forte.data.types import DataRequest
+from forte.pack_manager import PackManager
+from forte.pipeline import Pipeline
+from forte.processors.base import FixedSizeBatchProcessor, PackProcessor
+from forte.version import VERSION
+from ft.onto.base_ontology import (
+    Token, Sentence, Document, EntityMention, Dependency)
+
+__all__ = [
+    "BENCHMARKS",
+    "make_pack",
+    "run_benchmarks",
+    "compare_reports",
+]
+
+# The number of tokens in each synthetic sentence.
+TOKENS_PER_SENTENCE = 20
+
+# The synthetic packs of the pipeline benchmark have this many sentences, the
+# size of the benchmark is the total number of sentences.
+SENTENCES_PER_PACK = 10
+
+BENCHMARKS: Dict[str, Tuple[Callable[[int], Any], Callable[[Any], Any]]] = {}
+
+
+def _benchmark(name: str, setup: Callable[[int], Any]):
+    def register(run: Callable[[Any], Any]):
+        BENCHMARKS[name] = (setup, run)
+        return run
+
+    return register
+
+
+def fill_pack(pack: DataPack, num_sentences: int):
+    r"""Fill ``pack`` with ``num_sentences`` synthetic sentences, with
+    tokens, entity mentions and dependency links between the tokens.
+    """
+    words = [f"w{i % 97}" for i in range(TOKENS_PER_SENTENCE)]
+    sentence_text = " ".join(words) + " ."
+    pack.set_text("\n".join([sentence_text] * num_sentences))
+
+    offset = 0
+    Document(pack, 0, len(pack.text))
+    for _ in range(num_sentences):
+        Sentence(pack, offset, offset + len(sentence_text))
+        tokens: List[Token] = []
+        begin = offset
+        for i, word in enumerate(words):
+            token = Token(pack, begin, begin + len(word))
+            token.pos = "NN" if i % 2 == 0 else "VB"
+            tokens.append(token)
+            begin += len(word) + 1
+
+        for i in range(0, len(tokens) - 1, 5):
+            EntityMention(pack, tokens[i].begin, tokens[i + 1].end)
+
+        for parent, child in zip(tokens, tokens[1:]):
+            dependency = Dependency(pack, parent, child)
+            dependency.dep_label = "dep"
+
+        offset += len(sentence_text) + 1
+    pack.add_all_remaining_entries()
+
+
+def make_pack(num_sentences: int,
+              pack_manager: Optional[PackManager] = None) -> DataPack:
+    r"""Create a synthetic pack with ``num_sentences`` sentences."""
+    pack = DataPack(pack_manager or PackManager())
+    fill_pack(pack, num_sentences)
+    return pack
+
+
+@_benchmark("add_entries", setup=lambda size: (make_pack(0), size))
+def _add_entries(state: Tuple[DataPack, int]):
+    pack, size = state
+    pack.set_text("a " * size * TOKENS_PER_SENTENCE)
+    for i in range(size * TOKENS_PER_SENTENCE):
+        pack.add_entry(Token(pack, 2 * i, 2 * i + 1))
+
+
+@_benchmark("add_annotations", setup=lambda size: (make_pack(0), size))
+def _add_annotations(state: Tuple[DataPack, int]):
+    pack, size = state
+    num = size * TOKENS_PER_SENTENCE
+    pack.set_text("a " * num)
+    pack.add_annotations(Token, list(range(0, 2 * num, 2)),
+                         list(range(1, 2 * num, 2)), pos=["NN"] * num)
+
+
+def _setup_delete(size: int) -> Tuple[DataPack, List[Token]]:
+    pack = make_pack(size)
+    return pack, list(pack.get(Token))[::2]
+
+
+@_benchmark("delete_entries", setup=_setup_delete)
+def _delete_entries(state: Tuple[DataPack, List[Token]]):
+    pack, tokens = state
+    for token in tokens:
+        pack.delete_entry(token)
+
+
+@_benchmark("get_range", setup=make_pack)
+def _get_range(pack: DataPack):
+    for sentence in pack.get(Sentence):
+        for _ in pack.get(Token, sentence):
+            pass
+
+
+@_benchmark("get_data", setup=make_pack)
+def _get_data(pack: DataPack):
+    request: DataRequest = {
+        Token: ["pos"],
+        EntityMention: {"unit": "Token"},
+        Dependency: {"fields": ["dep_label"]},
+    }
+    for _ in pack.get_data(Sentence, request):
+        pass
+
+
+@_benchmark("build_coverage_index", setup=make_pack)
+def _build_coverage_index(pack: DataPack):
+    pack.index.build_coverage_index(pack, Sentence, Token)
+
+
+@_benchmark("serialize_jsonpickle", setup=make_pack)
+def _serialize_jsonpickle(pack: DataPack):
+    pack.serialize()
+
+
+@_benchmark("serialize_binary", setup=make_pack)
+def _serialize_binary(pack: DataPack):
+    pack.serialize_binary()
+
+
+@_benchmark("deserialize_jsonpickle",
+            setup=lambda size: make_pack(size).serialize())
+def _deserialize_jsonpickle(data: str):
+    deserialize(PackManager(), data)
+
+
+@_benchmark("deserialize_binary",
+            setup=lambda size: make_pack(size).serialize_binary())
+def _deserialize_binary(data: bytes):
+    deserialize(PackManager(), data)
+
+
+@_benchmark("view", setup=make_pack)
+def _view(pack: DataPack):
+    pack.view()
+
+
+class _SyntheticReader(PackReader):
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        return iter(range(num_packs))
+
+    def _parse_pack(self, collection: int) -> Iterator[DataPack]:
+        pack = self.new_pack()
+        fill_pack(pack, SENTENCES_PER_PACK)
+        yield pack
+
+
+class _TaggingProcessor(PackProcessor):
+    def _process(self, input_pack: DataPack):
+        for token in input_pack.get(Token):
+            token.ner = "O"
+
+
+class _SentenceBatchProcessor(FixedSizeBatchProcessor):
+    @staticmethod
+    def _define_context():
+        return Sentence
+
+    @staticmethod
+    def _define_input_info():
+        return {Token: ["pos"]}
+
+    def predict(self, data_batch: Dict):
+        return {"label": [len(pos) for pos in data_batch["Token"]["pos"]]}
+
+    def pack(self, pack: DataPack, inputs):
+        # Label each sentence with an entity mention.
+        for sentence, _ in zip(pack.get(Sentence), inputs["label"]):
+            EntityMention(pack, sentence.begin, sentence.end)
+
+
+def _setup_pipeline(size: int) -> Tuple[Pipeline, int]:
+    nlp: Pipeline = Pipeline[DataPack]()
+    nlp.set_reader(_SyntheticReader())
+    nlp.add(_SentenceBatchProcessor(), config={"batcher": {"batch_size": 16}})
+    nlp.add(_TaggingProcessor())
+    nlp.initialize()
+    return nlp, max(1, size // SENTENCES_PER_PACK)
+
+
+@_benchmark("pipeline", setup=_setup_pipeline)
+def _pipeline(state: Tuple[Pipeline, int]):
+    nlp, num_packs = state
+    for _ in nlp.process_dataset(num_packs):
+        pass
+
+
+def _time(setup: Callable[[int], Any], run: Callable[[Any], Any],
+          size: int, repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        state = setup(size)
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return {
+        "size": size,
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+    }
+
+
+def run_benchmarks(size: int = 100, repeat: int = 5,
+                   names: Optional[List[str]] = None) -> Dict[str, Any]:
+    r"""Run the benchmarks and return the report.
+
+    Args:
+        size: The number of synthetic sentences used in each benchmark.
+        repeat: The number of times to run each benchmark.
+        names (list, optional): The benchmarks to run, if `None`, all the
+            benchmarks are run.
+
+    Returns:
+        The report, with the environment of the run in `"meta"`, and the
+        timing (in seconds) of each benchmark in `"results"`. If a
+        benchmark fails, the error is recorded instead of the timing.
+    """
+    if names is None:
+        names = list(BENCHMARKS.keys())
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark {name}, should be one of "
+                             f"{list(BENCHMARKS.keys())}.")
+        setup, run = BENCHMARKS[name]
+        try:
+            results[name] = _time(setup, run, size, repeat)
+        except Exception as e:  # pylint: disable=broad-except
+            results[name] = {"size": size, "error": repr(e)}
+
+    return {
+        "meta": {
+            "forte_version": VERSION,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = 0.2) -> List[Dict[str, Any]]:
+    r"""Compare the minimum time of the benchmarks in ``report`` with the
+    ``baseline`` report. The minimum of the repeats is used since it is the
+    least affected by the other loads of the machine.
+
+    Args:
+        report: The report of the current run.
+        baseline: The report to compare with.
+        threshold: The relative change of the time to be counted as a
+            regression or an improvement.
+
+    Returns:
+        The comparison of each benchmark in ``report``, where `"status"` is
+        one of `"regression"`, `"improvement"`, `"same"`, `"new"` (not in the
+        baseline), and `"error"` (failed in either of the runs).
+    """
+    comparison = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        item: Dict[str, Any] = {
+            "name": name,
+            "baseline": None if base is None else base.get("min"),
+            "current": result.get("min"),
+            "ratio": None,
+        }
+        if base is None:
+            item["status"] = "new"
+        elif "error" in result or "error" in base:
+            item["status"] = "error"
+        else:
+            if base["size"] != result["size"]:
+                raise ValueError(
+                    f"Cannot compare benchmark {name} of size "
+                    f"{result['size']} with the baseline of size "
+                    f"{base['size']}.")
+            ratio = result["min"] / base["min"]
+            item["ratio"] = ratio
+            if ratio > 1 + threshold:
+                item["status"] = "regression"
+            elif ratio < 1 / (1 + threshold):
+                item["status"] = "improvement"
+            else:
+                item["status"] = "same"
+        comparison.append(item)
+    return comparison
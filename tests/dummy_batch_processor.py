@@ -16,6 +16,7 @@ This file contains examples of batch processor implementations, which basically
 create entries arbitrarily. The processors here are useful as placeholders and
 test cases.
 """
+import threading
 from typing import Dict, Optional, Type
 
 import numpy as np
@@ -23,12 +24,14 @@ import numpy as np
 from forte.data.data_pack import DataPack
 from forte.data.types import DataRequest
 from forte.data.batchers import ProcessingBatcher, FixedSizeDataPackBatcher
-from forte.processors.base import BatchProcessor, FixedSizeBatchProcessor
+from forte.processors.base import (
+    BatchProcessor, FixedSizeBatchProcessor, TokenBudgetBatchProcessor)
 from ft.onto.base_ontology import Token, Sentence, EntityMention, RelationLink
 
 __all__ = [
     "DummyRelationExtractor",
     "DummyFixedSizeBatchProcessor",
+    "DummyTokenBudgetBatchProcessor",
 ]
 
 
@@ -143,3 +146,46 @@ class DummyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
         configs = super().default_configs()
         configs["batcher"] = {"batch_size": 10}
         return configs
+
+
+class DummyTokenBudgetBatchProcessor(TokenBudgetBatchProcessor):
+    r"""Record the sizes of the batches, and the sentences packed back to each
+    pack."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+        self.batch_contexts = []
+        self.packed = []
+        self.predict_threads = set()
+
+    @staticmethod
+    def _define_context() -> Type[Sentence]:
+        return Sentence
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {Token: []}
+
+    def predict(self, data_batch: Dict):
+        self.batch_sizes.append([len(t) for t in data_batch["Token"]["tid"]])
+        self.batch_contexts.append(list(data_batch["context"]))
+        self.predict_threads.add(threading.get_ident())
+        return {"context": data_batch["context"],
+                "offset": data_batch["offset"]}
+
+    def pack(self, data_pack: DataPack, output_dict: Optional[Dict] = None):
+        if output_dict is None:
+            return
+
+        for context, offset in zip(output_dict["context"],
+                                   output_dict["offset"]):
+            self.packed.append(
+                (data_pack.pack_name,
+                 data_pack.text[offset:offset + len(context)], context))
+
+    @classmethod
+    def default_configs(cls):
+        configs = super().default_configs()
+        configs["batcher"]["length_type"] = "Token"
+        return configs
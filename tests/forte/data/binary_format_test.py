@@ -0,0 +1,84 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the binary pack format.
+"""
+import unittest
+
+import numpy as np
+from ddt import ddt, data
+
+from forte.common.exception import PackDataException
+from forte.data import binary_format
+from forte.data.binary_format import _dumps, _loads
+from forte.data.data_pack import DataPack
+from forte.data.ontology.core import Pointer
+from forte.data.span import Span
+
+
+@ddt
+class BinaryFormatTest(unittest.TestCase):
+
+    @data(None, True, False, 0, -2 ** 63, 2 ** 80, -1.5, "", "text \ud800",
+          b"\x00bytes", [1, [2.0, None]], (1, "a"), {1, 2}, frozenset("ab"),
+          {"a": {"b": (Span(1, 2),)}, 3: []}, Span(3, 5), DataPack)
+    def test_values(self, value):
+        decoded = _loads(_dumps(value))
+        self.assertEqual(decoded, value)
+        self.assertIs(type(decoded), type(value))
+
+    def test_numpy(self):
+        array = np.arange(6, dtype=np.float32).reshape(2, 3)
+        decoded = _loads(_dumps(array))
+        self.assertEqual(decoded.dtype, array.dtype)
+        self.assertTrue(np.array_equal(decoded, array))
+        self.assertTrue(decoded.flags.writeable)
+
+        scalar = _loads(_dumps(np.int16(7)))
+        self.assertEqual(scalar, 7)
+        self.assertIsInstance(scalar, np.int16)
+
+    def test_objects(self):
+        pointer = _loads(_dumps([Pointer(3)]))[0]
+        self.assertIsInstance(pointer, Pointer)
+        self.assertEqual(pointer.tid, 3)
+
+    def test_invalid_data(self):
+        header = binary_format._HEADER.pack(
+            binary_format.MAGIC, binary_format.VERSION)
+
+        # Only classes are recovered, not arbitrary callables.
+        with self.assertRaises(PackDataException):
+            _loads(b"c" + _dumps("os.system"))
+        with self.assertRaises(PackDataException):
+            _loads(b"c" + _dumps("forte.no_such_module.Class"))
+
+        # The recovered classes should be packs and entries.
+        with self.assertRaises(PackDataException):
+            binary_format.deserialize_binary(header + _dumps(
+                {"class": Span, "state": {}, "entries": {}}))
+        with self.assertRaises(PackDataException):
+            binary_format.deserialize_binary(header + _dumps(
+                {"class": DataPack, "state": {}, "entries": {"generics": [
+                    {"class": Span, "count": 0, "columns": {}}]}}))
+
+        with self.assertRaises(PackDataException):
+            binary_format.deserialize_binary(
+                binary_format._HEADER.pack(binary_format.MAGIC, 1) + b"N")
+        with self.assertRaises(PackDataException):
+            _loads(_dumps(1) + b"N")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,7 +19,14 @@ import logging
 import unittest
 from typing import List, Tuple
 
+import numpy as np
+
+from forte.data import data_utils
 from forte.data.data_pack import DataPack
+from forte.data.data_utils_io import split_columns, slice_columns
+from forte.data.ontology.top import Annotation
+from forte.data.span import Span
+from forte.pack_manager import PackManager
 from forte.pipeline import Pipeline
 from forte.utils import utils
 from ft.onto.base_ontology import (
@@ -90,6 +97,71 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(len(instances[0]["Token"]), 5)
         self.assertEqual(len(instances[0]["EntityMention"]), 3)
 
+        # case 6: the units and the link ends are aligned to the positions
+        # of the requested entries.
+        for instance in self.data_pack.get_data(Sentence, request=requests):
+            token_tids = list(instance["Token"]["tid"])
+            for arg_tid, (begin, end) in zip(
+                    instance["PredicateArgument"]["tid"],
+                    instance["PredicateArgument"]["unit_span"]):
+                argument = self.data_pack.get_entry(arg_tid)
+                self.assertEqual(
+                    token_tids[begin:end],
+                    [t.tid for t in self.data_pack.get(Token, argument)])
+
+            links = instance["PredicateLink"]
+            for link_tid, parent, child in zip(
+                    links["tid"], links["parent"], links["child"]):
+                link = self.data_pack.get_entry(link_tid)
+                self.assertEqual(
+                    instance["PredicateMention"]["tid"][parent], link.parent)
+                self.assertEqual(
+                    instance["PredicateArgument"]["tid"][child], link.child)
+
+    def test_get_columnar_data(self):
+        requests = {
+            Sentence: ["speaker"],
+            Token: ["pos", "sense", "context_span"],
+            EntityMention: [],
+            PredicateMention: [],
+            PredicateArgument: {
+                "fields": [],
+                "unit": "Token"
+            },
+            PredicateLink: {
+                "component": utils.get_full_module_name(OntonotesReader),
+                "fields": ["parent", "child", "arg_type"]
+            }
+        }
+
+        instances = list(self.data_pack.get_data(Sentence, requests))
+        columns = self.data_pack.get_columnar_data(Sentence, requests)
+        self.assertEqual(len(columns["context"]), 2)
+        self.assertEqual(list(columns["Token"]["offsets"]),
+                         [0, len(instances[0]["Token"]["tid"]),
+                          len(columns["Token"]["tid"])])
+
+        batch = split_columns(columns)
+        for i, instance in enumerate(instances):
+            for key, value in instance.items():
+                if isinstance(value, dict):
+                    for field, field_value in value.items():
+                        np.testing.assert_array_equal(
+                            batch[key][field][i], field_value,
+                            err_msg=f"{key}.{field}")
+                else:
+                    self.assertEqual(batch[key][i], value)
+
+        sliced = slice_columns(columns, 1, 1)
+        self.assertEqual(list(sliced["Token"]["offsets"]),
+                         [0, len(instances[1]["Token"]["tid"])])
+        np.testing.assert_array_equal(sliced["PredicateLink"]["parent"],
+                                      instances[1]["PredicateLink"]["parent"])
+
+        columns = self.data_pack.get_columnar_data(
+            Sentence, requests, skip_k=1)
+        self.assertEqual(columns["offset"][0], 165)
+
     def test_get_entries(self):
         # case 1: test get annotation
         sent_texts: List[str] = []
@@ -158,6 +230,273 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(groups, [
             ['He', 'The Indonesian billionaire James Riady', 'he']])
 
+    def test_span_index(self):
+        sentences = list(self.data_pack.get(Sentence))
+
+        for sent in sentences:
+            expected = [
+                t for t in self.data_pack.annotations
+                if isinstance(t, Token) and t.span.begin >= sent.span.begin
+                and t.span.end <= sent.span.end]
+            self.assertEqual(list(self.data_pack.get(Token, sent)), expected)
+            self.assertEqual(
+                list(self.data_pack.index.span_index(Token, sent.span)),
+                expected)
+
+        # A span covering the end of the first sentence and the beginning of
+        # the second one.
+        span = Span(sentences[0].span.end - 5, sentences[1].span.begin + 3)
+        overlapped = list(
+            self.data_pack.index.span_index(Sentence, span, overlap=True))
+        self.assertEqual(overlapped, sentences)
+        self.assertEqual(
+            list(self.data_pack.index.span_index(Sentence, span)), [])
+
+        # Query on the super type will merge the entries of all sub types in
+        # the order of the data pack.
+        self.assertEqual(
+            list(self.data_pack.get(Annotation, sentences[1])),
+            [a for a in self.data_pack.annotations
+             if a.span.begin >= sentences[1].span.begin
+             and a.span.end <= sentences[1].span.end])
+
+        # The span index is updated together with the entries.
+        token = list(self.data_pack.get(Token, sentences[1]))[0]
+        self.data_pack.delete_entry(token)
+        self.assertNotIn(token.tid, [
+            t.tid for t in
+            self.data_pack.index.span_index(Token, sentences[1].span)])
+
+        new_token = Token(self.data_pack, token.span.begin, token.span.end)
+        self.data_pack.add_entry(new_token)
+        self.assertEqual(
+            list(self.data_pack.get(Token, sentences[1]))[0].tid,
+            new_token.tid)
+
+    def test_coverage_index(self):
+        index = self.data_pack.index
+
+        def expected_coverage(inner_type):
+            return {
+                sent.tid: {e.tid for e in self.data_pack.get(inner_type)
+                           if index.in_span(e, sent.span)}
+                for sent in self.data_pack.get(Sentence)}
+
+        with self.assertRaises(ValueError):
+            index.build_coverage_index(self.data_pack, Sentence, Span)
+
+        index.build_coverage_index(self.data_pack, Sentence, Token)
+        index.build_coverage_index(self.data_pack, Sentence, PredicateLink)
+        self.assertEqual(index.coverage_index(Sentence, Token),
+                         expected_coverage(Token))
+        self.assertEqual(index.coverage_index(Sentence, PredicateLink),
+                         expected_coverage(PredicateLink))
+
+        # The coverage index of annotations is updated with the entries.
+        sentences = list(self.data_pack.get(Sentence))
+        token = list(self.data_pack.get(Token, sentences[1]))[0]
+        self.data_pack.delete_entry(token)
+        new_token = self.data_pack.add_entry(
+            Token(self.data_pack, sentences[0].begin, sentences[0].begin + 1))
+        self.data_pack.add_annotations(
+            Token, [sentences[1].begin], [sentences[1].begin + 2])
+        new_sentence = self.data_pack.add_entry(
+            Sentence(self.data_pack, 0, sentences[1].end))
+        self.assertTrue(index.coverage_index_is_valid)
+        self.assertEqual(index.coverage_index(Sentence, Token),
+                         expected_coverage(Token))
+        self.assertIn(new_token.tid,
+                      index.coverage_index(Sentence, Token)[new_sentence.tid])
+        self.assertEqual(
+            [t.tid for t in self.data_pack.get(Token, new_sentence)],
+            [t.tid for t in self.data_pack.get(Token)
+             if t.end <= new_sentence.end])
+
+        # The coverage index of links is built again when needed.
+        self.assertIsNone(index.coverage_index(Sentence, PredicateLink))
+        index.build_coverage_index(self.data_pack, Sentence, PredicateLink)
+        self.assertEqual(index.coverage_index(Sentence, PredicateLink),
+                         expected_coverage(PredicateLink))
+
+    def test_get_ids_by_type(self):
+        token_ids = self.data_pack.get_ids_by_type(Token)
+        self.assertEqual(
+            set(token_ids),
+            {a.tid for a in self.data_pack.annotations if isinstance(a, Token)})
+
+        # Subclasses are included when querying with the base type.
+        annotation_ids = self.data_pack.get_ids_by_type(Annotation)
+        self.assertEqual(len(annotation_ids), len(self.data_pack.annotations))
+        self.assertTrue(token_ids <= annotation_ids)
+
+        # Set operations create new sets instead of changing the index.
+        sentence = self.data_pack.get_single(Sentence)
+        token = list(self.data_pack.get(Token))[0]
+        filtered = token_ids & {token.tid, sentence.tid}
+        self.assertEqual(filtered, {token.tid})
+        self.assertIn(sentence.tid, annotation_ids)
+
+        # The results are views of the index.
+        num_tokens = len(token_ids)
+        self.data_pack.delete_entry(token)
+        self.assertEqual(len(token_ids), num_tokens - 1)
+        self.assertNotIn(token.tid, annotation_ids)
+
+    def test_binary_serialization(self):
+        binary = self.data_pack.serialize_binary()
+        json_str = self.data_pack.serialize()
+        self.assertIsInstance(binary, bytes)
+        self.assertLess(len(binary), len(json_str))
+
+        pack: DataPack = data_utils.deserialize(PackManager(), binary)
+        self.assertEqual(pack.text, self.data_pack.text)
+        self.assertEqual(pack.pack_name, self.data_pack.pack_name)
+        self.assertEqual(pack.creation_records, self.data_pack.creation_records)
+        self.assertEqual(pack.field_records, self.data_pack.field_records)
+
+        for original, recovered in zip(self.data_pack, pack):
+            self.assertEqual(type(original), type(recovered))
+            self.assertEqual(original.tid, recovered.tid)
+            self.assertIs(recovered.pack, pack)
+
+        self.assertEqual(
+            [(s.text, s.speaker) for s in pack.get(Sentence)],
+            [(s.text, s.speaker) for s in self.data_pack.get(Sentence)])
+        self.assertEqual(
+            [(l.get_parent().text, l.get_child().text, l.arg_type)
+             for l in pack.get(PredicateLink)],
+            [(l.get_parent().text, l.get_child().text, l.arg_type)
+             for l in self.data_pack.get(PredicateLink)])
+
+        # New entries in the recovered pack will not reuse the old ids.
+        token = Token(pack, 0, 3)
+        self.assertGreater(token.tid, max(e.tid for e in self.data_pack))
+        pack.add_entry(token)
+
+    def test_partial_deserialization(self):
+        binary = self.data_pack.serialize_binary()
+
+        pack: DataPack = data_utils.deserialize(
+            PackManager(), binary, entry_types=[Sentence, Token])
+        self.assertEqual(len(list(pack.get(EntityMention))), 0)
+        self.assertEqual(len(list(pack.get(PredicateLink))), 0)
+        self.assertEqual(
+            [t.tid for t in pack.get(Token)],
+            [t.tid for t in self.data_pack.get(Token)])
+        self.assertEqual(
+            len(list(pack)),
+            len(list(self.data_pack.get(Sentence))) +
+            len(list(self.data_pack.get(Token))))
+
+    def test_lazy_deserialization(self):
+        binary = self.data_pack.serialize_binary()
+        pack: DataPack = data_utils.deserialize(
+            PackManager(), binary, lazy=True)
+
+        self.assertEqual(pack.text, self.data_pack.text)
+        self.assertEqual(len(pack.annotations), 0)
+        self.assertEqual(
+            len(list(pack.get(PredicateLink))),
+            len(list(self.data_pack.get(PredicateLink))))
+
+        sentences = list(pack.get(Sentence))
+        self.assertEqual(len(sentences), len(list(
+            self.data_pack.get(Sentence))))
+        self.assertEqual(len(pack.annotations), len(sentences))
+
+        # The parents and children of the links are loaded on demand.
+        link = next(iter(pack.get(PredicateLink)))
+        self.assertIsInstance(link.get_parent(), PredicateMention)
+        self.assertEqual(len(pack.get_ids_by_type(PredicateArgument)),
+                         len(self.data_pack.get_ids_by_type(
+                             PredicateArgument)))
+
+        tokens = list(pack.get(Token, sentences[0]))
+        self.assertEqual(
+            [t.tid for t in tokens],
+            [t.tid for t in self.data_pack.get(
+                Token, self.data_pack.get_entry(sentences[0].tid))])
+
+        # Serialization loads all the entries.
+        self.assertEqual(
+            data_utils.deserialize(PackManager(), pack.serialize()).text,
+            pack.text)
+        self.assertEqual(
+            [e.tid for e in pack], [e.tid for e in self.data_pack])
+
+    def test_view(self):
+        view: DataPack = self.data_pack.view()
+        self.assertEqual(view.text, self.data_pack.text)
+        self.assertEqual([e.tid for e in view],
+                         [e.tid for e in self.data_pack])
+        self.assertEqual(
+            view.serialize(drop_record=True),
+            self.data_pack.serialize(drop_record=True))
+        for entry in view:
+            self.assertIs(entry.pack, view)
+
+        # The links and groups point to the entries in the view.
+        link = next(view.get(PredicateLink))
+        self.assertIs(link.get_parent().pack, view)
+        group = next(view.get(CoreferenceGroup))
+        for member in group.get_members():
+            self.assertIs(member.pack, view)
+
+        # Changing the pack does not change the view, and vice versa.
+        token = next(self.data_pack.get(Token))
+        view_token = view.get_entry(token.tid)
+        pos = token.pos
+        token.pos = "NEW"
+        self.assertEqual(view_token.pos, pos)
+        view_token.sense = "NEW"
+        self.assertNotEqual(token.sense, "NEW")
+
+        num_sentences = len(list(self.data_pack.get(Sentence)))
+        self.data_pack.delete_entry(next(self.data_pack.get(Sentence)))
+        self.assertEqual(len(list(view.get(Sentence))), num_sentences)
+
+        new_token = Token(view, 0, 1)
+        view.add_all_remaining_entries()
+        self.assertIn(new_token.tid, view.get_ids_by_type(Token))
+        self.assertNotIn(
+            new_token.tid, self.data_pack.get_ids_by_type(Token))
+
+    def test_add_annotations(self):
+        pack = DataPack(PackManager())
+        pack.set_text("The big dog barks .")
+        pack.set_control_component("tokenizer")
+        begins, ends = [18, 0, 4, 8, 12], [19, 3, 7, 11, 17]
+        tokens = pack.add_annotations(
+            Token, begins, np.array(ends),
+            pos=["PUNCT", "DT", "JJ", "NN", None])
+        self.assertEqual([t.span for t in tokens],
+                         [Span(b, e) for b, e in zip(begins, ends)])
+        self.assertEqual(len(set(t.tid for t in tokens)), 5)
+        self.assertEqual([t.text for t in pack.get(Token)],
+                         ["The", "big", "dog", "barks", "."])
+        self.assertEqual(tokens[0].pos, "PUNCT")
+        self.assertIsNone(tokens[4].pos)
+        self.assertIsNone(tokens[0].lemma)
+        self.assertIsNot(tokens[0].ud_features, tokens[1].ud_features)
+        self.assertEqual(pack.creation_records["tokenizer"],
+                         set(t.tid for t in tokens))
+        self.assertIn((tokens[1].tid, "pos"), pack.field_records["tokenizer"])
+
+        # The same as adding the annotations one by one.
+        self.assertEqual(
+            [t.text for t in pack.get(Token, Sentence(pack, 4, 11))],
+            ["big", "dog"])
+        pack.add_all_remaining_entries()
+        self.assertEqual(pack.add_annotations(Token, [], []), [])
+
+        with self.assertRaises(TypeError):
+            pack.add_annotations(Token, [0], [3], pos=[1])
+        with self.assertRaises(ValueError):
+            pack.add_annotations(Token, [0], [30])
+        with self.assertRaises(ValueError):
+            pack.add_annotations(Token, [0, 4], [3, 7], pos=["DT"])
+        self.assertEqual(len(list(pack.get(Token))), 5)
+
     def test_delete_entry(self):
         # test delete entry
         sentences = list(self.data_pack.get(Sentence))
@@ -0,0 +1,78 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the batch utilities.
+"""
+
+import unittest
+
+import numpy as np
+
+from forte.data.data_utils_io import (
+    BatchBuilder, batch_instances, merge_batches, slice_batch, split_batch)
+
+
+def _instance(i):
+    return {"context": f"s{i}", "Token": {"text": [f"t{i}"], "tid": [i]}}
+
+
+class DataUtilsIOTest(unittest.TestCase):
+
+    def test_batch_builder(self):
+        instances = [_instance(i) for i in range(6)]
+
+        builder = BatchBuilder()
+        builder.add_batch(batch_instances(instances[:2]), 2)
+        builder.add_instance(instances[2])
+        builder.add_batch(batch_instances(instances[3:]), 3)
+        self.assertEqual(len(builder), 6)
+
+        batch = builder.build()
+        self.assertEqual(batch, merge_batches(
+            [batch_instances(instances[:3]), batch_instances(instances[3:])]))
+        self.assertEqual(batch, batch_instances(instances))
+        self.assertEqual(len(builder), 0)
+        self.assertEqual(builder.build(), {})
+
+    def test_split_batch(self):
+        batch = batch_instances([_instance(i) for i in range(6)])
+        batch["Token"]["score"] = np.arange(6)
+
+        parts = list(split_batch(batch, [1, 0, 3, 2]))
+        self.assertEqual(len(parts), 4)
+        start = 0
+        for part, size in zip(parts, [1, 0, 3, 2]):
+            expected = slice_batch(batch, start, size)
+            self.assertEqual(part["context"], expected["context"])
+            self.assertEqual(len(part["Token"]["tid"]), size)
+            self.assertEqual(part["Token"]["tid"], expected["Token"]["tid"])
+            self.assertTrue(np.array_equal(part["Token"]["score"],
+                                           expected["Token"]["score"]))
+            start += size
+
+        # The lists in the parts are plain lists, which can be changed without
+        # changing the batch.
+        tids = parts[2]["Token"]["tid"]
+        self.assertIsInstance(tids, list)
+        tids.append([10])
+        self.assertEqual(tids + [[11]], [[1], [2], [3], [10], [11]])
+        self.assertEqual(batch["Token"]["tid"][4], [4])
+
+        # The numpy arrays in the parts are views of the batch.
+        self.assertTrue(np.shares_memory(parts[2]["Token"]["score"],
+                                         batch["Token"]["score"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
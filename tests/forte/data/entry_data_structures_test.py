@@ -5,7 +5,8 @@ from typing import Optional, List, Any, Iterator
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology import Generics, MultiPackGeneric, Annotation
-from forte.data.ontology.core import FList, FDict, MpPointer, Pointer
+from forte.data.ontology.core import (
+    FList, FDict, MpPointer, Pointer, is_trusted_mode, trusted_mode)
 from forte.data.readers.base_reader import PackReader, MultiPackReader
 from forte.pack_manager import PackManager
 from forte.pipeline import Pipeline
@@ -199,6 +200,32 @@ class EntryDataStructure(unittest.TestCase):
             self.assertTrue(isinstance(v, Pointer))
 
 
+class TrustedModeTest(unittest.TestCase):
+    def setUp(self):
+        self.pack: DataPack = DataPack(PackManager())
+        self.pack.set_control_component('test_component')
+
+    def test_trusted_mode(self):
+        entry = ExampleEntry(self.pack)
+        entry.secret_number = 1
+        with self.assertRaises(TypeError):
+            entry.secret_number = 'one'
+
+        with trusted_mode():
+            self.assertTrue(is_trusted_mode())
+            entry.secret_number = 'one'
+        self.assertFalse(is_trusted_mode())
+        self.assertEqual(entry.secret_number, 'one')
+
+        # The fields are recorded in both modes.
+        self.assertEqual(self.pack.field_records['test_component'],
+                         {(entry.tid, 'secret_number')})
+
+        with self.assertRaises(TypeError):
+            entry.secret_number = 'two'
+        self.pack.add_all_remaining_entries()
+
+
 class NotHashingTest(unittest.TestCase):
     def setUp(self):
         manager = PackManager()
@@ -7,6 +7,7 @@ import unittest
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack, MultiPackLink
 from forte.data.ontology import Annotation, MultiPackGroup
+from forte.data.data_utils import deserialize
 from forte.pack_manager import PackManager
 from ft.onto.base_ontology import Token
 
@@ -44,6 +45,66 @@ class DataPackTest(unittest.TestCase):
         ser_str: str = self.multi_pack.serialize()
         print(ser_str)
 
+    def test_binary_serialization(self):
+        for pack in self.multi_pack.packs:
+            _space_token(pack)
+
+        for lt, rt in zip(self.multi_pack.packs[0].get(Token),
+                          self.multi_pack.packs[1].get(Token)):
+            self.multi_pack.add_entry(MultiPackLink(self.multi_pack, lt, rt))
+
+        pm = PackManager()
+        packs = [deserialize(pm, p.serialize_binary())
+                 for p in self.multi_pack.packs]
+        for p in packs:
+            pm.reference_pack(p)
+        multi_pack: MultiPack = deserialize(
+            pm, self.multi_pack.serialize_binary())
+        multi_pack.realign_packs()
+
+        self.assertEqual(multi_pack.pack_names, self.multi_pack.pack_names)
+        self.assertEqual(
+            [(l.get_parent().text, l.get_child().text)
+             for l in multi_pack.get(MultiPackLink)],
+            [(l.get_parent().text, l.get_child().text)
+             for l in self.multi_pack.get(MultiPackLink)])
+
+    def test_view(self):
+        for pack in self.multi_pack.packs:
+            _space_token(pack)
+
+        for lt, rt in zip(self.multi_pack.packs[0].get(Token),
+                          self.multi_pack.packs[1].get(Token)):
+            self.multi_pack.add_entry(MultiPackLink(self.multi_pack, lt, rt))
+
+        view: MultiPack = self.multi_pack.view()
+        self.assertEqual(view.pack_names, self.multi_pack.pack_names)
+        self.assertEqual(
+            [p.text for p in view.packs],
+            [p.text for p in self.multi_pack.packs])
+
+        # The data packs are copied as well.
+        for pack, pack_view in zip(self.multi_pack.packs, view.packs):
+            self.assertIsNot(pack, pack_view)
+            self.assertNotEqual(pack.pack_id, pack_view.pack_id)
+        self.assertIs(view.get_pack("left pack"), view.packs[0])
+
+        links = [(l.get_parent().text, l.get_child().text)
+                 for l in self.multi_pack.get(MultiPackLink)]
+        self.assertEqual(
+            [(l.get_parent().text, l.get_child().text)
+             for l in view.get(MultiPackLink)], links)
+        for link in view.get(MultiPackLink):
+            self.assertIs(link.get_parent().pack, view.packs[0])
+
+        # Changing the view does not change the multi pack.
+        view.packs[0].add_entry(Token(view.packs[0], 0, 1))
+        view.delete_entry(view.links[0])
+        self.assertEqual(len(list(self.multi_pack.packs[0].get(Token))), 6)
+        self.assertEqual(
+            [(l.get_parent().text, l.get_child().text)
+             for l in self.multi_pack.get(MultiPackLink)], links)
+
     def test_add_pack(self):
         data_pack3 = self.multi_pack.add_pack(ref_name="new pack")
         data_pack3.pack_name = "the third pack"
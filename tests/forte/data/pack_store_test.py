@@ -0,0 +1,122 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the pack store.
+"""
+import os
+import tempfile
+import unittest
+
+from forte.common.exception import PackDataException
+from forte.data.data_pack import DataPack
+from forte.data.multi_pack import MultiPack
+from forte.data.pack_store import PackStore
+from forte.pack_manager import PackManager
+from ft.onto.base_ontology import Token
+
+
+class PackStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self._temp_dir.name, 'store')
+
+        pm = PackManager()
+        self.packs = []
+        for i in range(5):
+            pack = DataPack(pm, f'pack_{i % 3}')
+            pack.set_text(f'pack number {i}')
+            pack.add_entry(Token(pack, 0, 4))
+            self.packs.append(pack)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_random_access(self):
+        with PackStore(self.store_path, 'w') as store:
+            for i, pack in enumerate(self.packs):
+                method = 'binary' if i % 2 == 0 else 'jsonpickle'
+                self.assertEqual(store.append(pack, serialize_method=method),
+                                 i)
+            # The store can be read while writing.
+            self.assertEqual(
+                store.load(PackManager(), 2).text, self.packs[2].text)
+
+        store = PackStore(self.store_path)
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.pack_ids, [p.meta.pack_id for p in self.packs])
+        self.assertIn(self.packs[3].meta.pack_id, store)
+        self.assertNotIn(-100, store)
+        self.assertIsInstance(store.raw(0), bytes)
+        self.assertIsInstance(store.raw(1), str)
+
+        pack = store.load(PackManager(),
+                          store.position_of(self.packs[3].meta.pack_id))
+        self.assertEqual(pack.text, self.packs[3].text)
+        self.assertEqual(
+            [t.text for t in pack.get(Token)], ['pack'])
+
+        self.assertEqual(store.positions_of_name('pack_1'), [1, 4])
+        self.assertEqual(store.positions_of_name('pack_9'), [])
+
+        pm = PackManager()
+        texts = [store.load(pm, i).text for i in range(1, 3)]
+        self.assertEqual(texts, [p.text for p in self.packs[1:3]])
+        self.assertEqual(len(list(store.iter_raw(3))), 2)
+
+        with self.assertRaises(KeyError):
+            store.position_of(-100)
+        with self.assertRaises(PackDataException):
+            store.append(self.packs[0])
+        store.close()
+
+    def test_append_and_shard(self):
+        with PackStore(self.store_path, 'w', shard_size=1) as store:
+            for pack in self.packs[:3]:
+                store.append(pack)
+
+        with PackStore(self.store_path, 'a', shard_size=1) as store:
+            for pack in self.packs[3:]:
+                store.append(pack)
+
+        # Each pack is larger than the shard size, so it gets its own
+        # segment.
+        files = sorted(f for f in os.listdir(self.store_path)
+                       if f.startswith('data-'))
+        self.assertEqual(len(files), 5)
+
+        with PackStore(self.store_path) as store:
+            pm = PackManager()
+            self.assertEqual([store.load(pm, i).text for i in range(5)],
+                             [p.text for p in self.packs])
+
+        with PackStore(self.store_path, 'w') as store:
+            self.assertEqual(len(store), 0)
+
+    def test_multi_pack(self):
+        pm = PackManager()
+        multi_pack = MultiPack(pm, 'multi')
+        for pack in self.packs[:2]:
+            multi_pack.add_pack_(pack)
+
+        with PackStore(self.store_path, 'w') as store:
+            store.append(multi_pack)
+            recovered = store.load(PackManager(), 0)
+
+        self.assertIsInstance(recovered, MultiPack)
+        self.assertEqual(recovered.pack_names, multi_pack.pack_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
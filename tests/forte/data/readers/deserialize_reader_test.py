@@ -14,11 +14,45 @@
 """
 Unit tests for Deserialize Reader.
 """
+import os
+import tempfile
 import unittest
+from typing import Iterator, List, Optional
 
+from forte.data.caster import MultiPackBoxer
 from forte.data.data_pack import DataPack
-from forte.data.readers import StringReader, RawDataDeserializeReader
+from forte.data.multi_pack import MultiPack
+from forte.data.pack_store import PackStore
+from forte.data.readers import (
+    StringReader, RawDataDeserializeReader, PackStoreReader,
+    MultiPackDiskReader)
+from forte.data.readers.base_reader import MultiPackReader
 from forte.pipeline import Pipeline
+from forte.processors.base import PackStoreWriter, MultiPackWriter
+from ft.onto.base_ontology import Document
+
+
+class SharedPackReader(MultiPackReader):
+    """Create a multi pack for each text, which also has a data pack shared
+    by all the multi packs."""
+
+    def __init__(self):
+        super().__init__()
+        self.shared: Optional[DataPack] = None
+
+    def _collect(self, texts: List[str]  # type: ignore
+                 ) -> Iterator[str]:
+        yield from texts
+
+    def _parse_pack(self, text: str) -> Iterator[MultiPack]:
+        multi_pack = self.new_pack()
+        if self.shared is None:
+            self.shared = multi_pack.add_pack("shared")
+            self.shared.set_text("Shared")
+        else:
+            multi_pack.add_pack_(self.shared, "shared")
+        multi_pack.add_pack("own").set_text(text)
+        yield multi_pack
 
 
 class DeserializeReaderPipelineTest(unittest.TestCase):
@@ -41,6 +75,109 @@ class DeserializeReaderPipelineTest(unittest.TestCase):
                     [pack.serialize()]):
                 self.assertEqual(pack.text, new_pack.text)
 
+    def test_partial_deserialize(self):
+        data = ["Testing Reader", "Testing Deserializer"]
+        packs = [p.serialize_binary()
+                 for p in self.nlp.process_dataset(data)]
+
+        for config, num_documents in (
+                ({'entry_types': ['ft.onto.base_ontology.Sentence']}, 0),
+                ({'lazy_load': True}, 1)):
+            another_pipeline = Pipeline[DataPack]()
+            another_pipeline.set_reader(RawDataDeserializeReader(), config)
+            another_pipeline.initialize()
+            for pack, text in zip(
+                    another_pipeline.process_dataset(packs), data):
+                self.assertEqual(pack.text, text)
+                self.assertEqual(
+                    len(list(pack.get(Document))), num_documents)
+
+    def test_pack_store(self):
+        data = [f"Testing Pack Store {i}" for i in range(5)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store_path = os.path.join(temp_dir, 'store')
+
+            write_pipeline = Pipeline[DataPack]()
+            write_pipeline.set_reader(StringReader())
+            write_pipeline.add(PackStoreWriter(), {'output_dir': store_path})
+            write_pipeline.run(data)
+
+            read_pipeline = Pipeline[DataPack]()
+            read_pipeline.set_reader(PackStoreReader(), {'start': 1, 'end': 3})
+            read_pipeline.initialize()
+            self.assertEqual(
+                [p.text for p in read_pipeline.process_dataset(store_path)],
+                data[1:3])
+
+    def test_multi_pack_store(self):
+        data = ["Testing Multi Pack", "Testing Multi Pack Store"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pipeline = Pipeline()
+            write_pipeline.set_reader(StringReader())
+            write_pipeline.add(MultiPackBoxer())
+            write_pipeline.add(MultiPackWriter(), {
+                'output_dir': temp_dir,
+                'use_pack_store': True,
+                'serialize_method': 'binary',
+            })
+            write_pipeline.run(data)
+
+            read_pipeline = Pipeline[MultiPack]()
+            read_pipeline.set_reader(
+                MultiPackDiskReader(), {'data_path': temp_dir})
+            read_pipeline.initialize()
+            self.assertEqual(
+                [m.get_pack_at(0).text
+                 for m in read_pipeline.process_dataset()], data)
+
+    def test_multi_pack_store_shared_pack(self):
+        data = ["First", "Second", "Third"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pipeline = Pipeline[MultiPack]()
+            write_pipeline.set_reader(SharedPackReader())
+            write_pipeline.add(MultiPackWriter(), {
+                'output_dir': temp_dir,
+                'use_pack_store': True,
+                'serialize_method': 'binary',
+            })
+            write_pipeline.run(data)
+
+            with PackStore(os.path.join(
+                    temp_dir, MultiPackWriter.pack_base_out)) as store:
+                self.assertEqual(len(store), len(data) + 1)
+                self.assertEqual(len(set(store.pack_ids)), len(store))
+
+            read_pipeline = Pipeline[MultiPack]()
+            read_pipeline.set_reader(
+                MultiPackDiskReader(), {'data_path': temp_dir})
+            read_pipeline.initialize()
+            multi_packs = list(read_pipeline.process_dataset())
+            self.assertEqual(
+                [(m.get_pack("shared").text, m.get_pack("own").text)
+                 for m in multi_packs],
+                [("Shared", text) for text in data])
+
+    def test_cache_in_store(self):
+        data = ["Testing Reader", "Testing Cache"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_pipeline = Pipeline[DataPack]()
+            cache_pipeline.set_reader(StringReader(
+                cache_directory=temp_dir, cache_in_store=True))
+            cache_pipeline.initialize()
+            for _ in cache_pipeline.process_dataset(data):
+                pass
+            cache_pipeline.finish()
+            self.assertTrue(all(
+                PackStore.is_store(os.path.join(temp_dir, f))
+                for f in os.listdir(temp_dir)))
+
+            read_pipeline = Pipeline[DataPack]()
+            read_pipeline.set_reader(StringReader(
+                from_cache=True, cache_directory=temp_dir))
+            read_pipeline.initialize()
+            self.assertEqual(
+                [p.text for p in read_pipeline.process_dataset(data)], data)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the conditional random field.
+"""
+import unittest
+
+import torch
+from ddt import ddt, data
+
+from forte.models.ner.conditional_random_field import (
+    ConditionalRandomField, allowed_transitions, viterbi_decode)
+
+
+def _decode_one_by_one(crf, logits, mask):
+    # Decode each sequence with ``viterbi_decode``, with the start and end
+    # tags as the sentinels.
+    _, max_seq_length, num_tags = logits.size()
+    start_tag, end_tag = num_tags, num_tags + 1
+    transitions = crf._constrained_transitions()  # pylint: disable=W0212
+
+    best_paths = []
+    for prediction, prediction_mask in zip(logits, mask):
+        sequence_length = int(prediction_mask.sum())
+        tag_sequence = torch.full(
+            (max_seq_length + 2, num_tags + 2), -10000.0)
+        tag_sequence[0, start_tag] = 0.0
+        tag_sequence[1:sequence_length + 1, :num_tags] = \
+            prediction[:sequence_length]
+        tag_sequence[sequence_length + 1, end_tag] = 0.0
+        path, score = viterbi_decode(
+            tag_sequence[:sequence_length + 2], transitions)
+        best_paths.append((path[1:-1], score.item()))
+    return best_paths
+
+
+@ddt
+class ConditionalRandomFieldTest(unittest.TestCase):
+
+    @data(True, False)
+    def test_viterbi_tags(self, constrained):
+        torch.manual_seed(0)
+        labels = {0: "O", 1: "B-PER", 2: "I-PER", 3: "B-LOC", 4: "I-LOC"}
+        constraints = allowed_transitions("BIO", labels) \
+            if constrained else None
+
+        for include_start_end in (True, False):
+            crf = ConditionalRandomField(
+                len(labels), constraints, include_start_end)
+            logits = torch.randn(6, 7, len(labels))
+            lengths = [7, 1, 3, 0, 5, 7]
+            mask = torch.tensor(
+                [[1] * n + [0] * (7 - n) for n in lengths])
+
+            best_paths = crf.viterbi_tags(logits, mask)
+            self.assertEqual(best_paths,
+                             _decode_one_by_one(crf, logits, mask))
+            self.assertEqual([len(path) for path, _ in best_paths], lengths)
+
+    def test_transitions_cache(self):
+        crf = ConditionalRandomField(3)
+        transitions = crf._constrained_transitions()  # pylint: disable=W0212
+        self.assertIs(crf._constrained_transitions(),  # pylint: disable=W0212
+                      transitions)
+
+        # The cache is invalidated when the parameters are updated.
+        with torch.no_grad():
+            crf.transitions.add_(1.0)
+        updated = crf._constrained_transitions()  # pylint: disable=W0212
+        self.assertTrue(torch.allclose(
+            updated[:3, :3], transitions[:3, :3] + 1.0))
+
+        crf.load_state_dict({k: torch.zeros_like(v)
+                             for k, v in crf.state_dict().items()})
+        self.assertEqual(
+            crf._constrained_transitions()[:3, :3].abs().max().item(),
+            10000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
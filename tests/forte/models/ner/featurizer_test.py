@@ -0,0 +1,99 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the NER featurizer.
+"""
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from forte.models.ner.featurizer import NERFeaturizer, pad_ids
+from forte.models.ner.utils import normalize_digit_word
+from forte.processors.vocabulary_processor import Alphabet
+
+
+class NERFeaturizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sentences = [
+            ["EU", "rejects", "German", "call", "in", "1996", "."],
+            ["Peter", "Blackburn"],
+            ["BRUSSELS", "1996-08-22", "internationalization"],
+        ]
+        words = [normalize_digit_word(w) for s in self.sentences for w in s]
+        chars = [c for s in self.sentences for w in s for c in w]
+        self.word_alphabet = Alphabet("word", Counter(words[:-3]))
+        self.char_alphabet = Alphabet("character", Counter(chars))
+        self.featurizer = NERFeaturizer(
+            self.word_alphabet, self.char_alphabet, max_char_length=10,
+            num_char_pad=2, cache_size=4)
+
+    def test_encode(self):
+        for words in self.sentences:
+            word_ids, char_id_seqs = self.featurizer.encode(words)
+            self.assertEqual(
+                word_ids.tolist(),
+                [self.word_alphabet.get_index(normalize_digit_word(w))
+                 for w in words])
+            self.assertEqual(
+                [cids.tolist() for cids in char_id_seqs],
+                [[self.char_alphabet.get_index(c) for c in w[:10]]
+                 for w in words])
+
+        self.assertEqual(self.featurizer.word_id("Peter"),
+                         self.word_alphabet.get_index("Peter"))
+        self.assertEqual(self.featurizer.word_id("Unseen"),
+                         self.word_alphabet.unk_id)
+        self.assertEqual(self.featurizer.word_id.cache_info().currsize, 4)
+        self.assertFalse(self.featurizer.char_ids("EU").flags.writeable)
+
+        self.featurizer.clear_cache()
+        self.assertEqual(self.featurizer.word_id.cache_info().currsize, 0)
+
+    def test_get_batch_tensor(self):
+        data = [self.featurizer.encode(words) for words in self.sentences]
+        words, chars, masks, lengths = self.featurizer.get_batch_tensor(data)
+
+        self.assertEqual(lengths.tolist(), [7, 2, 3])
+        self.assertEqual(tuple(words.size()), (3, 7))
+        # The longest word is truncated to 10 chars, with no extra paddings.
+        self.assertEqual(tuple(chars.size()), (3, 7, 10))
+        self.assertEqual(masks.sum(dim=1).tolist(), [7.0, 2.0, 3.0])
+
+        for i, (word_ids, char_id_seqs) in enumerate(data):
+            n = len(word_ids)
+            self.assertEqual(words[i, :n].tolist(), word_ids.tolist())
+            self.assertTrue((words[i, n:] == self.word_alphabet.pad_id).all())
+            for j, cids in enumerate(char_id_seqs):
+                self.assertEqual(chars[i, j, :len(cids)].tolist(),
+                                 cids.tolist())
+                self.assertTrue(
+                    (chars[i, j, len(cids):] == self.char_alphabet.pad_id)
+                    .all())
+            self.assertTrue((chars[i, n:] == self.char_alphabet.pad_id).all())
+
+        _, chars, _, _ = self.featurizer.get_batch_tensor(data[:1])
+        self.assertEqual(chars.size(2), len("rejects") + 2)
+
+    def test_pad_ids(self):
+        ids, mask = pad_ids([[1, 2], [], [3]], 0)
+        self.assertEqual(ids.tolist(), [[1, 2], [0, 0], [3, 0]])
+        self.assertEqual(mask.tolist(),
+                         [[True, True], [False, False], [True, False]])
+        self.assertTrue(np.array_equal(pad_ids([], 0)[0].shape, [0, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,22 +15,30 @@
 Unit tests for Pipeline.
 """
 
+import json
 import os
+import tempfile
+import threading
 import unittest
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, Optional, Type
 
 from ddt import ddt, data, unpack
 
+from forte.common import ProcessorConfigError, ProcessExecutionException
 from forte.data.caster import MultiPackBoxer
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
-from forte.data.ontology.top import Generics
+from forte.data.ontology.core import Entry
+from forte.data.ontology.top import Annotation, Generics
 from forte.data.readers.base_reader import PackReader, MultiPackReader
 from forte.data.selector import FirstPackSelector, NameMatchSelector
 from forte.pipeline import Pipeline
-from forte.processors.base import PackProcessor, FixedSizeBatchProcessor
-from ft.onto.base_ontology import Token, Sentence
+from forte.processors.base import PackProcessor, FixedSizeBatchProcessor, \
+    ParallelPackProcessor
+from forte.processors.lowercaser_processor import LowerCaserProcessor
+from ft.onto.base_ontology import Dependency, Token, Sentence
+from ft.onto.race_multi_choice_qa_ontology import Option, Question
 from tests.dummy_batch_processor import DummyRelationExtractor
 
 data_samples_root = "data_samples"
@@ -124,6 +132,34 @@ class DummyPackProcessor(PackProcessor):
             entry.value += "[PACK]"
 
 
+class DummyTokenizer(PackProcessor):
+    """Create the tokens of the sentences, linked to the next tokens, and
+    a question with the first two tokens as the options."""
+
+    def _process(self, input_pack: DataPack):
+        for sentence in input_pack.get(Sentence):
+            tokens = []
+            begin = sentence.begin
+            for word in sentence.text.split(" "):
+                tokens.append(Token(input_pack, begin, begin + len(word)))
+                begin += len(word) + 1
+            for parent, child in zip(tokens, tokens[1:]):
+                Dependency(input_pack, parent, child).dep_label = "next"
+
+            question = Question(input_pack, sentence.begin, sentence.end)
+            for token in tokens[:2]:
+                question.options.append(
+                    Option(input_pack, token.begin, token.end))
+
+
+class DummyAnswerer(PackProcessor):
+    """Answer each question with its number of options."""
+
+    def _process(self, input_pack: DataPack):
+        for question in input_pack.get(Question):
+            question.answers = [len(question.options)]
+
+
 class DummmyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
 
     def __init__(self) -> None:
@@ -206,6 +242,221 @@ class PipelineTest(unittest.TestCase):
         # check that all packs are yielded
         self.assertEqual(num_packs, reader.count)
 
+    @data(True, False)
+    def test_multiprocessing(self, ordered):
+        """Tests pack processors running in worker processes."""
+
+        nlp = Pipeline[DataPack]()
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(DummyPackProcessor())
+        nlp.add(DummyPackProcessor())
+        nlp.set_multiprocessing(2, max_in_flight=3, ordered=ordered)
+        nlp.initialize()
+
+        data_path = data_samples_root + "/random_texts/0.txt"
+        with open(data_path, encoding="utf8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+        packs = list(nlp.process_dataset(data_path))
+        nlp.finish()
+
+        for pack in packs:
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[PACK][PACK]")
+
+        # The packs keep the ids assigned in the main process.
+        if ordered:
+            self.assertEqual([p.text for p in packs], texts)
+            self.assertEqual([p.pack_id for p in packs],
+                             list(range(packs[0].pack_id,
+                                        packs[0].pack_id + len(texts))))
+        else:
+            self.assertEqual(sorted(p.text for p in packs), sorted(texts))
+
+    @data(None, [2, 1], [3])
+    def test_threaded_stages(self, stage_sizes):
+        """Tests a chain of Batch->Pack->Batch in threaded stages."""
+
+        nlp = Pipeline[DataPack]()
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 3}})
+        nlp.add(DummyPackProcessor())
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 5}})
+        nlp.set_threaded_stages(stage_sizes, queue_size=1)
+        nlp.initialize()
+
+        data_path = data_samples_root + "/random_texts/0.txt"
+        with open(data_path, encoding="utf8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+        packs = list(nlp.process_dataset(data_path))
+        self.assertEqual([p.text for p in packs], texts)
+        for pack in packs:
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[BATCH][PACK][BATCH]")
+
+    @data(1, 3)
+    def test_parallel_pack_processor(self, max_in_flight):
+        """Tests a chain of Batch->Pack->Batch, where the pack processors run
+        in worker processes."""
+
+        nlp = Pipeline[DataPack]()
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 3}})
+        nlp.add(ParallelPackProcessor(DummyPackProcessor(), 2, max_in_flight))
+        nlp.add(ParallelPackProcessor(LowerCaserProcessor(), 2, max_in_flight))
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 5}})
+        nlp.initialize()
+
+        data_path = data_samples_root + "/random_texts/0.txt"
+        with open(data_path, encoding="utf8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+        packs = list(nlp.process_dataset(data_path))
+        nlp.finish()
+
+        self.assertEqual([p.text for p in packs], [t.lower() for t in texts])
+        for pack in packs:
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[BATCH][PACK][BATCH]")
+            self.assertIn((types[0].tid, 'value'), pack.field_records[
+                DummyPackProcessor().name])
+            self.assertEqual(pack.get_single(Sentence).text, pack.text)
+
+    def test_parallel_pack_processor_new_entries(self):
+        """Tests that the entries created in the worker processes are the
+        same as the ones created in the current process."""
+
+        def run(parallel):
+            nlp = Pipeline[DataPack]()
+            nlp.set_reader(SentenceReader())
+            for processor in (DummyTokenizer(), DummyAnswerer()):
+                nlp.add(ParallelPackProcessor(processor, 2)
+                        if parallel else processor)
+            # The entries created after are not assigned the ids used by the
+            # workers.
+            nlp.add(DummyPackProcessor())
+            nlp.initialize()
+            packs = list(nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt"))
+            nlp.finish()
+
+            results = []
+            for pack in packs:
+                tids = [entry.tid for entry in pack.get(Entry)]
+                self.assertEqual(len(tids), len(set(tids)))
+                results.append((
+                    [(a.tid, type(a).__name__, a.begin, a.end)
+                     for a in pack.get(Annotation)],
+                    [(d.tid, d.get_parent().tid, d.get_child().tid,
+                      d.dep_label) for d in pack.get(Dependency)],
+                    [([o.tid for o in q.options], q.answers)
+                     for q in pack.get(Question)],
+                    pack.get_single(NewType).tid,
+                ))
+            return results
+
+        expected = run(False)
+        self.assertTrue(all(result[1] for result in expected))
+        self.assertEqual(run(True), expected)
+
+    def test_threaded_stages_stop_early(self):
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceReader())
+        nlp.add(DummyPackProcessor())
+        nlp.add(DummyPackProcessor())
+        nlp.set_threaded_stages(queue_size=1)
+        nlp.initialize()
+
+        # The threads are stopped when the consumer stops early.
+        for pack in nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt"):
+            self.assertEqual(pack.get_single(NewType).value, "[PACK][PACK]")
+            break
+        self.assertFalse(any(t.name.startswith('forte-stage')
+                             for t in threading.enumerate()))
+
+    def test_threaded_stages_error(self):
+        class FailingProcessor(PackProcessor):
+            def _process(self, input_pack: DataPack):
+                raise ValueError("Failed.")
+
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceReader())
+        nlp.add(DummyPackProcessor())
+        nlp.add(FailingProcessor())
+        nlp.set_threaded_stages()
+        nlp.initialize()
+        with self.assertRaises(ProcessExecutionException):
+            list(nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt"))
+
+        nlp.set_threaded_stages([1])
+        with self.assertRaises(ProcessorConfigError):
+            nlp.initialize()
+
+    @data(False, True)
+    def test_stats(self, threaded):
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceReader())
+        batch_processor = DummmyFixedSizeBatchProcessor()
+        nlp.add(batch_processor, config={"batcher": {"batch_size": 3}})
+        nlp.add(DummyPackProcessor())
+        if threaded:
+            nlp.set_threaded_stages()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_path = os.path.join(tmp_dir, 'stats.json')
+            nlp.set_stats_report(0, dump_path)
+            nlp.initialize()
+
+            num_packs = len(list(nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt")))
+            with open(dump_path) as f:
+                dumped = json.load(f)
+
+        stats = nlp.stats()
+        self.assertEqual(dumped, stats)
+        self.assertEqual(stats['packs'], num_packs)
+        self.assertEqual(stats['reader']['packs'], num_packs)
+
+        batch_stats, pack_stats = stats['components']
+        self.assertEqual(batch_stats['name'], batch_processor.name)
+        for c_stats in (batch_stats, pack_stats):
+            self.assertEqual(c_stats['packs'], num_packs)
+            self.assertGreater(c_stats['wall_time'], 0)
+            self.assertGreaterEqual(c_stats['peak_queue_length'], 1)
+
+        # The batch processor adds an entry to each pack, and the jobs wait
+        # for the batches.
+        self.assertEqual(batch_stats['entries'], num_packs)
+        self.assertEqual(batch_stats['calls'], batch_processor.num_batches)
+        # Each pack has a sentence, which are predicted in batches of 3.
+        self.assertEqual(batch_stats['calls'], (num_packs + 2) // 3)
+        self.assertEqual(pack_stats['calls'], num_packs)
+        self.assertGreater(batch_stats['queued_time'], 0)
+        self.assertEqual(batch_stats['peak_queue_length'], 3)
+        self.assertEqual(pack_stats['entries'], 0)
+        self.assertEqual(pack_stats['queued_time'], 0)
+
+    def test_multiprocessing_validation(self):
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceReader())
+        nlp.add(DummmyFixedSizeBatchProcessor())
+        nlp.set_multiprocessing(2)
+        with self.assertRaises(ProcessorConfigError):
+            nlp.initialize()
+
     def test_pipeline2(self):
         """Tests a batch processor only."""
 
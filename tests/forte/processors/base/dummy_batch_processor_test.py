@@ -14,16 +14,21 @@
 """
 Unit tests for dummy processor.
 """
+import threading
 import unittest
-from ddt import ddt, data
+from typing import Dict, Iterator, List, Optional
+
+from ddt import ddt, data, unpack
 
 from forte.data.data_pack import DataPack
 from forte.data.readers import OntonotesReader, StringReader, PlainTextReader
+from forte.data.readers.base_reader import PackReader
 from forte.pipeline import Pipeline
 from forte.processors.nltk_processors import NLTKSentenceSegmenter
 from tests.dummy_batch_processor import \
-    DummyRelationExtractor, DummyFixedSizeBatchProcessor
-from ft.onto.base_ontology import RelationLink, Sentence
+    DummyRelationExtractor, DummyFixedSizeBatchProcessor, \
+    DummyTokenBudgetBatchProcessor
+from ft.onto.base_ontology import RelationLink, Sentence, Token
 
 
 class DummyProcessorTest(unittest.TestCase):
@@ -94,5 +99,134 @@ class DummyFixedSizeBatchProcessorTest(unittest.TestCase):
                              (sent_len % (2 * batch_size) > 0)))
 
 
+class SentenceLengthReader(PackReader):
+    r"""Create a pack for each list of sentence lengths, the sentences are
+    made of tokens named after the pack and the sentence."""
+
+    def _collect(self, packs: List[List[int]]) -> Iterator[List[int]]:
+        yield from packs
+
+    def _parse_pack(self, lengths: List[int]) -> Iterator[DataPack]:
+        pack = self.new_pack()
+        pack.pack_name = f"pack{self._pack_index}"
+        self._pack_index += 1
+
+        sentences = [" ".join([f"{pack.pack_name}s{i}"] * length) + " ."
+                     for i, length in enumerate(lengths)]
+        pack.set_text("\n".join(sentences))
+        begin = 0
+        for sentence in sentences:
+            Sentence(pack, begin, begin + len(sentence))
+            for word in sentence.split():
+                Token(pack, begin, begin + len(word))
+                begin += len(word) + 1
+        yield pack
+
+    def initialize(self, resources, configs):
+        super().initialize(resources, configs)
+        self._pack_index = 0
+
+
+class ListOperationBatchProcessor(DummyFixedSizeBatchProcessor):
+    """Change the results of each pack with list operations."""
+
+    def __init__(self):
+        super().__init__()
+        self.contexts: List[List[str]] = []
+
+    def pack(self, data_pack: DataPack, output_dict: Optional[Dict] = None):
+        if output_dict is None:
+            return
+
+        contexts = output_dict["context"]
+        contexts.append(data_pack.pack_name)
+        contexts.sort()
+        self.contexts.append(contexts + ["end"])
+
+
+class ListOperationBatchProcessorTest(unittest.TestCase):
+
+    def test_pack_with_list_operations(self):
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceLengthReader())
+        processor = ListOperationBatchProcessor()
+        nlp.add(processor, config={"batcher": {"batch_size": 3}})
+        nlp.initialize()
+        results = list(nlp.process_dataset([[1, 2], [3], [2, 1, 1]]))
+
+        # The first two packs are in the same batch, the results of each pack
+        # are its own lists.
+        self.assertEqual(processor.counter, 2)
+        self.assertEqual(
+            processor.contexts,
+            [sorted([s.text for s in pack.get(Sentence)] + [pack.pack_name])
+             + ["end"] for pack in results])
+
+
+@ddt
+class TokenBudgetBatchProcessorTest(unittest.TestCase):
+    @data((1, True, False, False), (1, False, False, False),
+          (3, True, False, False), (10, True, False, False),
+          (1, True, True, False), (3, False, True, False),
+          (1, True, False, True), (3, False, False, True),
+          (1, False, True, True))
+    @unpack
+    def test_token_budget(self, lookahead, padded, threaded, async_predict):
+        packs = [[3, 20, 1, 7], [], [2, 2], [15], [4, 1, 9, 9, 3], [], [6]]
+        budget = 24
+
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(SentenceLengthReader())
+        processor = DummyTokenBudgetBatchProcessor()
+        nlp.add(processor, config={"batcher": {
+            "budget": budget, "padded": padded, "lookahead": lookahead},
+            "async_predict": async_predict})
+        if threaded:
+            nlp.set_threaded_stages()
+        nlp.initialize()
+
+        results = []
+        for pack in nlp.process_dataset(packs):
+            # A pack is returned after all its sentences are processed.
+            packed = {context for _, _, context in processor.packed}
+            for sentence in pack.get(Sentence):
+                self.assertIn(sentence.text, packed)
+            results.append(pack)
+        self.assertEqual([p.pack_name for p in results],
+                         [f"pack{i}" for i in range(len(packs))])
+
+        # Each sentence is packed back to its own pack exactly once.
+        for pack_name, text, context in processor.packed:
+            self.assertEqual(text, context)
+            self.assertTrue(context.startswith(pack_name + "s"))
+        self.assertEqual(
+            sorted(context for _, _, context in processor.packed),
+            sorted(s.text for p in results for s in p.get(Sentence)))
+
+        if async_predict:
+            self.assertNotIn(threading.get_ident(), processor.predict_threads)
+
+        for sizes in processor.batch_sizes:
+            cost = max(sizes) * len(sizes) if padded else sum(sizes)
+            self.assertTrue(cost <= budget or len(sizes) == 1)
+
+        # The sentences of each pack in a batch are in their original order,
+        # even if they are sorted by their sizes for batching.
+        for contexts in processor.batch_contexts:
+            sources = [tuple(int(n) for n in context.split()[0][
+                len("pack"):].split("s")) for context in contexts]
+            self.assertEqual(sources, sorted(sources))
+
+        if lookahead > 1:
+            # The instances in the first window of packs are batched by their
+            # sizes, and grouped by the packs in each batch.
+            first_window = sorted(
+                n + 1 for lengths in packs[:lookahead] for n in lengths)
+            self.assertEqual(
+                [n for sizes in processor.batch_sizes for n in sorted(sizes)][
+                    :len(first_window)],
+                first_window)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,125 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the BERT reranking processor.
+"""
+import unittest
+from typing import Any, Iterator, List, Tuple
+from unittest import mock
+
+import torch
+from ddt import ddt, data
+
+from forte.data.multi_pack import MultiPack
+from forte.data.ontology import Query
+from forte.data.readers.base_reader import MultiPackReader
+from forte.pipeline import Pipeline
+from forte.processors.ir import BertRerankingProcessor
+
+MODULE = "forte.processors.ir.bert_reranking_processor"
+
+
+class _Tokenizer:
+    """Encode each character as a token."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    @staticmethod
+    def encode_text(text_a: str, text_b: str, max_seq_length: int):
+        input_ids = [1] + [ord(c) for c in text_a] + [2] + \
+                    [ord(c) for c in text_b] + [2]
+        input_ids = input_ids[:max_seq_length]
+        segment_ids = [0] * (len(text_a) + 2) + [1] * (len(text_b) + 1)
+        input_mask = [1] * len(input_ids)
+        padding = [0] * (max_seq_length - len(input_ids))
+        return (input_ids + padding, segment_ids[:max_seq_length] + padding,
+                input_mask + padding)
+
+
+class _Classifier(torch.nn.Module):
+    """Score each pair by its number of "b" in the document."""
+
+    calls: List[Tuple[int, int]] = []
+
+    def __init__(self, **kwargs):
+        super().__init__()
+
+    def forward(self, input_ids, sequence_length, segment_ids):
+        _Classifier.calls.append(tuple(input_ids.size()))
+        assert (input_ids.size(1) == sequence_length.max()).item()
+        num_b = ((input_ids == ord("b")) & (segment_ids == 1)).sum(dim=1)
+        logits = torch.stack(
+            [torch.zeros_like(num_b), num_b], dim=1).float()
+        return logits, None
+
+
+class _QueryReader(MultiPackReader):
+    def _collect(self, queries) -> Iterator[Any]:  # type: ignore
+        return iter(queries)
+
+    def _parse_pack(self, query) -> Iterator[MultiPack]:  # type: ignore
+        query_text, documents = query
+        multi_pack = self.new_pack()
+        query_pack = multi_pack.add_pack("query")
+        query_pack.set_text(query_text)
+        Query(query_pack)
+        for i, document in enumerate(documents):
+            multi_pack.add_pack(f"doc_{i}").set_text(document)
+        yield multi_pack
+
+
+@ddt
+class BertRerankingProcessorTest(unittest.TestCase):
+
+    @data(False, True)
+    def test_rerank(self, async_predict):
+        queries = [
+            ("q", ["ab", "bbb", "a"]),
+            ("qq", []),
+            ("q", ["b" * 10, "aab", "", "bb"]),
+        ]
+
+        _Classifier.calls = []
+        with mock.patch(f"{MODULE}.BERTClassifier", _Classifier), \
+                mock.patch(f"{MODULE}.BERTTokenizer", _Tokenizer):
+            nlp = Pipeline[MultiPack]()
+            nlp.set_reader(_QueryReader())
+            nlp.add(BertRerankingProcessor(), config={
+                "max_seq_length": 16, "max_batch_tokens": 24,
+                "batcher": {"batch_size": 5}, "async_predict": async_predict,
+            })
+            nlp.initialize()
+            packs = list(nlp.process_dataset(queries))
+
+        self.assertEqual(len(packs), 3)
+        for multi_pack, (_, documents) in zip(packs, queries):
+            query = list(multi_pack.get_pack("query").get(Query))[0]
+            self.assertEqual(set(query.results), {
+                f"doc_{i}" for i in range(len(documents))})
+            for i, document in enumerate(documents):
+                score = torch.sigmoid(
+                    torch.tensor(float(document.count("b")))).item()
+                self.assertAlmostEqual(query.results[f"doc_{i}"], score,
+                                       places=5)
+
+        # The 7 pairs are batched across the queries, and each batch is run
+        # in micro-batches within the token limit, padded to their longest
+        # pair.
+        self.assertEqual(sorted(_Classifier.calls),
+                         [(1, 7), (1, 14), (2, 6), (3, 7)])
+
+
+if __name__ == '__main__':
+    unittest.main()
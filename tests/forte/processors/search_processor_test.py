@@ -0,0 +1,130 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the batched query creation and search.
+"""
+import unittest
+from typing import Any, Iterator, List
+from unittest import mock
+
+import numpy as np
+import torch
+from ddt import ddt, data, unpack
+
+from forte.data.multi_pack import MultiPack
+from forte.data.ontology import Query
+from forte.data.readers.base_reader import MultiPackReader
+from forte.pipeline import Pipeline
+from forte.processors.ir import BertBasedQueryCreator, SearchProcessor
+
+CREATOR_MODULE = "forte.processors.ir.bert_based_query_creator"
+SEARCH_MODULE = "forte.processors.ir.search_processor"
+
+
+class _Tokenizer:
+    """Encode each character as a token."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    @staticmethod
+    def encode_text(text_a: str, max_seq_length: int):
+        input_ids = ([1] + [ord(c) for c in text_a] + [2])[:max_seq_length]
+        padding = [0] * (max_seq_length - len(input_ids))
+        return (input_ids + padding, [0] * max_seq_length,
+                [1] * len(input_ids) + padding)
+
+
+class _Encoder(torch.nn.Module):
+    """Embed each text into [length, number of "a"]."""
+
+    batch_sizes: List[int] = []
+
+    def __init__(self, **kwargs):
+        super().__init__()
+
+    def forward(self, inputs, sequence_length, segment_ids):
+        _Encoder.batch_sizes.append(inputs.size(0))
+        num_a = (inputs == ord("a")).sum(dim=1)
+        cls = torch.stack([sequence_length, num_a], dim=1).float()
+        return cls.unsqueeze(1).expand(-1, inputs.size(1), -1), None
+
+
+class _Index:
+    """Return the documents of the queries, which are the query vectors."""
+
+    batch_sizes: List[int] = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def load(self, path):
+        pass
+
+    @staticmethod
+    def search(query: np.ndarray, k: int):
+        _Index.batch_sizes.append(len(query))
+        return [[(i, f"{vector[0]:.0f}-{vector[1]:.0f}-{i}")
+                 for i in range(k)] for vector in query]
+
+
+class _QueryReader(MultiPackReader):
+    def _collect(self, queries) -> Iterator[Any]:  # type: ignore
+        return iter(queries)
+
+    def _parse_pack(self, query: str) -> Iterator[MultiPack]:  # type: ignore
+        multi_pack = self.new_pack()
+        multi_pack.add_pack("query").set_text(query)
+        yield multi_pack
+
+
+@ddt
+class SearchProcessorTest(unittest.TestCase):
+
+    @data((3, None, [3, 2]), (1, None, [1] * 5), (10, 0, [1] * 5),
+          (10, 3600, [5]))
+    @unpack
+    def test_batched_search(self, batch_size, max_wait, batch_sizes):
+        queries = ["a", "bb", "aab", "b", "aaaa"]
+        batcher = {"batch_size": batch_size, "max_wait": max_wait}
+
+        _Encoder.batch_sizes = []
+        _Index.batch_sizes = []
+        with mock.patch(f"{CREATOR_MODULE}.BERTEncoder", _Encoder), \
+                mock.patch(f"{CREATOR_MODULE}.BERTTokenizer", _Tokenizer), \
+                mock.patch(f"{SEARCH_MODULE}.EmbeddingBasedIndexer", _Index):
+            nlp = Pipeline[MultiPack]()
+            nlp.set_reader(_QueryReader())
+            nlp.add(BertBasedQueryCreator(), config={
+                "model": {"name": "bert"}, "batcher": batcher})
+            nlp.add(SearchProcessor(), config={
+                "k": 2, "query_pack_name": "query", "batcher": batcher})
+            nlp.initialize()
+            packs = list(nlp.process_dataset(queries))
+
+        self.assertEqual(_Encoder.batch_sizes, batch_sizes)
+        self.assertEqual(_Index.batch_sizes, batch_sizes)
+
+        self.assertEqual(len(packs), len(queries))
+        for multi_pack, query_text in zip(packs, queries):
+            query = list(multi_pack.get_pack("query").get(Query))[0]
+            vector = [len(query_text) + 2, query_text.count("a")]
+            self.assertEqual(query.value.tolist(), [vector])
+            for i in range(2):
+                self.assertEqual(multi_pack.get_pack(f"doc_{i}").text,
+                                 f"{vector[0]}-{vector[1]}-{i}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,7 @@ Unit tests for spaCy processors.
 import unittest
 from typing import List
 
-from ddt import ddt, data
+from ddt import ddt, data, unpack
 import spacy
 from spacy.language import Language
 
@@ -25,8 +25,9 @@ from forte.common import ProcessExecutionException
 from forte.data.data_pack import DataPack
 from forte.data.readers import StringReader
 from forte.pipeline import Pipeline
-from forte.processors.spacy_processors import SpacyProcessor
-from ft.onto.base_ontology import Token, EntityMention
+from forte.processors.spacy_processors import SpacyProcessor, \
+    SpacyBatchProcessor
+from ft.onto.base_ontology import Token, EntityMention, Sentence
 
 
 @ddt
@@ -143,6 +144,43 @@ class TestSpacyProcessor(unittest.TestCase):
             self.assertEqual(entities_text, exp_ent_text)
             self.assertEqual(entities_type, exp_ent_types)
 
+    @data(
+        ("tokenize", 1),
+        ("tokenize, pos, lemma", 2),
+        ("ner, tokenize, lemma, pos", 2),
+        ("ner", 5),
+    )
+    @unpack
+    def test_spacy_batch_processor(self, value, batch_size):
+        documents = ["This tool is called Forte. The goal of this project to "
+                     "help you build NLP pipelines.",
+                     "NLP has never been made this easy before.",
+                     "Forte is developed in Pittsburgh.",
+                     "Apple is looking at buying U.K. startup for $1 "
+                     "billion."]
+
+        results = []
+        for processor, config in (
+                (SpacyProcessor(), {}),
+                (SpacyBatchProcessor(), {"batcher": {
+                    "batch_size": batch_size}})):
+            config.update({"processors": value, "lang": "en_core_web_sm"})
+            nlp = Pipeline[DataPack]()
+            nlp.set_reader(StringReader())
+            nlp.add(processor, config=config)
+            nlp.initialize()
+
+            results.append([[
+                [(s.span.begin, s.span.end) for s in pack.get(Sentence)],
+                [(t.span.begin, t.span.end, t.pos, t.lemma)
+                 for t in pack.get(Token)],
+                [(e.span.begin, e.span.end, e.ner_type)
+                 for e in pack.get(EntityMention)],
+            ] for pack in nlp.process_dataset(documents)])
+
+        self.assertEqual(len(results[1]), len(documents))
+        self.assertEqual(results[0], results[1])
+
     def test_neg_spacy_processor(self):
         spacy = Pipeline[DataPack]()
         spacy.set_reader(StringReader())
@@ -0,0 +1,147 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the instance store of the trainers.
+"""
+import tempfile
+import unittest
+from typing import Dict, Iterator
+
+import numpy as np
+
+from forte.common.configuration import Config
+from forte.common.resources import Resources
+from forte.data.readers import StringReader
+from forte.train_pipeline import TrainPipeline
+from forte.trainer.base import BaseTrainer, InstanceStore, fingerprint
+from ft.onto.base_ontology import Document
+
+
+def _instances():
+    return [
+        (np.array([1, 2, 3]), [np.array([4]), np.array([5, 6]), np.array([])]),
+        (np.array([], dtype=np.int64), []),
+        (np.array([7]), [np.array([8, 9, 10])]),
+    ]
+
+
+class _CharTrainer(BaseTrainer):
+    """Encode the chars of each document, and train for three epochs."""
+
+    def __init__(self):
+        super().__init__()
+        self.vocab: Dict[str, int] = {}
+        self.instances = []
+        self.store = None
+        self.num_consumed = 0
+        self.epoch_instances = []
+
+    def initialize(self, resources: Resources, configs: Config):
+        pass
+
+    def data_request(self) -> Dict:
+        return {"context_type": Document, "request": {}}
+
+    def consume(self, instance):
+        self.num_consumed += 1
+        text = instance["context"]
+        self.instances.append((
+            np.array([self.vocab.setdefault(c, len(self.vocab))
+                      for c in text]),
+            [np.array([len(word)]) for word in text.split()]))
+
+    def restore_instances(self, data_key: str) -> bool:
+        key = fingerprint(data_key, self.vocab)
+        if self.store is None or self.store.key != key:
+            return False
+        self.instances = list(self.store)
+        return True
+
+    def store_instances(self, data_key: str):
+        self.store = InstanceStore(
+            fingerprint(data_key, self.vocab), self.instances)
+
+    def epoch_finish_action(self, epoch_num: int):
+        self.epoch_instances.append(
+            [(chars.tolist(), [w.tolist() for w in words])
+             for chars, words in self.instances])
+        self.instances = []
+        if epoch_num == 3:
+            self.request_stop_train()
+
+    def post_validation_action(self, dev_res):
+        pass
+
+    def get_loss(self, instances: Iterator[Dict]):
+        pass
+
+
+class InstanceStoreTest(unittest.TestCase):
+
+    def assertInstancesEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for (a_ids, a_seqs), (e_ids, e_seqs) in zip(actual, expected):
+            self.assertEqual(a_ids.tolist(), e_ids.tolist())
+            self.assertEqual([a.tolist() for a in a_seqs],
+                             [e.tolist() for e in e_seqs])
+
+    def test_store(self):
+        store = InstanceStore("key", _instances())
+        self.assertInstancesEqual(list(store), _instances())
+        self.assertEqual(store[2][0].tolist(), [7])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertIsNone(InstanceStore.load(cache_dir, "key"))
+            store.save(cache_dir)
+            self.assertIsNone(InstanceStore.load(cache_dir, "other"))
+
+            for mmap in (True, False):
+                loaded = InstanceStore.load(cache_dir, "key", mmap=mmap)
+                self.assertEqual(loaded.key, "key")
+                self.assertInstancesEqual(list(loaded), _instances())
+
+            # Save over a memory-mapped store.
+            InstanceStore("other", _instances()[1:]).save(cache_dir)
+            self.assertInstancesEqual(list(loaded), _instances())
+            self.assertEqual(
+                len(InstanceStore.load(cache_dir, "other")), 2)
+
+        self.assertEqual(len(InstanceStore("empty", [])), 0)
+
+    def test_train_pipeline(self):
+        configs = Config({"reader": {}, "config_data": {
+            "train_path": ["ab cd", "ca b"]}}, default_hparams=None)
+        trainer = _CharTrainer()
+        pipeline = TrainPipeline(
+            train_reader=StringReader(), trainer=trainer,
+            dev_reader=StringReader(), configs=configs)
+
+        # The documents are only read in the first epoch.
+        pipeline.prepare()
+        pipeline.train()
+        self.assertEqual(trainer.num_consumed, 2)
+        expected = [([0, 1, 2, 3, 4], [[2], [2]]), ([3, 0, 2, 1], [[2], [1]])]
+        self.assertEqual(trainer.epoch_instances, [expected] * 3)
+
+        # The instances are encoded again when the vocabulary changes. The
+        # stop request is kept, so this run stops after one epoch.
+        trainer.vocab["x"] = len(trainer.vocab)
+        trainer.epoch_instances.clear()
+        pipeline.train()
+        self.assertEqual(trainer.num_consumed, 4)
+        self.assertEqual(trainer.epoch_instances, [expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
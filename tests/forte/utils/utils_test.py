@@ -15,6 +15,7 @@
 Unit test for utilities.
 """
 import unittest
+from typing import Dict, List, Optional, Union
 
 from forte.utils import utils
 
@@ -66,6 +67,19 @@ class UtilsTest(unittest.TestCase):
             p.name,
             'forte.processors.lowercaser_processor.LowerCaserProcessor')
 
+    def test_get_check_types(self):
+        self.assertEqual(utils.get_check_types(int), (int,))
+        self.assertEqual(utils.get_check_types(Optional[str]),
+                         (str, type(None)))
+        self.assertEqual(utils.get_check_types(Union[List[int], Dict]),
+                         (list, dict))
+
+        for value in (1, 'a', None, [1], {}):
+            for tp in (Optional[int], Union[List[int], Dict, str]):
+                self.assertEqual(
+                    utils.check_type(value, tp),
+                    isinstance(value, utils.get_check_types(tp)))
+
 
 if __name__ == '__main__':
     unittest.main()
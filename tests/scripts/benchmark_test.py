@@ -0,0 +1,58 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the benchmark script.
+"""
+import copy
+import unittest
+
+from scripts.benchmark.benchmarks import (
+    BENCHMARKS, compare_reports, make_pack, run_benchmarks)
+from ft.onto.base_ontology import Token, Sentence
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_make_pack(self):
+        pack = make_pack(3)
+        self.assertEqual(len(list(pack.get(Sentence))), 3)
+        for sentence in pack.get(Sentence):
+            self.assertEqual(len(list(pack.get(Token, sentence))), 20)
+
+    def test_run_and_compare(self):
+        report = run_benchmarks(size=2, repeat=1)
+        self.assertEqual(set(report['results']), set(BENCHMARKS))
+        self.assertIn('forte_version', report['meta'])
+
+        results = report['results']
+        for name in ('add_entries', 'get_data', 'serialize_binary',
+                     'pipeline'):
+            self.assertNotIn('error', results[name])
+            self.assertGreater(results[name]['min'], 0)
+
+        baseline = copy.deepcopy(report)
+        baseline['results']['get_data']['min'] /= 2
+        baseline['results']['view']['min'] *= 2
+        del baseline['results']['pipeline']
+
+        status = {item['name']: item['status']
+                  for item in compare_reports(report, baseline, 0.2)}
+        self.assertEqual(status['get_data'], 'regression')
+        self.assertEqual(status['view'], 'improvement')
+        self.assertEqual(status['serialize_binary'], 'same')
+        self.assertEqual(status['pipeline'], 'new')
+
+
+if __name__ == '__main__':
+    unittest.main()